@@ -0,0 +1,194 @@
+"""
+Row hydration throughput of GUID columns, 32 hex characters versus 16 bytes.
+
+Seeds a throwaway SQLite database with DatasetSeeder, copies it and turns
+the copy's GUIDs back into the CHAR(32) hex text they were stored as before
+migration f6b0e2d4a913. It then reads every GUID column of the largest tables
+from both: through the previous GUID implementation (kept below for the
+comparison) on the hex copy, and through the current one on the original.
+It also reports the size of tables and indexes in both files and the cost
+of binding a UUID and a string.
+
+    python -m benchmarks.guid_hydration [--users 2000] [--repeat 5]
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import timeit
+import uuid
+
+DATABASE_DIR = tempfile.mkdtemp(prefix="resume-builder-guid-")
+BINARY_DATABASE = os.path.join(DATABASE_DIR, "binary.db")
+HEX_DATABASE = os.path.join(DATABASE_DIR, "hex.db")
+os.environ["FLASK_ENV"] = "production"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{BINARY_DATABASE}"
+
+import sqlalchemy as sa  # noqa: E402
+from sqlalchemy import CHAR, TypeDecorator  # noqa: E402
+from sqlalchemy.dialects.postgresql import UUID  # noqa: E402
+
+from resume_builder import create_app, db  # noqa: E402
+from resume_builder.models import GUID  # noqa: E402
+from resume_builder.seeding import DatasetSeeder, SeedOptions  # noqa: E402
+
+TABLES = (
+    "job_application",
+    "built_resume_experience",
+    "experience",
+    "built_resume",
+)
+
+
+class HexGUID(TypeDecorator):
+    """GUID as implemented before binary storage."""
+
+    impl = CHAR
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(UUID())
+        else:
+            return dialect.type_descriptor(CHAR(32))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        elif dialect.name == "postgresql":
+            return str(value)
+        else:
+            if not isinstance(value, uuid.UUID):
+                return "%.32x" % uuid.UUID(value).int
+            else:
+                return "%.32x" % value.int
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        else:
+            if not isinstance(value, uuid.UUID):
+                value = uuid.UUID(value)
+            return value
+
+
+def guid_columns():
+    return {
+        table.name: [column.name for column in table.c if isinstance(column.type, GUID)]
+        for table in db.metadata.sorted_tables
+    }
+
+
+def make_hex_copy(columns):
+    shutil.copy(BINARY_DATABASE, HEX_DATABASE)
+    connection = sqlite3.connect(HEX_DATABASE)
+    connection.execute("PRAGMA foreign_keys=OFF")
+    for table_name, names in columns.items():
+        for name in names:
+            connection.execute(
+                f'UPDATE "{table_name}" SET "{name}" = lower(hex("{name}"))'
+            )
+    connection.commit()
+    connection.execute("VACUUM")
+    connection.close()
+
+
+def sizes(path) -> dict:
+    """Bytes used by each table together with its indexes."""
+    connection = sqlite3.connect(path)
+    owners = dict(
+        connection.execute(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )
+    )
+    totals = {}
+    for name, size in connection.execute(
+        "SELECT name, sum(pgsize) FROM dbstat GROUP BY name"
+    ):
+        table_name = owners.get(name, name)
+        totals[table_name] = totals.get(table_name, 0) + size
+    connection.close()
+    return totals
+
+
+def rows_per_second(engine, table_name, names, type_, repeat):
+    table = sa.table(table_name, *(sa.column(name, type_) for name in names))
+    statement = sa.select(*table.c)
+    best = float("inf")
+    with engine.connect() as connection:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rows = connection.execute(statement).all()
+            best = min(best, time.perf_counter() - start)
+    return len(rows), len(rows) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of")
+    args = parser.parse_args()
+
+    app = create_app()
+    try:
+        with app.app_context():
+            db.create_all()
+            DatasetSeeder(db.session, SeedOptions(users=args.users)).run()
+            columns = guid_columns()
+            db.engine.dispose()
+        make_hex_copy(columns)
+        sqlite3.connect(BINARY_DATABASE).execute("VACUUM")
+
+        binary_engine = sa.create_engine(f"sqlite:///{BINARY_DATABASE}")
+        hex_engine = sa.create_engine(f"sqlite:///{HEX_DATABASE}")
+        print(f"{args.users} seeded users, best of {args.repeat} reads")
+        print(
+            f"{'table':>24} {'rows':>8} {'GUIDs':>6} {'hex rows/s':>12} "
+            f"{'binary rows/s':>14} {'speedup':>8}"
+        )
+        for table_name in TABLES:
+            names = columns[table_name]
+            count, before = rows_per_second(
+                hex_engine, table_name, names, HexGUID(), args.repeat
+            )
+            _, after = rows_per_second(
+                binary_engine, table_name, names, GUID(), args.repeat
+            )
+            print(
+                f"{table_name:>24} {count:>8} {len(names):>6} {before:>12,.0f} "
+                f"{after:>14,.0f} {after / before:>7.2f}x"
+            )
+
+        hex_sizes, binary_sizes = sizes(HEX_DATABASE), sizes(BINARY_DATABASE)
+        print(f"\n{'table + indexes':>24} {'hex KiB':>10} {'binary KiB':>11}")
+        for table_name in (*TABLES, "user"):
+            print(
+                f"{table_name:>24} {hex_sizes[table_name] / 1024:>10,.0f} "
+                f"{binary_sizes[table_name] / 1024:>11,.0f}"
+            )
+        print(
+            f"{'database':>24} {os.path.getsize(HEX_DATABASE) / 1024:>10,.0f} "
+            f"{os.path.getsize(BINARY_DATABASE) / 1024:>11,.0f}"
+        )
+
+        dialect = binary_engine.dialect
+        value = uuid.uuid4()
+        print(f"\n{'bind':>24} {'hex us':>10} {'binary us':>11}")
+        for label, bound in (("UUID", value), ("str", str(value))):
+            hex_bind = HexGUID().bind_processor(dialect)
+            binary_bind = GUID().bind_processor(dialect)
+            timings = [
+                min(timeit.repeat(lambda: bind(bound), number=100000, repeat=3)) * 10
+                for bind in (hex_bind, binary_bind)
+            ]
+            print(f"{label:>24} {timings[0]:>10.3f} {timings[1]:>11.3f}")
+    finally:
+        shutil.rmtree(DATABASE_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
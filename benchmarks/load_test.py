@@ -0,0 +1,440 @@
+"""
+Load test against the app under gunicorn.
+
+Seeds a database with `flask seed` (a seed that is already loaded is kept),
+starts `wsgi:app` under gunicorn with gunicorn.conf.py, logs in one client
+per seeded user and replays a weighted mix of list, preview, edit and PDF
+download requests at each target rate in turn. The clients are asyncio
+coroutines speaking HTTP/1.1 over keep-alive connections, so one process
+can drive many more connections than threads would allow.
+
+Requests are scheduled open-loop: each is due at a fixed point in time and
+its latency counts from then, so time spent waiting for a free client
+counts against the server instead of quietly lowering the rate. For every
+rate it prints throughput, latency percentiles and errors per endpoint,
+and at the end the rate at which each endpoint saturated: p95 above
+--slo-ms or more than --max-error-rate of its requests failing.
+
+Without --database-url it uses a throwaway SQLite file; pass a
+postgresql:// URL to test against a local PostgreSQL instead.
+
+    python -m benchmarks.load_test [--database-url sqlite:////tmp/load.db] \
+        [--workers 2] [--worker-class sync] [--threads 1] [--users 50] \
+        [--rps 5,10,20,40] [--duration 20] \
+        [--mix list=50,preview=25,edit=15,download=10]
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+
+os.environ.setdefault("SECRET_KEY", "load-test")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+
+from resume_builder.instrumentation import percentile  # noqa: E402
+from resume_builder.models import BuiltResume, Summary, User  # noqa: E402
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSRF_TOKEN = re.compile(rb'name="csrf_token"[^>]*value="([^"]+)"')
+LIST_VIEWS = (
+    "basic_info_list",
+    "summary_list",
+    "experience_list",
+    "education_list",
+    "skills_list",
+    "languages_list",
+    "list_resume",
+)
+EXPECTED_STATUS = {"list": 200, "preview": 200, "edit": 302, "download": 200}
+
+
+class HttpClient:
+    """A logged-in user on one keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host, port, target):
+        self.host = host
+        self.port = port
+        self.target = target
+        self.cookies = {}
+        self.csrf_token = None
+        self.reader = self.writer = None
+
+    async def request(self, method, path, form=None):
+        """Returns the status and body, reconnecting once if the server had
+        closed the idle connection."""
+        reused = self.writer is not None
+        try:
+            return await self._request(method, path, form)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.close()
+            if not reused:
+                raise
+            return await self._request(method, path, form)
+
+    async def _request(self, method, path, form):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        body = b""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        if self.cookies:
+            cookies = self.cookies.items()
+            lines.append(
+                "Cookie: " + "; ".join(f"{name}={value}" for name, value in cookies)
+            )
+        if form is not None:
+            body = urllib.parse.urlencode(form).encode()
+            lines.append("Content-Type: application/x-www-form-urlencoded")
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write("\r\n".join(lines).encode() + b"\r\n\r\n" + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by the server")
+        status = int(status_line.split()[1])
+        headers = defaultdict(list)
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()].append(value.strip())
+
+        if "chunked" in headers.get("transfer-encoding", ()):
+            chunks = []
+            while size := int((await self.reader.readline()).split(b";")[0], 16):
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            await self.reader.readline()
+            response_body = b"".join(chunks)
+        elif "content-length" in headers:
+            response_body = await self.reader.readexactly(
+                int(headers["content-length"][0])
+            )
+        else:
+            response_body = await self.reader.read()
+            headers["connection"].append("close")
+
+        for cookie in headers.get("set-cookie", ()):
+            name, _, value = cookie.partition(";")[0].partition("=")
+            self.cookies[name.strip()] = value.strip()
+        if "close" in (value.lower() for value in headers.get("connection", ())):
+            self.close()
+        return status, response_body
+
+    async def log_in(self, password):
+        _, page = await self.request("GET", "/auth/login")
+        form = {"username": self.target["username"], "password": password}
+        form["csrf_token"] = CSRF_TOKEN.search(page).group(1).decode()
+        status, _ = await self.request("POST", "/auth/login", form)
+        if status != 302:
+            raise RuntimeError(f"Logging in {self.target['username']} got {status}")
+        # The session's CSRF token stays valid for the edits that follow.
+        _, page = await self.request("GET", self.edit_path)
+        self.csrf_token = CSRF_TOKEN.search(page).group(1).decode()
+
+    @property
+    def edit_path(self):
+        return f"/resume/summary/{self.target['summary_id']}/edit"
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def build_request(kind, client, rng):
+    target = client.target
+    if kind == "list":
+        return "GET", f"/resume/{rng.choice(LIST_VIEWS)}", None
+    if kind == "preview":
+        return "GET", f"/resume/resumes/{target['resume_id']}/preview", None
+    if kind == "download":
+        return "GET", f"/resume/resume/{target['resume_id']}/download", None
+    form = {
+        "csrf_token": client.csrf_token,
+        "entry_title": target["summary_title"],
+        "content": f"Engineer with a focus on reliable systems. {rng.random()}",
+    }
+    return "POST", client.edit_path, form
+
+
+async def run_stage(clients, rate, duration, mix, timeout, rng):
+    """
+    Sends `rate` requests per second for `duration` seconds. Returns, per
+    request, its kind, whether it succeeded and the seconds from when it
+    was due until it completed, and the elapsed time.
+    """
+    idle = asyncio.Queue()
+    for client in clients:
+        idle.put_nowait(client)
+    kinds, weights = zip(*mix.items())
+    results = []
+
+    async def fire(kind, due):
+        client = await idle.get()
+        method, path, form = build_request(kind, client, rng)
+        try:
+            status, _ = await asyncio.wait_for(
+                client.request(method, path, form), timeout
+            )
+            ok = status == EXPECTED_STATUS[kind]
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            client.close()
+            ok = False
+        results.append((kind, ok, time.perf_counter() - due))
+        idle.put_nowait(client)
+
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    tasks = []
+    for index in range(int(rate * duration)):
+        due = start + index / rate
+        await asyncio.sleep(max(0, due - time.perf_counter()))
+        kind = rng.choices(kinds, weights)[0]
+        tasks.append(loop.create_task(fire(kind, due)))
+    await asyncio.gather(*tasks)
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed):
+    """Per-endpoint counts, throughput, latency and error rate."""
+    by_kind = defaultdict(list)
+    for kind, ok, latency in results:
+        by_kind[kind].append((ok, latency * 1000))
+        by_kind["all"].append((ok, latency * 1000))
+    summary = {}
+    for kind, samples in by_kind.items():
+        latencies = [latency for _, latency in samples]
+        errors = sum(1 for ok, _ in samples if not ok)
+        summary[kind] = {
+            "requests": len(samples),
+            "ok_per_second": (len(samples) - errors) / elapsed,
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+            "max_ms": max(latencies),
+            "error_rate": errors / len(samples),
+        }
+    return summary
+
+
+def print_stage(rate, summary, elapsed):
+    total = summary["all"]
+    print(
+        f"\n{rate}/s: {total['requests']} requests in {elapsed:.1f}s, "
+        f"{total['ok_per_second']:.1f} ok/s, {total['error_rate']:.1%} errors"
+    )
+    print(
+        f"{'endpoint':>10} {'requests':>9} {'ok/s':>7} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7}"
+    )
+    for kind, row in sorted(summary.items()):
+        print(
+            f"{kind:>10} {row['requests']:>9} {row['ok_per_second']:>7.1f} "
+            f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f} "
+            f"{row['max_ms']:>8.0f} {row['error_rate']:>7.1%}"
+        )
+
+
+def saturation_points(stages, slo_ms, max_error_rate) -> dict:
+    """The first rate at which each endpoint broke its SLO, and the rate
+    before it, or None for endpoints that held up at every rate."""
+    points = {}
+    last_good = {}
+    for rate, summary in stages:
+        for kind, row in summary.items():
+            if kind in points:
+                continue
+            if row["p95_ms"] > slo_ms or row["error_rate"] > max_error_rate:
+                points[kind] = (rate, last_good.get(kind))
+            else:
+                last_good[kind] = rate
+    return {kind: points.get(kind) for kind in last_good | points}
+
+
+def seed_database(env, args):
+    def flask(*command):
+        subprocess.run(
+            [sys.executable, "-m", "flask", "--app", "manage", *command],
+            cwd=PROJECT_ROOT,
+            env=env,
+            check=True,
+        )
+
+    flask("db", "upgrade")
+    flask(
+        "seed",
+        "--users", str(args.users),
+        "--resumes", "2",
+        "--seed", str(args.seed),
+        "--password", args.password,
+    )
+
+
+def load_targets(database_url, seed, users):
+    """Username, first resume and its summary of each seeded user."""
+    engine = create_engine(database_url)
+    statement = (
+        select(User.username, BuiltResume.id, Summary.id, Summary.entry_title)
+        .join(BuiltResume, BuiltResume.user_id == User.id)
+        .join(Summary, Summary.id == BuiltResume.summary_id)
+        .where(User.username.startswith(f"seed{seed}_user"))
+        .order_by(User.username, BuiltResume.entry_title)
+    )
+    targets = {}
+    with engine.connect() as connection:
+        for username, resume_id, summary_id, summary_title in connection.execute(
+            statement
+        ):
+            targets.setdefault(
+                username,
+                {
+                    "username": username,
+                    "resume_id": resume_id,
+                    "summary_id": summary_id,
+                    "summary_title": summary_title,
+                },
+            )
+    engine.dispose()
+    return list(targets.values())[:users]
+
+
+def start_gunicorn(env, args, port):
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn",
+            "-c", "gunicorn.conf.py",
+            "--bind", f"127.0.0.1:{port}",
+            "--worker-class", args.worker_class,
+            "--log-level", "warning",
+            "wsgi:app",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env | {"WEB_CONCURRENCY": str(args.workers)},
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("gunicorn did not start listening within 30s")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def load_test(port, targets, args, mix):
+    clients = [HttpClient("127.0.0.1", port, target) for target in targets]
+    await asyncio.gather(*(client.log_in(args.password) for client in clients))
+    rng = random.Random(args.seed)
+    stages = []
+    for rate in args.rps:
+        results, elapsed = await run_stage(
+            clients, rate, args.duration, mix, args.timeout, rng
+        )
+        summary = summarize(results, elapsed)
+        print_stage(rate, summary, elapsed)
+        stages.append((rate, summary))
+    for client in clients:
+        client.close()
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", help="default: a throwaway SQLite file")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--worker-class", default="sync", help="sync, gthread, gevent, ..."
+    )
+    parser.add_argument("--threads", type=int, default=1, help="per worker")
+    parser.add_argument("--users", type=int, default=50, help="logged-in clients")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--password", default="load-test")
+    parser.add_argument(
+        "--rps",
+        type=lambda value: [float(rate) for rate in value.split(",")],
+        default=[5, 10, 20, 40],
+        help="comma-separated rates to run in turn",
+    )
+    parser.add_argument("--duration", type=float, default=20, help="seconds per rate")
+    parser.add_argument(
+        "--mix",
+        type=lambda value: {
+            kind: float(weight)
+            for kind, weight in (pair.split("=") for pair in value.split(","))
+        },
+        default={"list": 50, "preview": 25, "edit": 15, "download": 10},
+        help="relative weights of list, preview, edit and download requests",
+    )
+    parser.add_argument("--timeout", type=float, default=30, help="per request")
+    parser.add_argument("--slo-ms", type=float, default=500, help="p95 latency SLO")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    args = parser.parse_args()
+    if unknown := set(args.mix) - set(EXPECTED_STATUS):
+        parser.error(f"unknown --mix endpoints: {', '.join(sorted(unknown))}")
+
+    workdir = tempfile.mkdtemp(prefix="resume-builder-load-")
+    database_url = args.database_url or f"sqlite:///{workdir}/load.db"
+    env = os.environ | {
+        "FLASK_ENV": "production",
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "GUNICORN_THREADS": str(args.threads),
+    }
+    server = None
+    try:
+        seed_database(env, args)
+        targets = load_targets(database_url, args.seed, args.users)
+        port = free_port()
+        server = start_gunicorn(
+            env | {"PROMETHEUS_MULTIPROC_DIR": os.path.join(workdir, "metrics")},
+            args,
+            port,
+        )
+        print(
+            f"{args.workers} {args.worker_class} workers x {args.threads} threads, "
+            f"{len(targets)} users, mix {args.mix}"
+        )
+        stages = asyncio.run(load_test(port, targets, args, args.mix))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(
+        f"\nsaturation (p95 over {args.slo_ms:.0f} ms or more than "
+        f"{args.max_error_rate:.0%} errors):"
+    )
+    for kind, point in sorted(
+        saturation_points(stages, args.slo_ms, args.max_error_rate).items()
+    ):
+        if point is None:
+            print(f"{kind:>10}: held up to {args.rps[-1]:g}/s")
+        else:
+            rate, last_good = point
+            held = f"held at {last_good:g}/s" if last_good else "at the lowest rate"
+            print(f"{kind:>10}: saturated at {rate:g}/s ({held})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Login throughput for password hashing settings.
+
+For each PASSWORD_HASH_METHOD (and bcrypt cost) it times verifying a
+password through PasswordHasher, first one at a time, giving logins/sec per
+core, then from as many threads as there are cores with the concurrency
+cap set to match, giving what the whole machine sustains.
+
+    python -m benchmarks.password_hashing [--logins 40] [--method scrypt ...]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from flask import Flask  # noqa: E402
+from flask_bcrypt import Bcrypt  # noqa: E402
+
+from resume_builder.passwords import PasswordHasher  # noqa: E402
+
+DEFAULT_SETTINGS = (
+    "scrypt",
+    "scrypt:16384:8:1",
+    "pbkdf2:sha256:600000",
+    "bcrypt:10",
+    "bcrypt:12",
+)
+
+
+def make_hasher(setting, concurrency):
+    method, _, rounds = setting.partition(":")
+    app = Flask(__name__)
+    if method == "bcrypt":
+        app.config.update(PASSWORD_HASH_METHOD="bcrypt", BCRYPT_LOG_ROUNDS=int(rounds))
+    else:
+        app.config["PASSWORD_HASH_METHOD"] = setting
+    app.config["PASSWORD_HASH_CONCURRENCY"] = concurrency
+    hasher = PasswordHasher()
+    hasher.init_app(app, Bcrypt(app))
+    return hasher
+
+
+def logins_per_second(hasher, password_hash, logins, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(
+            executor.map(
+                lambda _: hasher.verify(password_hash, "correct horse"), range(logins)
+            )
+        )
+    assert all(results)
+    return logins / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=40, help="per setting and run")
+    parser.add_argument(
+        "--method",
+        action="append",
+        help='a werkzeug method or "bcrypt:<rounds>"; repeatable',
+    )
+    args = parser.parse_args()
+    cores = os.cpu_count()
+
+    print(f"{cores} cores, {args.logins} logins per run")
+    print(f"{'setting':>22} {'ms/verify':>10} {'logins/s/core':>14} {'logins/s':>10}")
+    for setting in args.method or DEFAULT_SETTINGS:
+        single = make_hasher(setting, 1)
+        password_hash = single.hash("correct horse")
+        per_core = logins_per_second(single, password_hash, args.logins, 1)
+        single.shutdown()
+
+        parallel = make_hasher(setting, cores)
+        total = logins_per_second(parallel, password_hash, args.logins, cores)
+        parallel.shutdown()
+        print(
+            f"{setting:>22} {1000 / per_core:>10.1f} {per_core:>14.1f} {total:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Load test for the database connection pool under concurrent PDF downloads.
+
+Logs in once per client thread against a running server, downloads one
+resume's PDF repeatedly from every thread at once, then compares the pool
+metrics from /metrics before and after. It fails when any connection
+request timed out or any download failed, i.e. when the pool was exhausted.
+
+    python -m benchmarks.pool_load --url http://localhost:8000 \
+        --username demo --password secret --resume-id <id> \
+        --metrics-token $METRICS_TOKEN [--concurrency 32] [--requests 20]
+"""
+
+import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import http.cookiejar
+import re
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from prometheus_client.parser import text_string_to_metric_families
+
+from resume_builder.instrumentation import percentile
+
+CSRF_TOKEN = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"')
+
+
+def logged_in_opener(base_url, username, password):
+    opener = urllib.request.build_opener(
+        urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+    )
+    login_url = f"{base_url}/auth/login"
+    form = {"username": username, "password": password}
+    match = CSRF_TOKEN.search(opener.open(login_url).read().decode())
+    if match:
+        form["csrf_token"] = match.group(1)
+    opener.open(login_url, urllib.parse.urlencode(form).encode()).read()
+    return opener
+
+
+def pool_metrics(base_url, token) -> dict:
+    request = urllib.request.Request(
+        f"{base_url}/metrics", headers={"Authorization": f"Bearer {token}"}
+    )
+    with urllib.request.urlopen(request) as response:
+        text = response.read().decode()
+    samples = {}
+    for family in text_string_to_metric_families(text):
+        if family.name.startswith("resume_builder_db_pool"):
+            for sample in family.samples:
+                key = (sample.name, sample.labels.get("le"))
+                samples[key] = samples.get(key, 0) + sample.value
+    return samples
+
+
+def download(opener, url):
+    start = time.perf_counter()
+    try:
+        with opener.open(url) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as error:
+        status = error.code
+    except urllib.error.URLError:
+        status = "connection error"
+    return status, time.perf_counter() - start
+
+
+def client(base_url, args):
+    opener = logged_in_opener(base_url, args.username, args.password)
+    url = f"{base_url}/resume/resume/{args.resume_id}/download"
+    return [download(opener, url) for _ in range(args.requests)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--resume-id", required=True)
+    parser.add_argument("--metrics-token", required=True)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=20, help="per client")
+    args = parser.parse_args()
+    base_url = args.url.rstrip("/")
+
+    before = pool_metrics(base_url, args.metrics_token)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        results = [
+            result
+            for client_results in executor.map(
+                lambda _: client(base_url, args), range(args.concurrency)
+            )
+            for result in client_results
+        ]
+    elapsed = time.perf_counter() - started
+    after = pool_metrics(base_url, args.metrics_token)
+
+    def delta(name, le=None):
+        return after.get((name, le), 0) - before.get((name, le), 0)
+
+    statuses = Counter(status for status, _ in results)
+    latencies = [duration * 1000 for _, duration in results]
+    waits = delta("resume_builder_db_pool_wait_seconds_count")
+    wait_sum = delta("resume_builder_db_pool_wait_seconds_sum")
+    slow_waits = waits - delta("resume_builder_db_pool_wait_seconds_bucket", "0.1")
+    opened = delta("resume_builder_db_pool_connections_opened_total")
+    timeouts = delta("resume_builder_db_pool_timeouts_total")
+
+    print(
+        f"{len(results)} downloads from {args.concurrency} clients in "
+        f"{elapsed:.1f}s ({len(results) / elapsed:.1f}/s)"
+    )
+    print(f"statuses: {dict(statuses)}")
+    print(
+        f"latency: p50 {percentile(latencies, 0.50):.0f} ms, "
+        f"p95 {percentile(latencies, 0.95):.0f} ms, max {max(latencies):.0f} ms"
+    )
+    print(
+        f"pool: {waits:.0f} checkouts, mean wait "
+        f"{wait_sum / waits * 1000 if waits else 0:.2f} ms, "
+        f"{slow_waits:.0f} waited over 100 ms, {opened:.0f} connections opened, "
+        f"{timeouts:.0f} timeouts"
+    )
+
+    failed = sum(count for status, count in statuses.items() if status != 200)
+    if timeouts or failed:
+        print("FAIL: the pool was exhausted or downloads failed")
+        sys.exit(1)
+    print("OK: no pool exhaustion")
+
+
+if __name__ == "__main__":
+    main()
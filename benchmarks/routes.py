@@ -0,0 +1,318 @@
+"""
+Route-level benchmarks for the resume hot paths.
+
+Seeds a throwaway SQLite database with one user per dataset size (see
+SIZES) through `flask seed`'s DatasetSeeder, then calls every scenario as
+that user with the Flask test client under the production config. For
+each size and scenario it reports p50/p95/p99 latency, the SQL statements
+one call executes and the peak memory traced during one call, and writes
+them as JSON.
+
+The results are compared against --baseline (the committed
+benchmarks/baseline.json by default) and the run fails on a regression:
+more queries than the baseline, or p50 latency or peak memory above it by
+more than --tolerance. Query counts hold anywhere, but latency and memory
+are only comparable on the same machine, so re-record the baseline
+locally with --save-baseline before relying on them. The committed
+baseline leaves out the PDF downloads, which depend on the installed
+WeasyPrint and fonts.
+
+    python -m benchmarks.routes [--sizes small,medium,large] [--iterations 30] \
+        [--output results.json] [--baseline benchmarks/baseline.json] \
+        [--save-baseline] [--tolerance 0.25]
+"""
+
+import argparse
+from dataclasses import dataclass
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+DATABASE_DIR = tempfile.mkdtemp(prefix="resume-builder-bench-")
+os.environ["FLASK_ENV"] = "production"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DATABASE_DIR}/bench.db"
+
+from sqlalchemy import select  # noqa: E402
+
+from resume_builder import create_app, db  # noqa: E402
+from resume_builder.extensions import fragment_cache, pdf_cache  # noqa: E402
+from resume_builder.instrumentation import QueryCounter, percentile  # noqa: E402
+from resume_builder.models import BuiltResume, User  # noqa: E402
+from resume_builder.resume_builder_core.html_utils import (  # noqa: E402
+    render_markdown,
+)
+from resume_builder.seeding import DatasetSeeder, SeedOptions  # noqa: E402
+
+PASSWORD = "benchmark"
+# Suffixes keeping generated titles and markdown sources unique across sizes.
+UNIQUE = itertools.count()
+
+# Entries per section, resumes and job applications of the benchmarked user.
+SIZES = {
+    "small": {"entries": 3, "resumes": 2, "job_applications": 5},
+    "medium": {"entries": 15, "resumes": 10, "job_applications": 50},
+    "large": {"entries": 60, "resumes": 40, "job_applications": 300},
+}
+LIST_VIEWS = (
+    "basic_info_list",
+    "summary_list",
+    "experience_list",
+    "education_list",
+    "skills_list",
+    "languages_list",
+    "list_resume",
+)
+MARKDOWN_SOURCE = (
+    "Led the migration of a **billing service** to event-driven workers, "
+    "cutting invoice latency by 40%. See https://example.com/case-study.\n\n"
+    "- Designed the `outbox` table and relay\n- Mentored three engineers\n\n"
+)
+
+
+@dataclass
+class Scenario:
+    name: str
+    call: callable
+    # Runs before every call, outside the measurement.
+    setup: callable = None
+
+
+def seed_user(app, size_name, seed):
+    size = SIZES[size_name]
+    entries = size["entries"]
+    options = SeedOptions(
+        users=1,
+        basic_infos=max(1, entries // 5),
+        summaries=max(1, entries // 5),
+        experiences=entries,
+        educations=entries,
+        skills=entries,
+        languages=entries,
+        resumes=size["resumes"],
+        job_applications=size["job_applications"],
+        themes=1,
+        seed=seed,
+        password=PASSWORD,
+    )
+    with app.app_context():
+        seeder = DatasetSeeder(db.session, options)
+        seeder.run()
+        return seeder.username(0)
+
+
+def resume_form(app, username, title):
+    """Form data building a resume from a user's first entries."""
+    with app.app_context():
+        resume = db.session.scalars(
+            select(BuiltResume).join(User).where(User.username == username)
+        ).first()
+        return {
+            "entry_title": title,
+            "basic_info": str(resume.basic_info_id),
+            "summary": str(resume.summary_id),
+            "theme": str(resume.theme_id),
+            "experience": [str(entry.id) for entry in resume.experience],
+            "education": [str(entry.id) for entry in resume.education],
+            "skills": [str(entry.id) for entry in resume.skills],
+            "languages": [str(entry.id) for entry in resume.languages],
+        }, resume.id, resume.user_id
+
+
+def scenarios(app, client, username):
+    form, resume_id, user_id = resume_form(app, username, "benchmark")
+    credentials = {"username": username, "password": PASSWORD}
+
+    def get(path):
+        def call():
+            response = client.get(path)
+            assert response.status_code == 200, (path, response.status_code)
+
+        return call
+
+    def post(path, data):
+        def call():
+            response = client.post(path, data=data())
+            assert response.status_code == 302, (path, response.status_code)
+            # Nothing renders the flashed messages, don't let them pile up.
+            with client.session_transaction() as session:
+                session.pop("_flashes", None)
+
+        return call
+
+    def load_user():
+        with app.test_request_context():
+            assert app.login_manager._user_callback(str(user_id)) is not None
+
+    def markdown():
+        # A new source every call, so this measures rendering, not the memo.
+        render_markdown(f"{MARKDOWN_SOURCE}{next(UNIQUE)}")
+
+    resume = f"/resume/resumes/{resume_id}"
+    download = f"/resume/resume/{resume_id}/download"
+    cases = [
+        Scenario("load_user", load_user),
+        Scenario(
+            "login",
+            post("/auth/login", lambda: credentials),
+            setup=lambda: client.get("/auth/logout"),
+        ),
+        Scenario("resume.home", get("/resume/")),
+        *(Scenario(f"resume.{view}", get(f"/resume/{view}")) for view in LIST_VIEWS),
+        Scenario(
+            "resume.build_resume",
+            post(
+                "/resume/build_resume",
+                lambda: form | {"entry_title": f"benchmark {next(UNIQUE)}"},
+            ),
+        ),
+        Scenario("resume.edit_resume", post(f"{resume}/edit", lambda: form)),
+        Scenario("resume.preview_resume", get(f"{resume}/preview")),
+        Scenario(
+            "resume.preview_resume (uncached)",
+            get(f"{resume}/preview"),
+            setup=fragment_cache.clear,
+        ),
+        Scenario("resume.download_resume", get(download)),
+        Scenario(
+            "resume.download_resume (uncached)",
+            get(download),
+            setup=pdf_cache.clear,
+        ),
+        Scenario("render_markdown", markdown),
+    ]
+    return cases
+
+
+def measure(scenario, queries, iterations, warmup=2):
+    def run():
+        if scenario.setup is not None:
+            scenario.setup()
+        before = queries.count
+        start = time.perf_counter()
+        scenario.call()
+        return time.perf_counter() - start, queries.count - before
+
+    for _ in range(warmup):
+        run()
+    durations, query_counts = zip(*(run() for _ in range(iterations)))
+
+    # Tracing slows everything down, so memory is measured in a separate call.
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [duration * 1000 for duration in durations]
+    return {
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "queries": percentile(query_counts, 0.50),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, tolerance) -> list[str]:
+    """Regressions of `results` against `baseline`, as readable lines."""
+    regressions = []
+    for size, cases in results.items():
+        for name, current in cases.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+            if current["queries"] > previous["queries"]:
+                regressions.append(
+                    f"{size} {name}: {current['queries']} queries, "
+                    f"baseline {previous['queries']}"
+                )
+            for metric in ("p50_ms", "peak_kib"):
+                if current[metric] > previous[metric] * (1 + tolerance):
+                    regressions.append(
+                        f"{size} {name}: {metric} {current[metric]}, "
+                        f"baseline {previous[metric]}"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default=",".join(SIZES))
+    parser.add_argument("--iterations", type=int, default=30, help="per scenario")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", default="benchmarks/baseline.json")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="write the results to --baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative increase of p50 latency and peak memory",
+    )
+    args = parser.parse_args()
+
+    app = create_app()
+    app.config.update(WTF_CSRF_ENABLED=False, SLOW_REQUEST_THRESHOLD_MS=0)
+    with app.app_context():
+        db.create_all()
+        engine = db.engine
+
+    results = {}
+    try:
+        with QueryCounter(engine) as queries:
+            for seed, size in enumerate(args.sizes.split(",")):
+                username = seed_user(app, size, seed)
+                client = app.test_client()
+                client.post(
+                    "/auth/login", data={"username": username, "password": PASSWORD}
+                )
+                print(f"{size}: {SIZES[size]}")
+                print(
+                    f"{'scenario':>36} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+                    f"{'queries':>8} {'peak KiB':>9}"
+                )
+                results[size] = {}
+                for scenario in scenarios(app, client, username):
+                    row = measure(scenario, queries, args.iterations)
+                    results[size][scenario.name] = row
+                    print(
+                        f"{scenario.name:>36} {row['p50_ms']:>9.2f} "
+                        f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} "
+                        f"{row['queries']:>8} {row['peak_kib']:>9.1f}"
+                    )
+    finally:
+        shutil.rmtree(DATABASE_DIR, ignore_errors=True)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "iterations": args.iterations,
+        "results": results,
+    }
+    with open(args.save_baseline and args.baseline or args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    if args.save_baseline or not os.path.exists(args.baseline):
+        return
+
+    with open(args.baseline) as file:
+        regressions = compare(results, json.load(file)["results"], args.tolerance)
+    if regressions:
+        print("FAIL: regressions against the baseline")
+        print("\n".join(regressions))
+        sys.exit(1)
+    print("OK: no regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
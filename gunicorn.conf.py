@@ -0,0 +1,27 @@
+import os
+import shutil
+
+# Workers come from WEB_CONCURRENCY, which gunicorn reads itself. The thread
+# count is exported so each worker sizes its database pool to match
+# (Config.WORKER_THREADS); pass it through GUNICORN_THREADS, not --threads.
+# More than one thread switches gunicorn to the gthread worker, so that
+# stays opt-in.
+threads = int(os.environ.setdefault("GUNICORN_THREADS", "1"))
+
+# Workers and render processes write Prometheus samples here so /metrics
+# can aggregate them. It must be set before any worker imports the app.
+prometheus_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/resume_builder_metrics"
+)
+
+
+def on_starting(server):
+    # Samples from a previous run would otherwise be merged into this one.
+    shutil.rmtree(prometheus_dir, ignore_errors=True)
+    os.makedirs(prometheus_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
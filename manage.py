@@ -1,6 +1,12 @@
 import os
+from datetime import timedelta
+
+import click
+
 from resume_builder import create_app, db
+from resume_builder.analytics import DailyStatsService, today
 from resume_builder.models import User
+from resume_builder.seeding import DatasetSeeder, SeedOptions
 
 app = create_app()
 
@@ -73,5 +79,63 @@ def delete_test_user():
         db.session.commit()
 
 
+@app.cli.command("rollup-stats")
+@click.option(
+    "--days", default=2, show_default=True, help="Number of days to recompute, ending today."
+)
+def rollup_stats(days):
+    """
+    Rebuilds the user and resume counters of the admin dashboard from the
+    source tables. Run it periodically, or with a large --days once to
+    backfill history.
+    """
+    with app.app_context():
+        written = DailyStatsService(db.session).rollup(
+            since=today() - timedelta(days=days - 1)
+        )
+        print(f"Rolled up {written} days of stats.")
+
+
+@app.cli.command("seed")
+@click.option("--users", default=100, show_default=True)
+@click.option("--basic-infos", default=1, show_default=True, help="Per user.")
+@click.option("--summaries", default=1, show_default=True, help="Per user.")
+@click.option("--experiences", default=3, show_default=True, help="Per user.")
+@click.option("--educations", default=2, show_default=True, help="Per user.")
+@click.option("--skills", default=3, show_default=True, help="Per user.")
+@click.option("--languages", default=2, show_default=True, help="Per user.")
+@click.option("--resumes", default=2, show_default=True, help="Per user.")
+@click.option("--job-applications", default=5, show_default=True, help="Per user.")
+@click.option("--themes", default=3, show_default=True)
+@click.option(
+    "--days",
+    default=365,
+    show_default=True,
+    help="Spread creation dates over this many days.",
+)
+@click.option("--seed", default=0, show_default=True, help="Random seed.")
+@click.option(
+    "--batch-size", default=500, show_default=True, help="Users per INSERT batch."
+)
+@click.option("--password", default="password", show_default=True)
+def seed(**options):
+    """
+    Fills the database with a synthetic dataset for load and scaling tests.
+    Users are named seed<SEED>_user<N> and all share --password; the same
+    options always generate the same rows.
+    """
+    with app.app_context():
+        seeder = DatasetSeeder(db.session, SeedOptions(**options))
+        try:
+            counts = seeder.run(
+                progress=lambda users: print(f"{users}/{options['users']} users")
+            )
+        except ValueError as error:
+            print(f"ERROR: {error}")
+            return
+        for table, count in counts.items():
+            print(f"{table}: {count}")
+
+
 if __name__ == "__main__":
     app.run()
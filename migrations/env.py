@@ -10,8 +10,9 @@ from alembic import context
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-fileConfig(config.config_file_name)
+# This line sets up loggers basically. Loggers that already exist are left
+# enabled, since migrations also run inside the app, e.g. in the tests.
+fileConfig(config.config_file_name, disable_existing_loggers=False)
 logger = logging.getLogger('alembic.env')
 
 
@@ -97,14 +98,42 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=get_metadata(),
-            **conf_args
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        # The app enforces foreign keys on every SQLite connection. Batch
+        # migrations rebuild a table by copying it and dropping the old one,
+        # and with enforcement on that DROP would cascade to, or be refused
+        # by, every row referencing it. The pragma can't change inside a
+        # transaction, so it is set around the whole run.
+        sqlite = connection.dialect.name == 'sqlite'
+        if sqlite:
+            _set_foreign_keys(connection, False)
+
+        try:
+            context.configure(
+                connection=connection,
+                target_metadata=get_metadata(),
+                **conf_args
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+                if sqlite:
+                    _check_foreign_keys(connection)
+        finally:
+            if sqlite:
+                _set_foreign_keys(connection, True)
+
+
+def _set_foreign_keys(connection, enabled):
+    if connection.in_transaction():
+        connection.commit()
+    connection.exec_driver_sql(f"PRAGMA foreign_keys={'ON' if enabled else 'OFF'}")
+    connection.commit()
+
+
+def _check_foreign_keys(connection):
+    violations = connection.exec_driver_sql('PRAGMA foreign_key_check').all()
+    if violations:
+        raise RuntimeError(f'Migrations broke foreign keys: {violations[:10]}')
 
 
 if context.is_offline_mode():
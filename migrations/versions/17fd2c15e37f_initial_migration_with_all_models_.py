@@ -27,7 +27,7 @@ def upgrade():
     sa.PrimaryKeyConstraint('id')
     )
     op.create_table('resume_theme',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('name', sa.String(length=50), nullable=False),
     sa.Column('description', sa.String(length=200), nullable=True),
     sa.Column('styles', sa.Text(), nullable=False),
@@ -37,7 +37,7 @@ def upgrade():
     sa.UniqueConstraint('name', name='_resumetheme_name_uc')
     )
     op.create_table('user',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('username', sa.String(length=70), nullable=False),
     sa.Column('password_hash', sa.String(), nullable=False),
     sa.Column('is_admin', sa.Boolean(), nullable=False),
@@ -48,7 +48,7 @@ def upgrade():
     sa.UniqueConstraint('username', name='_user_username_uc')
     )
     op.create_table('basic_info',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('full_name', sa.String(length=150), nullable=False),
     sa.Column('job_title', sa.String(length=150), nullable=False),
     sa.Column('address', sa.String(length=255), nullable=False),
@@ -56,7 +56,7 @@ def upgrade():
     sa.Column('contact_phone', sa.String(length=100), nullable=False),
     sa.Column('linkedin_url', sa.String(length=255), nullable=True),
     sa.Column('github_url', sa.String(length=255), nullable=True),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -65,12 +65,12 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_entry_title_uc')
     )
     op.create_table('education',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('degree_name', sa.String(length=255), nullable=False),
     sa.Column('school_name', sa.String(length=255), nullable=False),
     sa.Column('date_started', sa.Date(), nullable=False),
     sa.Column('date_finished', sa.Date(), nullable=True),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -79,13 +79,13 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_education_title_uc')
     )
     op.create_table('experience',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('job_title', sa.String(length=200), nullable=False),
     sa.Column('company_name', sa.String(length=80), nullable=False),
     sa.Column('date_started', sa.Date(), nullable=False),
     sa.Column('date_finished', sa.Date(), nullable=True),
     sa.Column('description', sa.Text(), nullable=True),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -94,11 +94,11 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_experience_title_uc')
     )
     op.create_table('invite_code',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('code', sa.String(length=100), nullable=False),
     sa.Column('description', sa.Text(), nullable=False),
     sa.Column('redeemed', sa.Boolean(), nullable=False),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=True),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=True),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
     sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='SET NULL'),
@@ -106,7 +106,7 @@ def upgrade():
     sa.UniqueConstraint('user_id', name='_invitecode_user_id_uc')
     )
     op.create_table('job_application',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('job_title', sa.String(), nullable=False),
     sa.Column('company_name', sa.String(), nullable=False),
     sa.Column('location', sa.String(), nullable=True),
@@ -114,7 +114,7 @@ def upgrade():
     sa.Column('job_url', sa.String(), nullable=True),
     sa.Column('application_source', sa.String(), nullable=False),
     sa.Column('application_stage_id', sa.Integer(), nullable=False),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
     sa.ForeignKeyConstraint(['application_stage_id'], ['application_stage.id'], ondelete='RESTRICT'),
@@ -122,10 +122,10 @@ def upgrade():
     sa.PrimaryKeyConstraint('id')
     )
     op.create_table('language',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('name', sa.String(length=128), nullable=False),
     sa.Column('proficiency', sa.String(length=300), nullable=False),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -134,10 +134,10 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_language_title_uc')
     )
     op.create_table('skills',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('skill_group_title', sa.String(length=128), nullable=True),
     sa.Column('description', sa.Text(), nullable=False),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -146,9 +146,9 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_skills_title_uc')
     )
     op.create_table('summary',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('content', sa.Text(), nullable=True),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -157,11 +157,11 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_summary_title_uc')
     )
     op.create_table('built_resume',
-    sa.Column('id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('basic_info_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('summary_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('theme_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('user_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('basic_info_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('summary_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('theme_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('user_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.Column('entry_title', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=False),
     sa.Column('updated_at', sa.DateTime(), nullable=False),
@@ -173,29 +173,29 @@ def upgrade():
     sa.UniqueConstraint('user_id', 'entry_title', name='_user_built_resumes_title_uc')
     )
     op.create_table('built_resume_education',
-    sa.Column('built_resume_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('education_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('built_resume_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('education_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.ForeignKeyConstraint(['built_resume_id'], ['built_resume.id'], ondelete='CASCADE'),
     sa.ForeignKeyConstraint(['education_id'], ['education.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('built_resume_id', 'education_id')
     )
     op.create_table('built_resume_experience',
-    sa.Column('built_resume_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('experience_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('built_resume_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('experience_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.ForeignKeyConstraint(['built_resume_id'], ['built_resume.id'], ondelete='CASCADE'),
     sa.ForeignKeyConstraint(['experience_id'], ['experience.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('built_resume_id', 'experience_id')
     )
     op.create_table('built_resume_language',
-    sa.Column('built_resume_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('language_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('built_resume_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('language_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.ForeignKeyConstraint(['built_resume_id'], ['built_resume.id'], ondelete='CASCADE'),
     sa.ForeignKeyConstraint(['language_id'], ['language.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('built_resume_id', 'language_id')
     )
     op.create_table('built_resume_skills',
-    sa.Column('built_resume_id', resume_builder.models.GUID(), nullable=False),
-    sa.Column('skills_id', resume_builder.models.GUID(), nullable=False),
+    sa.Column('built_resume_id', resume_builder.models.GUID(binary=False), nullable=False),
+    sa.Column('skills_id', resume_builder.models.GUID(binary=False), nullable=False),
     sa.ForeignKeyConstraint(['built_resume_id'], ['built_resume.id'], ondelete='CASCADE'),
     sa.ForeignKeyConstraint(['skills_id'], ['skills.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('built_resume_id', 'skills_id')
@@ -0,0 +1,47 @@
+"""Add foreign key and lookup indexes
+
+Revision ID: 5c2e8a9d41f3
+Revises: 17fd2c15e37f
+Create Date: 2026-10-18 09:12:41.503127
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8a9d41f3'
+down_revision = '17fd2c15e37f'
+branch_labels = None
+depends_on = None
+
+
+# user_id lookups on the resume section tables and built_resume are already
+# served by the (user_id, entry_title) unique constraints, whose indexes lead
+# with user_id, so only the uncovered columns get an index here.
+INDEXES = [
+    ('built_resume', 'basic_info_id'),
+    ('built_resume', 'summary_id'),
+    ('built_resume', 'theme_id'),
+    ('built_resume_experience', 'experience_id'),
+    ('built_resume_education', 'education_id'),
+    ('built_resume_skills', 'skills_id'),
+    ('built_resume_language', 'language_id'),
+    ('invite_code', 'code'),
+    ('job_application', 'user_id'),
+    ('job_application', 'application_stage_id'),
+]
+
+
+def upgrade():
+    for table_name, column_name in INDEXES:
+        op.create_index(
+            op.f(f'ix_{table_name}_{column_name}'),
+            table_name,
+            [column_name],
+            unique=False,
+        )
+
+
+def downgrade():
+    for table_name, column_name in reversed(INDEXES):
+        op.drop_index(op.f(f'ix_{table_name}_{column_name}'), table_name=table_name)
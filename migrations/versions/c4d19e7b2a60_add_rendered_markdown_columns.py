@@ -0,0 +1,122 @@
+"""Add rendered markdown columns
+
+Revision ID: c4d19e7b2a60
+Revises: a81f0c3e6b27
+Create Date: 2026-10-18 13:02:41.507126
+
+"""
+import hashlib
+
+from alembic import op
+import bleach
+from bleach.linkifier import LinkifyFilter
+import markdown
+import sqlalchemy as sa
+import resume_builder
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d19e7b2a60'
+down_revision = 'a81f0c3e6b27'
+branch_labels = None
+depends_on = None
+
+
+# (table, source column, render inline)
+MARKDOWN_COLUMNS = [
+    ('experience', 'description', False),
+    ('summary', 'content', False),
+    ('skills', 'description', True),
+]
+BATCH_SIZE = 1000
+
+# The markdown renderer as of this revision, copied so that later changes
+# to the app's rendering don't change what this migration writes. Rows are
+# re-rendered by the app whenever their stored hash no longer matches.
+ALLOWED_TAGS = {
+    'a', 'abbr', 'acronym', 'b', 'blockquote', 'code', 'em', 'i', 'li', 'ol',
+    'strong', 'ul', 'p', 'pre', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': ['href', 'title'],
+    'img': ['src', 'alt', 'title'],
+    'span': ['class'],
+    'code': ['class'],
+    'pre': ['class'],
+}
+MARKDOWN_EXTENSIONS = ['fenced_code', 'codehilite']
+
+
+def upgrade():
+    for table_name, source, _ in MARKDOWN_COLUMNS:
+        op.add_column(table_name, sa.Column(f'{source}_html', sa.Text(), nullable=True))
+        op.add_column(table_name, sa.Column(f'{source}_hash', sa.String(length=64), nullable=True))
+
+    # Backfill the rendered HTML for existing rows.
+    bind = op.get_bind()
+    md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    cleaner = bleach.Cleaner(
+        tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, filters=[LinkifyFilter]
+    )
+    for table_name, source, inline in MARKDOWN_COLUMNS:
+        table = sa.table(
+            table_name,
+            sa.column('id', resume_builder.models.GUID(binary=False)),
+            sa.column(source, sa.Text()),
+            sa.column(f'{source}_html', sa.Text()),
+            sa.column(f'{source}_hash', sa.String(length=64)),
+        )
+        update = (
+            table.update()
+            .where(table.c.id == sa.bindparam('row_id'))
+            .values({
+                f'{source}_html': sa.bindparam('rendered_html'),
+                f'{source}_hash': sa.bindparam('source_hash'),
+            })
+        )
+        last_id = None
+        while True:
+            batch = sa.select(table.c.id, table.c[source]).order_by(table.c.id)
+            if last_id is not None:
+                batch = batch.where(table.c.id > last_id)
+            rows = bind.execute(batch.limit(BATCH_SIZE)).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            bind.execute(
+                update,
+                [
+                    _render(md, cleaner, row_id, text, inline)
+                    for row_id, text in rows
+                ],
+            )
+
+
+def _render(md, cleaner, row_id, text, inline):
+    text = text or ''
+    try:
+        html = cleaner.clean(md.convert(text))
+    finally:
+        md.reset()
+    if (
+        inline
+        and html.startswith('<p>')
+        and html.endswith('</p>')
+        and html.count('<p>') == 1
+    ):
+        html = html[3:-4]
+    return {
+        'row_id': row_id,
+        'rendered_html': html,
+        'source_hash': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+    }
+
+
+def downgrade():
+    # Rebuilds the tables on SQLite, which env.py runs with foreign keys off:
+    # the DROP would otherwise cascade through the built_resume_* tables, or
+    # be refused for summary, which built_resume references.
+    for table_name, source, _ in reversed(MARKDOWN_COLUMNS):
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_column(f'{source}_hash')
+            batch_op.drop_column(f'{source}_html')
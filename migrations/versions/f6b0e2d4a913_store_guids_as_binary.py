@@ -0,0 +1,129 @@
+"""Store GUIDs as 16 bytes instead of 32 hex characters
+
+Revision ID: f6b0e2d4a913
+Revises: 9d2f47a1c8e5
+Create Date: 2026-10-18 19:12:07.524318
+
+PostgreSQL already stores GUIDs as its native uuid type, so nothing
+changes there, and SQLite is converted in place. Other databases are not
+converted automatically: the migration stops with an error naming the
+steps to follow instead, which are to convert the columns in GUID_COLUMNS
+by hand and then stamp the revision.
+"""
+from alembic import op
+import sqlalchemy as sa
+import resume_builder
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6b0e2d4a913'
+down_revision = '9d2f47a1c8e5'
+branch_labels = None
+depends_on = None
+
+
+GUID_COLUMNS = {
+    'resume_theme': ['id'],
+    'user': ['id'],
+    'basic_info': ['id', 'user_id'],
+    'education': ['id', 'user_id'],
+    'experience': ['id', 'user_id'],
+    'invite_code': ['id', 'user_id'],
+    'job_application': ['id', 'user_id'],
+    'language': ['id', 'user_id'],
+    'skills': ['id', 'user_id'],
+    'summary': ['id', 'user_id'],
+    'built_resume': ['id', 'basic_info_id', 'summary_id', 'theme_id', 'user_id'],
+    'built_resume_education': ['built_resume_id', 'education_id'],
+    'built_resume_experience': ['built_resume_id', 'experience_id'],
+    'built_resume_language': ['built_resume_id', 'language_id'],
+    'built_resume_skills': ['built_resume_id', 'skills_id'],
+    'pdf_render_job': ['id', 'built_resume_id', 'user_id'],
+}
+BATCH_SIZE = 10000
+
+
+def upgrade():
+    if not _supported_dialect(
+        'convert the GUID_COLUMNS of this migration from CHAR(32) hex to '
+        'BINARY(16) by hand, e.g. with UNHEX(), then run '
+        f'`flask db stamp {revision}`'
+    ):
+        return
+    bind = op.get_bind()
+
+    # SQLite keeps BLOBs as they are even in a CHAR column, so the values are
+    # converted first and the tables rebuilt with the new column type after.
+    for table_name, columns in GUID_COLUMNS.items():
+        for column in columns:
+            last_rowid = 0
+            while True:
+                rows = bind.execute(
+                    sa.text(
+                        f'SELECT rowid, "{column}" FROM "{table_name}" '
+                        f'WHERE rowid > :last_rowid ORDER BY rowid LIMIT {BATCH_SIZE}'
+                    ),
+                    {'last_rowid': last_rowid},
+                ).all()
+                if not rows:
+                    break
+                last_rowid = rows[-1][0]
+                updates = [
+                    {'rowid': rowid, 'value': bytes.fromhex(value)}
+                    for rowid, value in rows
+                    if isinstance(value, str)
+                ]
+                if updates:
+                    bind.execute(
+                        sa.text(
+                            f'UPDATE "{table_name}" SET "{column}" = :value '
+                            'WHERE rowid = :rowid'
+                        ),
+                        updates,
+                    )
+    _alter_guid_columns(
+        resume_builder.models.GUID(binary=False), resume_builder.models.GUID()
+    )
+
+
+def downgrade():
+    if not _supported_dialect(
+        'convert the GUID_COLUMNS of this migration from BINARY(16) back to '
+        'CHAR(32) lowercase hex by hand, e.g. with LOWER(HEX()), then run '
+        f'`flask db stamp {down_revision}`'
+    ):
+        return
+    bind = op.get_bind()
+
+    for table_name, columns in GUID_COLUMNS.items():
+        for column in columns:
+            bind.execute(
+                sa.text(
+                    f'UPDATE "{table_name}" SET "{column}" = lower(hex("{column}")) '
+                    f'WHERE typeof("{column}") = \'blob\''
+                )
+            )
+    _alter_guid_columns(
+        resume_builder.models.GUID(), resume_builder.models.GUID(binary=False)
+    )
+
+
+def _supported_dialect(manual_steps):
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # GUIDs already use the native uuid type.
+        return False
+    if dialect != 'sqlite':
+        raise NotImplementedError(
+            f'Revision {revision} only converts GUID columns on SQLite and '
+            f'PostgreSQL, not on {dialect}. To migrate, {manual_steps}.'
+        )
+    return True
+
+
+def _alter_guid_columns(existing_type, type_):
+    for table_name, columns in GUID_COLUMNS.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, existing_type=existing_type, type_=type_)
+
@@ -2,7 +2,20 @@ import os
 import uuid
 from flask import Flask
 from dotenv import load_dotenv
-from .extensions import db, bcrypt, login_manager, migrate
+from .extensions import (
+    db,
+    bcrypt,
+    password_hasher,
+    login_manager,
+    migrate,
+    pdf_cache,
+    fragment_cache,
+    render_pool,
+    instrumentation,
+    prometheus_metrics,
+)
+from .caching import TTLCache
+from . import analytics  # registers the daily_stats counters
 from .models import (
     User,
     BasicInfo,
@@ -14,12 +27,15 @@ from .models import (
     BuiltResume,
     ResumeTheme,
     InviteCode,
+    PdfRenderJob,
+    DailyStats,
 )
 
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 load_dotenv(os.path.join(project_root, ".env"))
 from .config import config_by_env
+from .pooling import engine_options
 
 
 def create_app():
@@ -32,6 +48,7 @@ def create_app():
     )
     flask_env = os.getenv("FLASK_ENV", "development")
     app.config.from_object(config_by_env[flask_env])
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config))
 
     @app.context_processor
     def inject_feature_flags():
@@ -42,13 +59,26 @@ def create_app():
     from .resume_builder_core import resume_bp
     from .admin import admin_bp
     from .job_application_tracker import job_app_tracker_bp
+    from .auth.services import UserIdentityService
 
     db.init_app(app)
     migrate.init_app(app, db)
     bcrypt.init_app(app)
+    password_hasher.init_app(app, bcrypt)
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
     login_manager.login_message_category = "info"
+    pdf_cache.init_app(app)
+    fragment_cache.init_app(app)
+    render_pool.init_app(app)
+    instrumentation.init_app(app)
+    prometheus_metrics.init_app(app)
+    analytics.pending_counts.init_app(app)
+
+    identity_ttl = app.config["USER_IDENTITY_CACHE_TTL"]
+    identity_cache = TTLCache(identity_ttl) if identity_ttl > 0 else None
+    stats_ttl = app.config["USER_STATS_CACHE_TTL"]
+    app.extensions["user_stats_cache"] = TTLCache(stats_ttl) if stats_ttl > 0 else None
 
     @login_manager.user_loader
     def load_user(user_id):
@@ -58,7 +88,7 @@ def create_app():
             uuid.UUID(user_id)
         except ValueError:
             return None
-        return User.query.get(user_id)
+        return UserIdentityService(db.session, identity_cache).load_identity(user_id)
 
     app.register_blueprint(main_bp, url_prefix="")
     app.register_blueprint(auth_bp, url_prefix="/auth")
@@ -81,6 +111,8 @@ def create_app():
             "ResumeTheme": ResumeTheme,
             "BuiltResume": BuiltResume,
             "InviteCode": InviteCode,
+            "PdfRenderJob": PdfRenderJob,
+            "DailyStats": DailyStats,
         }
 
     return app
@@ -1,11 +1,16 @@
 from functools import wraps
-from flask import flash, render_template, url_for, redirect
+from flask import abort, flash, render_template, request, url_for, redirect
 from flask_login import current_user, login_required
 
-from ..models import ResumeTheme, InviteCode, User, BuiltResume
+from ..models import ResumeTheme, InviteCode
 from . import admin_bp
 from .forms import ThemeForm, CreateInviteCodeForm
-from ..extensions import db
+from .services import InvalidCursorError, UserListService
+from ..analytics import DailyStatsService, pending_counts
+from ..extensions import db, instrumentation
+from ..resume_builder_core.pdf_renderer import stylesheets
+
+DASHBOARD_DAYS = 31
 
 
 def admin_required(f):
@@ -30,10 +35,36 @@ def admin_home():
 @login_required
 @admin_required
 def dashboard():
-    total_users = User.get_active_count()
-    total_resumes = BuiltResume.get_active_count()
-    analytics = {"total_resumes": total_resumes, "total_users": total_users}
-    return render_template("/admin/dashboard/dashboard.html", analytics=analytics)
+    # Downloads and logins buffered in this worker show up right away.
+    pending_counts.flush(db.session)
+    db.session.commit()
+    stats_service = DailyStatsService(db.session)
+    series = stats_service.series(days=DASHBOARD_DAYS)
+    month_start = series[-1]["day"].replace(day=1)
+    analytics = stats_service.totals() | {
+        "new_users_this_month": sum(
+            day["signups"] for day in series if day["day"] >= month_start
+        ),
+        "active_users_today": series[-1]["active_users"],
+        "pdfs_downloaded": sum(day["pdfs_downloaded"] for day in series),
+    }
+    return render_template(
+        "/admin/dashboard/dashboard.html",
+        analytics=analytics,
+        series=series,
+        days=DASHBOARD_DAYS,
+    )
+
+
+@admin_bp.route("/performance", methods=["GET"])
+@login_required
+@admin_required
+def performance():
+    return render_template(
+        "/admin/performance/performance.html",
+        endpoints=instrumentation.summary(),
+        slow_request_ms=instrumentation.slow_request_ms,
+    )
 
 
 @admin_bp.route("/list_themes", methods=["GET"])
@@ -73,6 +104,7 @@ def edit_theme(theme_id):
         try:
             form.populate_obj(theme_to_edit)
             db.session.commit()
+            stylesheets.invalidate(theme_to_edit.id)
             flash("Theme updated.", "success")
         except Exception as e:
             flash(f"Error while editing theme: {e}.", "danger")
@@ -89,8 +121,10 @@ def edit_theme(theme_id):
 def delete_theme(theme_id):
     try:
         theme_to_delete = ResumeTheme.query.filter_by(id=theme_id).first_or_404()
+        deleted_theme_id = theme_to_delete.id
         db.session.delete(theme_to_delete)
         db.session.commit()
+        stylesheets.invalidate(deleted_theme_id)
         flash("Theme deleted.", "success")
     except Exception as e:
         flash(f"Error while deleting theme: {e}.", "success")
@@ -141,5 +175,16 @@ def delete_invite_code(code_id):
 @login_required
 @admin_required
 def list_users():
-    users = User.query.all()
-    return render_template("/admin/users/list_users.html", users=users)
+    search = request.args.get("q", "").strip()
+    try:
+        page = UserListService(db.session).get_page(
+            cursor=request.args.get("after"), username_prefix=search
+        )
+    except InvalidCursorError:
+        abort(400)
+    return render_template(
+        "/admin/users/list_users.html",
+        users=page.users,
+        next_cursor=page.next_cursor,
+        search=search,
+    )
@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from datetime import datetime
+import uuid
+
+from sqlalchemy import func, select, tuple_
+
+from ..models import BuiltResume, InviteCode, User
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor can't be decoded."""
+
+
+@dataclass(frozen=True, slots=True)
+class UserRow:
+    id: uuid.UUID
+    username: str
+    is_admin: bool
+    is_active: bool
+    created_at: datetime
+    invite_code: str | None
+    resume_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class UserPage:
+    users: list[UserRow]
+    next_cursor: str | None
+
+
+class UserListService:
+    """
+    Keyset-paginated user listing for the admin panel.
+
+    Pages are ordered newest first on `(created_at, id)`, which the
+    `ix_user_created_at_id` index serves directly, and the cursor is the
+    last row of the previous page. Unlike OFFSET, fetching page N costs the
+    same as fetching page 1.
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    @staticmethod
+    def encode_cursor(row: UserRow) -> str:
+        return f"{row.created_at.isoformat()}_{row.id.hex}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+        try:
+            created_at, user_id = cursor.rsplit("_", 1)
+            return datetime.fromisoformat(created_at), uuid.UUID(user_id)
+        except ValueError:
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+
+    @staticmethod
+    def username_prefix_filter(prefix: str):
+        # A range instead of LIKE 'prefix%', so the username index is usable
+        # regardless of the database's LIKE collation rules.
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return User.username >= prefix, User.username < upper_bound
+
+    def page_statement(
+        self,
+        cursor: str | None = None,
+        username_prefix: str = "",
+        per_page: int | None = None,
+    ):
+        per_page = per_page or self.PAGE_SIZE
+        page = select(
+            User.id, User.username, User.is_admin, User.is_active, User.created_at
+        )
+        if username_prefix:
+            page = page.where(*self.username_prefix_filter(username_prefix))
+        if cursor:
+            page = page.where(
+                tuple_(User.created_at, User.id) < self.decode_cursor(cursor)
+            )
+        # One extra row tells us whether there is a next page.
+        page = (
+            page.order_by(User.created_at.desc(), User.id.desc())
+            .limit(per_page + 1)
+            .subquery("page")
+        )
+
+        resume_counts = (
+            select(BuiltResume.user_id, func.count().label("resume_count"))
+            .where(BuiltResume.user_id.in_(select(page.c.id)))
+            .group_by(BuiltResume.user_id)
+            .subquery("resume_counts")
+        )
+
+        return (
+            select(
+                page.c.id,
+                page.c.username,
+                page.c.is_admin,
+                page.c.is_active,
+                page.c.created_at,
+                InviteCode.code.label("invite_code"),
+                func.coalesce(resume_counts.c.resume_count, 0).label("resume_count"),
+            )
+            .outerjoin(InviteCode, InviteCode.user_id == page.c.id)
+            .outerjoin(resume_counts, resume_counts.c.user_id == page.c.id)
+            .order_by(page.c.created_at.desc(), page.c.id.desc())
+        )
+
+    def get_page(
+        self,
+        cursor: str | None = None,
+        username_prefix: str = "",
+        per_page: int | None = None,
+    ) -> UserPage:
+        per_page = per_page or self.PAGE_SIZE
+        rows = [
+            UserRow(**row._mapping)
+            for row in self.db_session.execute(
+                self.page_statement(cursor, username_prefix, per_page)
+            )
+        ]
+        next_cursor = None
+        if len(rows) > per_page:
+            rows = rows[:per_page]
+            next_cursor = self.encode_cursor(rows[-1])
+        return UserPage(users=rows, next_cursor=next_cursor)
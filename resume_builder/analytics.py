@@ -0,0 +1,262 @@
+"""
+Daily rollups behind the admin dashboard.
+
+Counters in `daily_stats` for user signups/deletions and built resumes are
+bumped by mapper events in the same transaction as the change they count.
+PDF downloads and logins are buffered in `pending_counts` and written in
+batches, keeping those read-only requests free of writes. The dashboard
+then reads one row per day instead of counting the largest tables on every
+load. `flask rollup-stats` rebuilds the user and resume counters from the
+source tables, for backfilling or repairing the last days.
+"""
+
+from collections import Counter, defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+import threading
+from time import monotonic
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .models import BuiltResume, DailyStats, User
+
+COUNTERS = (
+    "signups",
+    "users_deleted",
+    "resumes_built",
+    "resumes_deleted",
+    "pdfs_downloaded",
+    "active_users",
+)
+# Counters `DailyStatsService.rollup` rebuilds from the source tables.
+ROLLED_UP = ("signups", "users_deleted", "resumes_built", "resumes_deleted")
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def upsert_statement(dialect_name: str, day: date, values: dict, increment=True):
+    """
+    INSERT ... ON CONFLICT (day) DO UPDATE for one day's row, either adding
+    `values` to the stored counters or replacing them.
+    """
+    try:
+        insert = _INSERTS[dialect_name]
+    except KeyError:
+        raise NotImplementedError(
+            f"daily_stats upserts are not supported on {dialect_name}"
+        )
+    statement = insert(DailyStats).values(day=day, **values)
+    columns = DailyStats.__table__.c
+    return statement.on_conflict_do_update(
+        index_elements=[columns.day],
+        set_={
+            name: (columns[name] + statement.excluded[name])
+            if increment
+            else statement.excluded[name]
+            for name in values
+        },
+    )
+
+
+def _check_counters(deltas: dict):
+    unknown = set(deltas) - set(COUNTERS)
+    if unknown:
+        raise ValueError(f"Unknown daily_stats counters: {', '.join(sorted(unknown))}")
+
+
+def record(connection, day: date | None = None, **deltas):
+    """Adds `deltas` to the counters of `day` (today by default)."""
+    _check_counters(deltas)
+    connection.execute(
+        upsert_statement(connection.dialect.name, day or today(), deltas)
+    )
+
+
+class PendingCounts:
+    """
+    Counter deltas kept in memory until they are written to daily_stats.
+
+    An upsert per login or download would turn those requests into writes
+    all contending for today's row. Instead, the first `add()` finding the
+    oldest pending delta older than `flush_interval` seconds writes all of
+    them, one upsert per day, in the caller's transaction. Counts still
+    pending in a worker that exits are lost.
+    """
+
+    def __init__(self, flush_interval: float = 60.0):
+        self.flush_interval = flush_interval
+        self._pending = defaultdict(Counter)
+        self._pending_since = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.flush_interval = app.config.get("DAILY_STATS_FLUSH_SECONDS", 60.0)
+
+    def add(self, db_session, day: date | None = None, **deltas) -> bool:
+        """
+        Buffers `deltas` for `day` (today by default) and returns whether
+        everything pending was flushed to `db_session`, which the caller
+        then has to commit.
+        """
+        _check_counters(deltas)
+        with self._lock:
+            self._pending[day or today()].update(deltas)
+            if self._pending_since is None:
+                self._pending_since = monotonic()
+            due = monotonic() - self._pending_since >= self.flush_interval
+        if due:
+            self.flush(db_session)
+        return due
+
+    def flush(self, db_session):
+        """Adds everything pending to daily_stats in `db_session`."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(Counter)
+            self._pending_since = None
+        if not pending:
+            return
+        connection = db_session.connection()
+        for day, deltas in sorted(pending.items()):
+            connection.execute(
+                upsert_statement(connection.dialect.name, day, dict(deltas))
+            )
+
+
+pending_counts = PendingCounts()
+
+
+def record_login(db_session, user: User):
+    """
+    Counts `user` as active today. Only the first login of a day stamps
+    `last_login_at`, so later ones that day write nothing.
+    """
+    now = datetime.now(timezone.utc)
+    if user.last_login_at is None or user.last_login_at.date() != now.date():
+        user.last_login_at = now
+        pending_counts.add(db_session, now.date(), active_users=1)
+
+
+@event.listens_for(User, "after_insert")
+def _count_signup(mapper, connection, target):
+    record(connection, signups=1)
+
+
+@event.listens_for(User, "before_delete")
+def _count_user_deletion(mapper, connection, target):
+    # The user's resumes go with it through ON DELETE CASCADE, which no
+    # mapper event sees, so count them while they still exist.
+    resumes = connection.scalar(
+        select(func.count(BuiltResume.id)).where(BuiltResume.user_id == target.id)
+    )
+    record(connection, users_deleted=1, resumes_deleted=resumes)
+
+
+@event.listens_for(BuiltResume, "after_insert")
+def _count_resume_built(mapper, connection, target):
+    record(connection, resumes_built=1)
+
+
+@event.listens_for(BuiltResume, "after_delete")
+def _count_resume_deletion(mapper, connection, target):
+    record(connection, resumes_deleted=1)
+
+
+class DailyStatsService:
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    def totals(self) -> dict:
+        row = self.db_session.execute(
+            select(
+                func.coalesce(
+                    func.sum(DailyStats.signups - DailyStats.users_deleted), 0
+                ),
+                func.coalesce(
+                    func.sum(DailyStats.resumes_built - DailyStats.resumes_deleted), 0
+                ),
+            )
+        ).one()
+        return {"registered_users": row[0], "total_resumes": row[1]}
+
+    def series(self, days: int = 30, until: date | None = None) -> list[dict]:
+        """
+        Counters for the `days` days up to `until`, oldest first, with zeros
+        for days without a row.
+        """
+        until = until or today()
+        since = until - timedelta(days=days - 1)
+        rows = {
+            stats.day: stats
+            for stats in self.db_session.scalars(
+                select(DailyStats).where(DailyStats.day.between(since, until))
+            )
+        }
+        series = []
+        for offset in range(days):
+            day = since + timedelta(days=offset)
+            stats = rows.get(day)
+            series.append(
+                {"day": day}
+                | {name: getattr(stats, name) if stats else 0 for name in COUNTERS}
+            )
+        return series
+
+    def rollup(self, since: date) -> int:
+        """
+        Rebuilds the user and resume counters from `since` through today from
+        the rows that exist now and returns the number of days written.
+
+        Deleted rows leave nothing to date them by, so each day gets the users
+        and resumes created that day that still exist, and no deletions.
+        Rows created before `since` and deleted since are booked as deletions
+        on `since`, which keeps the totals equal to the rows that exist.
+        """
+        until = today()
+        start = datetime.combine(since, time.min)
+        end = datetime.combine(until + timedelta(days=1), time.min)
+        counted = {}
+        carried = {}
+        for model, created, deleted in (
+            (User, "signups", "users_deleted"),
+            (BuiltResume, "resumes_built", "resumes_deleted"),
+        ):
+            created_on = func.date(model.created_at)
+            statement = (
+                select(created_on, func.count())
+                .where(model.created_at >= start, model.created_at < end)
+                .group_by(created_on)
+            )
+            for day, count in self.db_session.execute(statement):
+                if isinstance(day, str):
+                    day = date.fromisoformat(day)
+                counted.setdefault(day, {})[created] = count
+
+            columns = DailyStats.__table__.c
+            stored_before = self.db_session.scalar(
+                select(
+                    func.coalesce(func.sum(columns[created] - columns[deleted]), 0)
+                ).where(DailyStats.day < since)
+            )
+            existing_before = self.db_session.scalar(
+                select(func.count(model.id)).where(model.created_at < start)
+            )
+            # Days before `since` that were never counted can't be fixed from
+            # here; only rolling them up as well does.
+            carried[deleted] = max(stored_before - existing_before, 0)
+
+        connection = self.db_session.connection()
+        day = since
+        while day <= until:
+            values = dict.fromkeys(ROLLED_UP, 0) | counted.get(day, {})
+            if day == since:
+                values |= carried
+            connection.execute(
+                upsert_statement(connection.dialect.name, day, values, increment=False)
+            )
+            day += timedelta(days=1)
+        self.db_session.commit()
+        return (until - since).days + 1
@@ -13,6 +13,7 @@ from .exceptions import (
     InviteCodeNotFoundError,
 )
 from .. import db
+from ..passwords import PasswordHashingBusyError
 
 
 @auth_bp.route("/register", methods=["GET", "POST"])
@@ -27,6 +28,13 @@ def register():
         except UserAlreadyExistsError:
             flash("Username already taken.", "danger")
             return redirect(url_for("auth.register"))
+        except PasswordHashingBusyError:
+            db.session.rollback()
+            flash("Too many sign-ups right now, please try again.", "danger")
+            return (
+                render_template("auth/register.html", title="Register", form=form),
+                503,
+            )
         else:
             flash("Your account has been created! You can now log in", "success")
             return redirect(url_for("auth.login"))
@@ -51,6 +59,17 @@ def register_with_invite_code():
         except UserAlreadyExistsError:
             flash("Username already taken.", "danger")
             return redirect(url_for("auth.register_with_invite_code"))
+        except PasswordHashingBusyError:
+            db.session.rollback()
+            flash("Too many sign-ups right now, please try again.", "danger")
+            return (
+                render_template(
+                    "auth/register_with_invite_code.html",
+                    title="Register using Invitation Code",
+                    form=form,
+                ),
+                503,
+            )
         else:
             flash("Your account has been created! You can now log in.", "success")
             return redirect(url_for("auth.login"))
@@ -76,6 +95,12 @@ def login():
         except UserNotFoundError:
             flash("No account exists with the provided username.", "danger")
             return render_template("auth/login.html", title="Login", form=form)
+        except PasswordHashingBusyError:
+            flash("Too many logins right now, please try again.", "danger")
+            return (
+                render_template("auth/login.html", title="Login", form=form),
+                503,
+            )
         except Exception as e:
             flash(f"Unexpected Error while trying to log in: {e}")
             return render_template("auth/login.html", title="Login", form=form)
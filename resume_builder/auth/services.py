@@ -1,3 +1,5 @@
+from ..analytics import record_login
+from ..extensions import password_hasher
 from ..models import User, InviteCode
 from .exceptions import (
     UserAlreadyExistsError,
@@ -6,7 +8,8 @@ from .exceptions import (
     InviteCodeNotFoundError,
     InviteCodeRedeemedError,
 )
-from flask_login import login_user
+from flask_login import UserMixin, login_user
+from sqlalchemy import select
 
 
 class AuthenticationService:
@@ -55,7 +58,11 @@ class AuthenticationService:
         user = User.query.filter_by(username=user_credentials.get("username")).first()
         if user:
             if user.check_password(user_credentials.get("password")):
+                if password_hasher.needs_rehash(user.password_hash):
+                    user.set_password(user_credentials.get("password"))
                 login_user(user, remember=user_credentials.get("remember"))
+                record_login(self.db_session, user)
+                self.db_session.commit()
                 return user
             else:
                 raise IncorrectPasswordError("ERROR: Incorrect Password Provided")
@@ -63,3 +70,53 @@ class AuthenticationService:
             raise UserNotFoundError(
                 f"ERROR: No user found with provided username: {user_credentials.get('username')}"
             )
+
+
+class UserIdentity(UserMixin):
+    """
+    Column-only stand-in for `User`, used as `current_user`.
+
+    Carries just what templates and permission checks need, so loading the
+    session user never touches the user's resume collections. Views that need
+    entries query them explicitly by `current_user.id`.
+    """
+
+    def __init__(self, id, username, is_admin, is_active):
+        self.id = id
+        self.username = username
+        self.is_admin = is_admin
+        self._is_active = is_active
+
+    @property
+    def is_active(self):
+        return self._is_active is not False
+
+    def __repr__(self):
+        return f"UserIdentity('{self.username}')"
+
+
+class UserIdentityService:
+    def __init__(self, db_session, identity_cache=None):
+        self.db_session = db_session
+        self.identity_cache = identity_cache
+
+    def load_identity(self, user_id: str) -> UserIdentity | None:
+        """
+        Returns the identity for `user_id` with a single column-only query,
+        or from the per-worker cache when one is configured.
+        """
+        if self.identity_cache is not None:
+            identity = self.identity_cache.get(user_id)
+            if identity is not None:
+                return identity
+        row = self.db_session.execute(
+            select(User.id, User.username, User.is_admin, User.is_active).where(
+                User.id == user_id
+            )
+        ).first()
+        if row is None:
+            return None
+        identity = UserIdentity(row.id, row.username, row.is_admin, row.is_active)
+        if self.identity_cache is not None:
+            self.identity_cache.set(user_id, identity)
+        return identity
@@ -0,0 +1,334 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+def content_key(content: str | bytes) -> str:
+    """Returns a stable hex digest used as a content-addressed cache key."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class NullCache:
+    """Cache backend that never stores anything."""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache for bytes values.
+
+    Entries are evicted least-recently-used first once the total size of
+    stored values exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+            self._entries[key] = value
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+
+    def delete(self, key):
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self.current_bytes -= len(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache whose entries expire `ttl` seconds after
+    being stored. At most `max_entries` are kept; the oldest go first.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileSystemCache:
+    """
+    Directory-backed cache for bytes values, shareable between processes.
+
+    Files are written to a temporary name and atomically renamed into
+    place, so concurrent workers never observe partially written entries.
+    When `max_bytes` is set, the oldest entries are pruned after each write.
+    """
+
+    def __init__(self, directory: str, max_bytes: int | None = None, suffix=""):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{self.suffix}")
+
+    def get(self, key):
+        try:
+            with open(self.path_for(key), "rb") as cached_file:
+                return cached_file.read()
+        except FileNotFoundError:
+            return None
+
+    def open(self, key):
+        """Returns the entry as an open binary file, or None."""
+        try:
+            return open(self.path_for(key), "rb")
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, value):
+        self.set_file(key, io.BytesIO(value))
+
+    def set_file(self, key, value_file):
+        """Stores the rest of `value_file`, copying it in chunks."""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                shutil.copyfileobj(value_file, tmp_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        if self.max_bytes is not None:
+            self._prune()
+
+    def delete(self, key):
+        try:
+            os.unlink(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _prune(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class PdfCache:
+    """
+    Content-addressed cache for generated resume PDFs.
+
+    PDFs are keyed by a hash of the HTML they were rendered from, so an
+    unchanged resume always maps to the same entry and any edit to its
+    content or theme produces a new key. The backend is selected with the
+    `PDF_CACHE_BACKEND` config value: "memory", "filesystem" or "none".
+    """
+
+    def __init__(self, app=None):
+        self.backend = NullCache()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        backend_name = app.config.get("PDF_CACHE_BACKEND", "memory")
+        max_bytes = app.config.get("PDF_CACHE_MAX_BYTES")
+        if backend_name == "memory":
+            self.backend = MemoryCache(max_bytes)
+        elif backend_name == "filesystem":
+            directory = app.config.get("PDF_CACHE_DIR") or os.path.join(
+                app.instance_path, "pdf_cache"
+            )
+            self.backend = FileSystemCache(directory, max_bytes, suffix=".pdf")
+        elif backend_name == "none":
+            self.backend = NullCache()
+        else:
+            raise ValueError(f"Unknown PDF_CACHE_BACKEND: {backend_name}")
+        app.extensions["pdf_cache"] = self
+
+    @staticmethod
+    def key_for(html: str, *versions: str) -> str:
+        """
+        Hashes the document plus the versions of anything rendered with it
+        but not embedded in it, such as an external stylesheet.
+        """
+        return content_key("\0".join((html, *versions)))
+
+    def get(self, key):
+        return self.backend.get(key)
+
+    def set(self, key, pdf):
+        self.backend.set(key, pdf)
+
+    def open(self, key):
+        """
+        Returns the cached PDF as a readable binary file, or None. The
+        filesystem backend hands out the cache file itself, so it can be
+        streamed to the client without being read into memory.
+        """
+        if isinstance(self.backend, FileSystemCache):
+            return self.backend.open(key)
+        pdf = self.backend.get(key)
+        return None if pdf is None else io.BytesIO(pdf)
+
+    def set_file(self, key, pdf_file, size: int):
+        """Stores the `size` bytes left in `pdf_file`."""
+        if isinstance(self.backend, FileSystemCache):
+            self.backend.set_file(key, pdf_file)
+        elif isinstance(self.backend, MemoryCache) and size <= self.backend.max_bytes:
+            self.backend.set(key, pdf_file.read())
+
+    def clear(self):
+        self.backend.clear()
+
+
+class FragmentCache:
+    """
+    Two-tier cache for rendered HTML fragments.
+
+    Fragments are keyed by a name plus a version stamp of everything they
+    were rendered from, so changed sources simply miss and stale entries
+    age out. Each worker keeps an LRU of up to `FRAGMENT_CACHE_MAX_BYTES`;
+    when `FRAGMENT_CACHE_DIR` is set, fragments are also written there and
+    shared between workers and restarts.
+    """
+
+    def __init__(self, app=None):
+        self.memory = NullCache()
+        self.shared = NullCache()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.memory = MemoryCache(app.config.get("FRAGMENT_CACHE_MAX_BYTES", 0))
+        directory = app.config.get("FRAGMENT_CACHE_DIR")
+        if directory:
+            self.shared = FileSystemCache(
+                directory,
+                app.config.get("FRAGMENT_CACHE_DIR_MAX_BYTES"),
+                suffix=".html",
+            )
+        else:
+            self.shared = NullCache()
+        app.extensions["fragment_cache"] = self
+
+    @staticmethod
+    def key_for(name: str, version: str) -> str:
+        return content_key(f"{name}\0{version}")
+
+    def get(self, name: str, version: str) -> str | None:
+        key = self.key_for(name, version)
+        fragment = self.memory.get(key)
+        if fragment is None:
+            fragment = self.shared.get(key)
+            if fragment is None:
+                return None
+            self.memory.set(key, fragment)
+        return fragment.decode("utf-8")
+
+    def set(self, name: str, version: str, fragment: str):
+        key = self.key_for(name, version)
+        fragment = fragment.encode("utf-8")
+        self.memory.set(key, fragment)
+        self.shared.set(key, fragment)
+
+    def clear(self):
+        self.memory.clear()
+        self.shared.clear()
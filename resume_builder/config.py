@@ -6,15 +6,82 @@ class ConfigMissingSecretKey(Exception):
 
 
 class Config:
-    FEATURE_FLAGS = {"registration_enabled": True, "register_with_invite_code": False}
+    FEATURE_FLAGS = {
+        "registration_enabled": True,
+        "register_with_invite_code": False,
+        "async_pdf_rendering": os.getenv("ASYNC_PDF_RENDERING", "False").lower()
+        == "true",
+    }
     TESTING = False
     SQLALCHEMY_DATABASE_URI = os.getenv(
         "SQLALCHEMY_DATABASE_URI", "sqlite:///resume_builder.db"
     )
     SQLALCHEMY_ECHO = os.getenv("SQLALCHEMY_ECHO", False)
+    # Request threads per gunicorn worker, exported by gunicorn.conf.py. Each
+    # worker process has its own connection pool sized from it; 0 pool size
+    # means one connection per thread plus one for render job callbacks.
+    WORKER_THREADS = int(os.getenv("GUNICORN_THREADS", 1))
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 0))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 2))
+    # Seconds a request waits for a free connection before failing.
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    # Connections older than this many seconds are replaced, staying under
+    # server and proxy idle timeouts; pre-ping also catches dropped ones.
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
     SECRET_KEY = os.getenv("SECRET_KEY")
     if not SECRET_KEY:
         raise ConfigMissingSecretKey
+    # "memory" keeps PDFs per worker; "filesystem" shares them across workers.
+    PDF_CACHE_BACKEND = os.getenv("PDF_CACHE_BACKEND", "memory")
+    PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR")
+    # PDFs rendered for a download stay in memory up to this size and are
+    # spooled to a temporary file beyond it.
+    PDF_SPOOL_MAX_MEMORY = int(os.getenv("PDF_SPOOL_MAX_MEMORY", 1024 * 1024))
+    # Rendered resume HTML kept per worker for previews; 0 disables it. With
+    # FRAGMENT_CACHE_DIR set, fragments are shared through that directory too
+    # and it should be cleared when deploying template changes.
+    FRAGMENT_CACHE_MAX_BYTES = int(
+        os.getenv("FRAGMENT_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+    )
+    FRAGMENT_CACHE_DIR = os.getenv("FRAGMENT_CACHE_DIR")
+    FRAGMENT_CACHE_DIR_MAX_BYTES = int(
+        os.getenv("FRAGMENT_CACHE_DIR_MAX_BYTES", 256 * 1024 * 1024)
+    )
+    # Seconds a worker may reuse a loaded session user; 0 disables the cache.
+    USER_IDENTITY_CACHE_TTL = float(os.getenv("USER_IDENTITY_CACHE_TTL", 0))
+    # Seconds a worker may reuse dashboard counts; commits in the same worker
+    # invalidate them immediately, other workers see changes after the TTL.
+    USER_STATS_CACHE_TTL = float(os.getenv("USER_STATS_CACHE_TTL", 0))
+    # Render processes per worker for background PDF jobs; 0 uses every core.
+    PDF_RENDER_POOL_SIZE = int(os.getenv("PDF_RENDER_POOL_SIZE", 0))
+    PDF_RENDER_JOB_DIR = os.getenv("PDF_RENDER_JOB_DIR")
+    # Seconds before a queued render job is given up on, and before jobs and
+    # their PDFs are deleted.
+    PDF_RENDER_JOB_TIMEOUT = float(os.getenv("PDF_RENDER_JOB_TIMEOUT", 300))
+    PDF_RENDER_JOB_TTL = float(os.getenv("PDF_RENDER_JOB_TTL", 3600))
+    # Adds per-request query count and DB time as a Server-Timing header.
+    SERVER_TIMING_HEADER = (
+        os.getenv("SERVER_TIMING_HEADER", "True").lower() == "true"
+    )
+    # Requests slower than this are logged with their slowest queries; 0 disables.
+    SLOW_REQUEST_THRESHOLD_MS = float(os.getenv("SLOW_REQUEST_THRESHOLD_MS", 500))
+    # Recent requests per endpoint kept for the admin performance page.
+    INSTRUMENTATION_SAMPLE_SIZE = int(os.getenv("INSTRUMENTATION_SAMPLE_SIZE", 500))
+    # Bearer token for scraping /metrics; without it only admins can open it.
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+    # A werkzeug method like "scrypt" or "pbkdf2:sha256:600000", or "bcrypt"
+    # with BCRYPT_LOG_ROUNDS. Changing it rehashes passwords on next login.
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt")
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", 12))
+    # Hashes computed at once per worker, and seconds a login may take,
+    # queueing included, before it is turned away.
+    PASSWORD_HASH_CONCURRENCY = int(os.getenv("PASSWORD_HASH_CONCURRENCY", 2))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))
+    # Logins and PDF downloads are counted in memory per worker and written
+    # to the dashboard stats at most this many seconds apart.
+    DAILY_STATS_FLUSH_SECONDS = float(os.getenv("DAILY_STATS_FLUSH_SECONDS", 60))
 
 
 class ProductionConfig(Config):
@@ -47,4 +114,17 @@ class DevelopmentConfig(Config):
     FLASK_DEBUG = os.getenv("FLASK_DEBUG", "True").lower() == "true"
 
 
-config_by_env = {"development": DevelopmentConfig, "production": ProductionConfig}
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.getenv("TEST_DATABASE_URI", "sqlite:///:memory:")
+    WTF_CSRF_ENABLED = False
+    # Cheap hashes keep user fixtures fast; cost doesn't matter in tests.
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    DAILY_STATS_FLUSH_SECONDS = 0
+
+
+config_by_env = {
+    "development": DevelopmentConfig,
+    "production": ProductionConfig,
+    "testing": TestingConfig,
+}
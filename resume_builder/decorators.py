@@ -1,6 +1,20 @@
-from functools import wraps
-from flask import redirect, url_for, flash, current_app
+from functools import cache, wraps
+import os
+
+from flask import (
+    current_app,
+    flash,
+    make_response,
+    redirect,
+    request,
+    session,
+    url_for,
+)
 from flask_login import current_user
+from sqlalchemy import func, select
+
+from .caching import content_key
+from .extensions import db
 
 
 def anonymous_user_required(f):
@@ -26,3 +40,72 @@ def feature_flag_required(flag):
         return decorated_function
 
     return feature_flag_required
+
+
+@cache
+def templates_stamp(template_folder: str) -> str:
+    """Changes whenever a template is edited, so deploys don't serve stale 304s."""
+    stamps = []
+    for root, _, files in os.walk(template_folder):
+        for name in files:
+            path = os.path.join(root, name)
+            relative_path = os.path.relpath(path, template_folder)
+            stamps.append(f"{relative_path}:{os.stat(path).st_mtime}")
+    return content_key("|".join(sorted(stamps)))
+
+
+def conditional_list(model, *aggregates):
+    """
+    Answers GET requests for a list of the current user's `model` entries
+    with 304 Not Modified when nothing in it changed.
+
+    The weak ETag covers the entry count and latest `updated_at` of the
+    user's entries, read in one aggregate query over the `user_id` index,
+    plus any extra `aggregates` for data the page shows from related rows.
+    Pages with pending flash messages are always rendered, since showing
+    them consumes them.
+    """
+
+    def conditional_list(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if (
+                request.method not in ("GET", "HEAD")
+                or not current_user.is_authenticated
+                or "_flashes" in session
+            ):
+                return f(*args, **kwargs)
+
+            state = db.session.execute(
+                select(func.count(), func.max(model.updated_at), *aggregates).where(
+                    model.user_id == current_user.id
+                )
+            ).one()
+            etag = content_key(
+                "|".join(
+                    str(value)
+                    for value in (
+                        request.endpoint,
+                        current_user.id,
+                        current_user.is_admin,
+                        templates_stamp(
+                            os.path.join(
+                                current_app.root_path, current_app.template_folder
+                            )
+                        ),
+                        *state,
+                    )
+                )
+            )
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = "private, no-cache"
+            response.vary.add("Cookie")
+            return response
+
+        return decorated_function
+
+    return conditional_list
@@ -1,10 +1,37 @@
+import sqlite3
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_bcrypt import Bcrypt
 from flask_login import LoginManager
+from .caching import FragmentCache, PdfCache
+from .instrumentation import RequestInstrumentation
+from .metrics import Metrics
+from .passwords import PasswordHasher
+from .render_pool import RenderPool
 
 
 db = SQLAlchemy()
 migrate = Migrate()
 bcrypt = Bcrypt()
+password_hasher = PasswordHasher()
 login_manager = LoginManager()
+pdf_cache = PdfCache()
+fragment_cache = FragmentCache()
+render_pool = RenderPool()
+instrumentation = RequestInstrumentation()
+prometheus_metrics = Metrics()
+
+
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """
+    SQLite ignores foreign keys unless asked to enforce them. The user's
+    collections are not loaded on delete, so `ON DELETE CASCADE` has to run
+    in the database on SQLite just like it does on PostgreSQL.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
@@ -0,0 +1,197 @@
+"""
+Per-request SQL instrumentation.
+
+Every statement executed while handling a request is counted and timed
+through the engine's cursor events. Each response then gets a
+`Server-Timing` header, slow requests are logged with their slowest
+statements, and recent samples per endpoint are kept for the admin
+performance page.
+"""
+
+from collections import defaultdict, deque
+import threading
+import time
+
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from . import metrics
+
+SLOWEST_STATEMENTS = 3
+STATEMENT_PREVIEW_CHARS = 300
+
+
+class RequestQueryStats:
+    """Queries executed while handling one request."""
+
+    __slots__ = ("count", "duration", "slowest")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest = []
+
+    def add(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        if len(self.slowest) < SLOWEST_STATEMENTS or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, statement[:STATEMENT_PREVIEW_CHARS]))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_STATEMENTS:]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of `values`."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class QueryCounter:
+    """
+    Counts the statements executed on `engine` inside a `with` block,
+    whatever request or thread they run on. Used by tests and benchmarks
+    that pin query counts.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __enter__(self):
+        event.listen(self.engine, "after_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "after_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+class RequestInstrumentation:
+    """
+    Flask extension wiring the query counters into the request cycle.
+
+    Samples are kept in memory per worker, the last
+    `INSTRUMENTATION_SAMPLE_SIZE` requests per endpoint.
+    """
+
+    def __init__(self, app=None):
+        self.sample_size = 500
+        self.slow_request_ms = 0.0
+        self.server_timing = False
+        self._samples = defaultdict(self._new_samples)
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.sample_size = app.config.get("INSTRUMENTATION_SAMPLE_SIZE", 500)
+        self.slow_request_ms = app.config.get("SLOW_REQUEST_THRESHOLD_MS", 0)
+        self.server_timing = app.config.get("SERVER_TIMING_HEADER", False)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.extensions["instrumentation"] = self
+
+    def _new_samples(self):
+        return deque(maxlen=self.sample_size)
+
+    def _start_request(self):
+        g.query_stats = RequestQueryStats()
+        g.request_started_at = time.perf_counter()
+
+    def _finish_request(self, response):
+        stats = g.pop("query_stats", None)
+        started_at = g.pop("request_started_at", None)
+        if stats is None or started_at is None:
+            return response
+        total_ms = (time.perf_counter() - started_at) * 1000
+        db_ms = stats.duration * 1000
+        endpoint = request.endpoint or "<unmatched>"
+
+        with self._lock:
+            self._samples[endpoint].append((total_ms, db_ms, stats.count))
+        metrics.observe_request(
+            endpoint, request.method, response.status_code, total_ms / 1000, stats.count
+        )
+
+        if self.server_timing:
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={db_ms:.2f};desc="{stats.count} queries", '
+                f"app;dur={total_ms:.2f}",
+            )
+        if self.slow_request_ms and total_ms >= self.slow_request_ms:
+            current_app.logger.warning(
+                "Slow request %s %s (%s): %.1f ms, %d queries, %.1f ms in db. "
+                "Slowest: %s",
+                request.method,
+                request.path,
+                endpoint,
+                total_ms,
+                stats.count,
+                db_ms,
+                " | ".join(
+                    f"{duration * 1000:.1f} ms {statement}"
+                    for duration, statement in stats.slowest
+                ),
+            )
+        return response
+
+    def summary(self) -> list[dict]:
+        """p50/p95 latency, DB time and query counts per endpoint, slowest first."""
+        with self._lock:
+            samples = {
+                endpoint: list(values) for endpoint, values in self._samples.items()
+            }
+        rows = []
+        for endpoint, values in samples.items():
+            if not values:
+                continue
+            total, db, queries = zip(*values)
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "requests": len(values),
+                    "p50_ms": percentile(total, 0.50),
+                    "p95_ms": percentile(total, 0.95),
+                    "db_p50_ms": percentile(db, 0.50),
+                    "db_p95_ms": percentile(db, 0.95),
+                    "queries_p50": percentile(queries, 0.50),
+                    "queries_p95": percentile(queries, 0.95),
+                }
+            )
+        return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+def _current_stats():
+    return g.get("query_stats") if has_app_context() else None
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats()
+    started = conn.info.get("query_started_at")
+    if stats is not None and started:
+        stats.add(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _drop_query_timer(exception_context):
+    started = exception_context.connection is not None and (
+        exception_context.connection.info.get("query_started_at")
+    )
+    if started:
+        started.pop()
@@ -0,0 +1,145 @@
+"""
+Prometheus metrics, served at /metrics.
+
+When PROMETHEUS_MULTIPROC_DIR is set (gunicorn.conf.py sets it) every
+gunicorn worker and render process writes its samples to files in that
+directory and /metrics merges them, so a single scrape covers the whole
+server rather than whichever worker answered it.
+"""
+
+from contextlib import contextmanager
+import hmac
+import os
+import time
+
+from flask import Response, abort, current_app, request
+from flask_login import current_user
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_DURATION = Histogram(
+    "resume_builder_request_duration_seconds",
+    "Time spent handling a request.",
+    ["endpoint", "method", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "resume_builder_request_db_queries",
+    "SQL statements executed per request.",
+    ["endpoint"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, float("inf")),
+)
+PDF_RENDER_DURATION = Histogram(
+    "resume_builder_pdf_render_duration_seconds",
+    "Time WeasyPrint spends rendering one PDF.",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32, float("inf")),
+)
+PDF_SIZE = Histogram(
+    "resume_builder_pdf_size_bytes",
+    "Size of rendered PDFs.",
+    buckets=(
+        16 * 1024,
+        64 * 1024,
+        256 * 1024,
+        1024 * 1024,
+        4 * 1024 * 1024,
+        16 * 1024 * 1024,
+        float("inf"),
+    ),
+)
+MARKDOWN_RENDER_DURATION = Histogram(
+    "resume_builder_markdown_render_duration_seconds",
+    "Time spent rendering and sanitizing one markdown field.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, float("inf")),
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "resume_builder_password_hash_duration_seconds",
+    "Time spent hashing or verifying a password.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, float("inf")),
+)
+
+DB_POOL_WAIT = Histogram(
+    "resume_builder_db_pool_wait_seconds",
+    "Time spent getting a connection from the pool, including opening new ones.",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, float("inf")),
+)
+DB_POOL_CHECKOUTS = Counter(
+    "resume_builder_db_pool_checkouts",
+    "Connections handed out by the pool.",
+)
+DB_POOL_CONNECTIONS_OPENED = Counter(
+    "resume_builder_db_pool_connections_opened",
+    "New database connections opened by the pool.",
+)
+DB_POOL_TIMEOUTS = Counter(
+    "resume_builder_db_pool_timeouts",
+    "Connection requests that gave up after DB_POOL_TIMEOUT.",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "resume_builder_db_pool_checked_out_connections",
+    "Database connections currently in use.",
+    multiprocess_mode="livesum",
+)
+
+
+@contextmanager
+def timed(histogram, **labels):
+    """Observes the duration of the `with` block on `histogram`."""
+    if labels:
+        histogram = histogram.labels(**labels)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start)
+
+
+def observe_request(endpoint, method, status, duration, queries):
+    REQUEST_DURATION.labels(endpoint, method, status).observe(duration)
+    REQUEST_QUERIES.labels(endpoint).observe(queries)
+
+
+def collect() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+class Metrics:
+    """
+    Registers the /metrics view. Scrapers authenticate with
+    `Authorization: Bearer <METRICS_TOKEN>`; logged in admins can open it
+    in the browser. Without a token only admins get through.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.add_url_rule("/metrics", "metrics", self.metrics_view)
+        app.extensions["metrics"] = self
+
+    @staticmethod
+    def metrics_view():
+        token = current_app.config.get("METRICS_TOKEN")
+        authorization = request.headers.get("Authorization", "")
+        has_token = bool(token) and hmac.compare_digest(
+            authorization.encode(), f"Bearer {token}".encode()
+        )
+        if not has_token and not (
+            current_user.is_authenticated and current_user.is_admin
+        ):
+            abort(403)
+        return Response(collect(), content_type=CONTENT_TYPE_LATEST)
@@ -2,9 +2,18 @@ import uuid
 from datetime import datetime, timezone
 from flask_login import UserMixin
 from sqlalchemy.orm import relationship
-from .extensions import db
-from werkzeug.security import generate_password_hash, check_password_hash
-from sqlalchemy import Table, Column, ForeignKey, TypeDecorator, CHAR, select, func
+from .extensions import db, password_hasher
+from sqlalchemy import (
+    BINARY,
+    CHAR,
+    Column,
+    ForeignKey,
+    LargeBinary,
+    Table,
+    TypeDecorator,
+    func,
+    select,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 
@@ -12,37 +21,110 @@ class GUID(TypeDecorator):
     """
     Platform-independent GUID type.
 
-    Uses PosgreSQL's UUID type, otherwise uses
-    CHAR(32), storing as stringified hex values.
+    Uses PostgreSQL's UUID type, otherwise stores the 16 bytes of the UUID
+    as BINARY(16) (a BLOB on SQLite). `binary=False` is the CHAR(32) hex
+    layout used before migration f6b0e2d4a913, which the migrations
+    preceding it still create.
     """
 
-    impl = CHAR
+    impl = LargeBinary
     cache_ok = True
 
+    def __init__(self, binary=True):
+        super().__init__()
+        self.binary = binary
+
     def load_dialect_impl(self, dialect):
         if dialect.name == "postgresql":
             return dialect.type_descriptor(UUID())
-        else:
+        elif not self.binary:
             return dialect.type_descriptor(CHAR(32))
+        elif dialect.name == "sqlite":
+            return dialect.type_descriptor(LargeBinary())
+        else:
+            return dialect.type_descriptor(BINARY(16))
+
+    def literal_processor(self, dialect):
+        bind = self.bind_processor(dialect)
+
+        if dialect.name == "postgresql":
+            literal = self.load_dialect_impl(dialect).literal_processor(dialect)
+
+            def process(value):
+                return literal(bind(value))
+
+        elif self.binary:
+
+            def process(value):
+                return "X'%s'" % bind(value).hex()
 
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return value
-        elif dialect.name == "postgresql":
-            return str(value)
         else:
-            if not isinstance(value, uuid.UUID):
-                return "%.32x" % uuid.UUID(value).int
-            else:
-                return "%.32x" % value.int
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return value
+
+            def process(value):
+                return "'%s'" % bind(value)
+
+        return process
+
+    def bind_processor(self, dialect):
+        """
+        The UUID the ORM almost always passes is converted without any
+        parsing; strings, e.g. ids from URLs, are still validated.
+        PostgreSQL drivers take the UUID itself.
+        """
+        UUID_ = uuid.UUID
+
+        if dialect.name == "postgresql":
+
+            def process(value):
+                if value is None or value.__class__ is UUID_:
+                    return value
+                return value if isinstance(value, UUID_) else UUID_(value)
+
+        elif self.binary:
+
+            def process(value):
+                if value.__class__ is UUID_:
+                    return value.bytes
+                elif value is None or value.__class__ is bytes and len(value) == 16:
+                    return value
+                return (value if isinstance(value, UUID_) else UUID_(value)).bytes
+
         else:
-            if not isinstance(value, uuid.UUID):
-                value = uuid.UUID(value)
-            return value
+
+            def process(value):
+                if value.__class__ is UUID_:
+                    return value.hex
+                elif value is None:
+                    return value
+                return (value if isinstance(value, UUID_) else UUID_(value)).hex
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        UUID_ = uuid.UUID
+
+        if dialect.name == "postgresql":
+
+            def process(value):
+                if value is None or isinstance(value, UUID_):
+                    return value
+                return UUID_(value)
+
+        elif self.binary:
+
+            def process(value):
+                if value is None:
+                    return value
+                return UUID_(bytes=value)
+
+        else:
+
+            def process(value):
+                if value is None:
+                    return value
+                return UUID_(value)
+
+        return process
 
 
 class TimeStampMixin:
@@ -66,34 +148,34 @@ built_resume_experience = Table(
     "built_resume_experience",
     db.Model.metadata,
     Column("built_resume_id", GUID(), ForeignKey("built_resume.id", ondelete="CASCADE"), primary_key=True),
-    Column("experience_id", GUID(), ForeignKey("experience.id", ondelete="CASCADE"), primary_key=True),
+    Column("experience_id", GUID(), ForeignKey("experience.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 built_resume_education = Table(
     "built_resume_education",
     db.Model.metadata,
     Column("built_resume_id", GUID(), ForeignKey("built_resume.id", ondelete="CASCADE"), primary_key=True),
-    Column("education_id", GUID(), ForeignKey("education.id", ondelete="CASCADE"), primary_key=True),
+    Column("education_id", GUID(), ForeignKey("education.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 built_resume_skills = Table(
     "built_resume_skills",
     db.Model.metadata,
     Column("built_resume_id", GUID(), ForeignKey("built_resume.id", ondelete="CASCADE"), primary_key=True),
-    Column("skills_id", GUID(), ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True),
+    Column("skills_id", GUID(), ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 built_resume_language = Table(
     "built_resume_language",
     db.Model.metadata,
     Column("built_resume_id", GUID(), ForeignKey("built_resume.id", ondelete="CASCADE"), primary_key=True),
-    Column("language_id", GUID(), ForeignKey("language.id", ondelete="CASCADE"), primary_key=True),
+    Column("language_id", GUID(), ForeignKey("language.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 
 class InviteCode(db.Model, TimeStampMixin):
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
-    code = db.Column(db.String(100), nullable=False)
+    code = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text, nullable=False)
     redeemed = db.Column(db.Boolean, nullable=False, default=False)
     user_id = db.Column(
@@ -117,53 +199,54 @@ class User(db.Model, UserMixin, TimeStampMixin):
     password_hash = db.Column(db.String(), nullable=False)
     is_admin = db.Column(db.Boolean, nullable=False, default=False)
     is_active = db.Column(db.Boolean, default=True)
+    last_login_at = db.Column(db.DateTime, nullable=True)
 
     basic_infos = db.relationship(
         "BasicInfo",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     summaries = db.relationship(
         "Summary",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     experiences = db.relationship(
         "Experience",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     education = db.relationship(
         "Education",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     skills = db.relationship(
         "Skills",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     languages = db.relationship(
         "Language",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     resumes = db.relationship(
         "BuiltResume",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -172,20 +255,21 @@ class User(db.Model, UserMixin, TimeStampMixin):
     job_applications = db.relationship(
         "JobApplication",
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
         passive_deletes=True
     )
 
     __table_args__ = (
         db.UniqueConstraint('username', name='_user_username_uc'),
+        db.Index('ix_user_created_at_id', 'created_at', 'id'),
     )
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password) -> bool:
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
 
     @classmethod
     def get_active_count(cls):
@@ -220,6 +304,8 @@ class BasicInfo(db.Model, EntryTitleMixin, TimeStampMixin):
 class Summary(db.Model, EntryTitleMixin, TimeStampMixin):
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
     content = db.Column(db.Text, nullable=True, default="")
+    content_html = db.Column(db.Text, nullable=True)
+    content_hash = db.Column(db.String(64), nullable=True)
 
     user_id = db.Column(GUID(), db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     user = db.relationship("User", back_populates="summaries")
@@ -238,6 +324,8 @@ class Experience(db.Model, EntryTitleMixin, TimeStampMixin):
     date_started = db.Column(db.Date, nullable=False)
     date_finished = db.Column(db.Date, nullable=True)
     description = db.Column(db.Text, nullable=True, default="")
+    description_html = db.Column(db.Text, nullable=True)
+    description_hash = db.Column(db.String(64), nullable=True)
 
     user_id = db.Column(GUID(), db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     user = db.relationship("User", back_populates="experiences")
@@ -281,6 +369,8 @@ class Skills(db.Model, EntryTitleMixin, TimeStampMixin):
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
     skill_group_title = db.Column(db.String(128))
     description = db.Column(db.Text, nullable=False)
+    description_html = db.Column(db.Text, nullable=True)
+    description_hash = db.Column(db.String(64), nullable=True)
 
     user_id = db.Column(GUID(), db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     user = db.relationship("User", back_populates="skills")
@@ -330,14 +420,20 @@ class ResumeTheme(db.Model, TimeStampMixin):
 
 class BuiltResume(db.Model, EntryTitleMixin, TimeStampMixin):
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
+    # Bumped whenever anything the resume renders changes, see
+    # resume_builder_core/content_version.py.
+    content_version = db.Column(
+        db.Integer, nullable=False, default=1, server_default="1"
+    )
 
     basic_info_id = db.Column(
         GUID(),
         db.ForeignKey("basic_info.id", ondelete="RESTRICT"),
-        nullable=False
+        nullable=False,
+        index=True,
     )
-    summary_id = db.Column(GUID(), db.ForeignKey("summary.id", ondelete="RESTRICT"), nullable=False)
-    theme_id = db.Column(GUID(), db.ForeignKey("resume_theme.id", ondelete="RESTRICT"), nullable=False)
+    summary_id = db.Column(GUID(), db.ForeignKey("summary.id", ondelete="RESTRICT"), nullable=False, index=True)
+    theme_id = db.Column(GUID(), db.ForeignKey("resume_theme.id", ondelete="RESTRICT"), nullable=False, index=True)
 
     basic_info = relationship("BasicInfo", back_populates="built_resumes")
     summary = relationship("Summary", back_populates="built_resumes")
@@ -375,6 +471,37 @@ class BuiltResume(db.Model, EntryTitleMixin, TimeStampMixin):
         return db.session.scalar(count_stmt)
 
 
+class PdfRenderJob(db.Model, TimeStampMixin):
+    """A background PDF render of a BuiltResume, see `RenderJobService`."""
+
+    QUEUED = "queued"
+    DONE = "done"
+    FAILED = "failed"
+
+    id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
+    status = db.Column(db.String(20), nullable=False, default=QUEUED)
+    cache_key = db.Column(db.String(64), nullable=False)
+    error = db.Column(db.Text, nullable=True)
+
+    built_resume_id = db.Column(
+        GUID(),
+        db.ForeignKey("built_resume.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    built_resume = relationship("BuiltResume")
+
+    user_id = db.Column(
+        GUID(),
+        db.ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self):
+        return f"PdfRenderJob({self.id}: {self.status})"
+
+
 class ApplicationStage(db.Model, TimeStampMixin):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
@@ -404,16 +531,36 @@ class JobApplication(db.Model, TimeStampMixin):
     application_stage_id = db.Column(
         db.Integer, 
         db.ForeignKey("application_stage.id", ondelete="RESTRICT"), 
-        nullable=False
+        nullable=False,
+        index=True,
     )
     stage = relationship("ApplicationStage", back_populates="job_applications")
 
     user_id = db.Column(
         GUID(), 
         db.ForeignKey("user.id", ondelete="CASCADE"), 
-        nullable=False
+        nullable=False,
+        index=True,
     )
     user = relationship("User", back_populates="job_applications")
 
     def __repr__(self):
         return f"JobApplication({self.job_title} @{self.company_name})"
+
+
+class DailyStats(db.Model):
+    """
+    One row of admin dashboard counters per UTC day, maintained
+    incrementally by `resume_builder.analytics`.
+    """
+
+    day = db.Column(db.Date, primary_key=True)
+    signups = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    users_deleted = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    resumes_built = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    resumes_deleted = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    pdfs_downloaded = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    active_users = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"DailyStats('{self.day}')"
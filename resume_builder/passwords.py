@@ -0,0 +1,112 @@
+"""
+Password hashing.
+
+The algorithm and its cost are set per environment with
+`PASSWORD_HASH_METHOD`: any werkzeug method such as "scrypt",
+"scrypt:16384:8:1" or "pbkdf2:sha256:600000", or "bcrypt" with its cost in
+`BCRYPT_LOG_ROUNDS`. Hashes made with other settings still verify, and
+`AuthenticationService.login` rehashes them with the current ones.
+
+Hashing runs on a small thread pool per worker, at most
+`PASSWORD_HASH_CONCURRENCY` at a time. scrypt, PBKDF2 and bcrypt release
+the GIL, so the pool hashes in parallel, while a burst of logins can only
+occupy that many cores and leaves the worker's other request threads free.
+Hashes that don't complete within `PASSWORD_HASH_TIMEOUT`, queueing
+included, fail with `PasswordHashingBusyError` instead of piling up.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from functools import cached_property
+import threading
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from . import metrics
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when a hash doesn't complete within PASSWORD_HASH_TIMEOUT."""
+
+
+class PasswordHasher:
+    def __init__(self, app=None):
+        self.method = "scrypt"
+        self.concurrency = 2
+        self.timeout = None
+        self.bcrypt = None
+        self.bcrypt_rounds = 12
+        self._executor = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, bcrypt=None):
+        self.method = app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+        self.concurrency = app.config.get("PASSWORD_HASH_CONCURRENCY", 2)
+        self.timeout = app.config.get("PASSWORD_HASH_TIMEOUT")
+        self.bcrypt = bcrypt
+        self.bcrypt_rounds = app.config.get("BCRYPT_LOG_ROUNDS", 12)
+        if self.method == "bcrypt" and bcrypt is None:
+            raise ValueError('PASSWORD_HASH_METHOD "bcrypt" needs Flask-Bcrypt')
+        self.__dict__.pop("method_prefix", None)
+        app.extensions["password_hasher"] = self
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", self._hash, password)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        return self._run("verify", self._verify, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether `password_hash` was made with other settings than the current."""
+        if self.method == "bcrypt":
+            return not password_hash.startswith(self.method_prefix)
+        return password_hash.split("$", 1)[0] != self.method_prefix
+
+    @cached_property
+    def method_prefix(self) -> str:
+        if self.method == "bcrypt":
+            return f"$2b${self.bcrypt_rounds:02d}$"
+        # Werkzeug fills in the default cost of methods given without one,
+        # so compare against the prefix of a real hash.
+        return generate_password_hash("", self.method).split("$", 1)[0]
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _hash(self, password):
+        if self.method == "bcrypt":
+            return self.bcrypt.generate_password_hash(password).decode("utf-8")
+        return generate_password_hash(password, self.method)
+
+    def _verify(self, password_hash, password):
+        if password_hash.startswith("$2"):
+            if self.bcrypt is None:
+                return False
+            return self.bcrypt.check_password_hash(password_hash, password)
+        return check_password_hash(password_hash, password)
+
+    def _run(self, operation, fn, *args):
+        def timed_call():
+            with metrics.timed(metrics.PASSWORD_HASH_DURATION, operation=operation):
+                return fn(*args)
+
+        future = self._get_executor().submit(timed_call)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise PasswordHashingBusyError(
+                f"Password hashing did not complete within {self.timeout}s"
+            )
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency, thread_name_prefix="password-hash"
+                )
+            return self._executor
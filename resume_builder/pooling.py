@@ -0,0 +1,65 @@
+"""
+Database connection pool settings and metrics.
+
+Every gunicorn worker is a separate process with its own pool, so pools are
+sized for one worker from its thread count. Waits for a connection,
+timeouts, checkouts and connections opened and in use are exported to
+Prometheus, which makes pool exhaustion visible before requests start
+failing.
+"""
+
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import Pool, QueuePool
+
+from . import metrics
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool timing how long each `connect()` waits for a connection."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            metrics.DB_POOL_WAIT.observe(time.perf_counter() - start)
+
+
+def engine_options(config) -> dict:
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for the configured database. SQLite keeps
+    SQLAlchemy's defaults, which are tailored to file and memory databases.
+    """
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    if url.get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config["DB_POOL_SIZE"] or config["WORKER_THREADS"] + 1,
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    }
+
+
+@event.listens_for(Pool, "connect")
+def _count_connect(dbapi_connection, connection_record):
+    metrics.DB_POOL_CONNECTIONS_OPENED.inc()
+
+
+@event.listens_for(Pool, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    metrics.DB_POOL_CHECKOUTS.inc()
+    metrics.DB_POOL_CHECKED_OUT.inc()
+
+
+@event.listens_for(Pool, "checkin")
+def _count_checkin(dbapi_connection, connection_record):
+    metrics.DB_POOL_CHECKED_OUT.dec()
@@ -0,0 +1,95 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class RenderPool:
+    """
+    Lazily started process pool for CPU-bound rendering.
+
+    Each gunicorn worker gets its own pool of `PDF_RENDER_POOL_SIZE`
+    processes (defaults to the number of cores). Processes are spawned
+    rather than forked so they never inherit the worker's open database
+    connections or threads.
+
+    Callbacks passed to `submit` run on a dedicated completion thread. The
+    executor would call them on its management thread, which then couldn't
+    hand out work or collect results while a callback waits on the
+    database or the disk.
+    """
+
+    def __init__(self, app=None):
+        self.max_workers = None
+        self._executor = None
+        self._completions = None
+        self._completion_thread = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.max_workers = app.config.get("PDF_RENDER_POOL_SIZE") or os.cpu_count()
+        app.extensions["render_pool"] = self
+
+    def submit(self, fn, *args, callback=None):
+        """
+        Runs `fn(*args)` in the pool. `callback(future)` is called on the
+        completion thread once it is done.
+        """
+        future = self._get_executor().submit(fn, *args)
+        if callback is not None:
+            completions = self._get_completions()
+            future.add_done_callback(lambda done: completions.put((callback, done)))
+        return future
+
+    def map(self, fn, *iterables):
+        return self._get_executor().map(fn, *iterables)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=not wait)
+                self._executor = None
+            if self._completion_thread is not None:
+                self._completions.put(None)
+                if wait:
+                    self._completion_thread.join()
+                self._completions = self._completion_thread = None
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                atexit.register(self.shutdown)
+            return self._executor
+
+    def _get_completions(self):
+        with self._lock:
+            if self._completion_thread is None:
+                self._completions = queue.SimpleQueue()
+                self._completion_thread = threading.Thread(
+                    target=self._run_completions,
+                    args=(self._completions,),
+                    name="render-pool-completions",
+                    daemon=True,
+                )
+                self._completion_thread.start()
+            return self._completions
+
+    @staticmethod
+    def _run_completions(completions):
+        while (item := completions.get()) is not None:
+            callback, future = item
+            try:
+                callback(future)
+            except Exception:
+                logger.exception("Render pool callback %r failed", callback)
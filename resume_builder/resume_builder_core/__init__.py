@@ -2,4 +2,4 @@ from flask import Blueprint
 
 resume_bp = Blueprint("resume", __name__)
 
-from . import routes
+from . import content_version, markdown_fields, routes
@@ -0,0 +1,134 @@
+"""
+Bulk export of a user's resumes as one ZIP of PDFs.
+
+PDFs already in the cache are reused and the rest are rendered in
+parallel on the render pool, at most a pool's worth at a time: the next
+render is only submitted once a finished one has been written out. The
+archive is written to the response as each PDF becomes available, so a
+slow client holds up rendering instead of finished PDFs piling up in the
+worker's memory.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass
+import io
+import re
+import zipfile
+
+from flask import current_app
+
+from ..extensions import pdf_cache, render_pool
+from .pdf_renderer import render_pdf, theme_stamp
+
+
+@dataclass(frozen=True, slots=True)
+class ExportDocument:
+    filename: str
+    html: str
+    theme: object
+
+
+class _ChunkWriter(io.RawIOBase):
+    """
+    Write-only, unseekable file object that collects whatever zipfile
+    writes until it is drained into the response.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def export_filename(title: str, taken: set) -> str:
+    """A filesystem-safe `<title>.pdf` that is not in `taken` yet."""
+    stem = re.sub(r"[^\w.-]+", "_", title).strip("._") or "resume"
+    filename, suffix = f"{stem}.pdf", 2
+    while filename in taken:
+        filename, suffix = f"{stem}_{suffix}.pdf", suffix + 1
+    taken.add(filename)
+    return filename
+
+
+def stream_pdf_zip(documents: list[ExportDocument], window: int | None = None):
+    """
+    Yields a ZIP archive containing one PDF per document. PDFs are stored
+    uncompressed since they are compressed already. Documents that fail to
+    render are listed in an `errors.txt` entry instead of aborting the
+    download halfway through. At most `window` renders (the render pool's
+    size by default) are in flight or waiting to be written at once.
+    """
+    window = window or render_pool.max_workers or 1
+    misses, cached = deque(), []
+    for document in documents:
+        cache_key = pdf_cache.key_for(document.html, theme_stamp(document.theme))
+        if pdf_cache.get(cache_key) is None:
+            misses.append((document, cache_key))
+        else:
+            cached.append((document, cache_key))
+
+    pending = {}
+
+    def submit_next():
+        if misses:
+            document, cache_key = misses.popleft()
+            future = render_pool.submit(render_pdf, document.html, document.theme)
+            pending[future] = (document, cache_key)
+
+    for _ in range(window):
+        submit_next()
+
+    output = _ChunkWriter()
+    failed = []
+    try:
+        with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+            # Cached PDFs are fetched again one at a time while the pool works on
+            # the misses, rather than all being held in memory up front.
+            for document, cache_key in cached:
+                pdf = pdf_cache.get(cache_key)
+                if pdf is None:  # evicted in the meantime
+                    pdf = render_pdf(document.html, document.theme)
+                archive.writestr(document.filename, pdf)
+                yield output.drain()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    document, cache_key = pending.pop(future)
+                    try:
+                        pdf = future.result()
+                    except Exception:
+                        current_app.logger.exception(
+                            "Rendering %s for export failed", document.filename
+                        )
+                        failed.append(document.filename)
+                        submit_next()
+                        continue
+                    pdf_cache.set(cache_key, pdf)
+                    archive.writestr(document.filename, pdf)
+                    # Keep the pool busy while the client reads this entry.
+                    submit_next()
+                    yield output.drain()
+
+            if failed:
+                archive.writestr(
+                    "errors.txt",
+                    "These resumes could not be rendered:\n"
+                    + "".join(f"{filename}\n" for filename in failed),
+                )
+        yield output.drain()
+    finally:
+        # Only left over when the client disconnected mid-download.
+        for future in pending:
+            future.cancel()
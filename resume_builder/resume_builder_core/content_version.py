@@ -0,0 +1,85 @@
+"""
+Keeps `BuiltResume.content_version` current.
+
+Every flush that changes something a resume renders bumps the version of
+each resume using it: changes to the resume's own columns or linked
+collections, and updates or deletions of its basic info, summary, theme or
+any linked experience, education, skill or language. Caches and ETags
+derived from a resume are then validated with one primary-key read.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from ..models import (
+    BasicInfo,
+    BuiltResume,
+    Education,
+    Experience,
+    Language,
+    ResumeTheme,
+    Skills,
+    Summary,
+    built_resume_education,
+    built_resume_experience,
+    built_resume_language,
+    built_resume_skills,
+)
+
+_resumes = BuiltResume.__table__
+
+# entry model -> indexed column linking it to the resumes using it
+DEPENDENCIES = {
+    BasicInfo: _resumes.c.basic_info_id,
+    Summary: _resumes.c.summary_id,
+    ResumeTheme: _resumes.c.theme_id,
+    Experience: built_resume_experience.c.experience_id,
+    Education: built_resume_education.c.education_id,
+    Skills: built_resume_skills.c.skills_id,
+    Language: built_resume_language.c.language_id,
+}
+
+
+def dependent_resumes(model, entry_ids):
+    """WHERE clause matching the resumes that render any of `entry_ids`."""
+    column = DEPENDENCIES[model]
+    if column.table is _resumes:
+        return column.in_(entry_ids)
+    return _resumes.c.id.in_(
+        select(column.table.c.built_resume_id).where(column.in_(entry_ids))
+    )
+
+
+def resumes_using(db_session, entry) -> list:
+    """Ids of the resumes rendering `entry`, e.g. every resume with an Experience."""
+    return list(
+        db_session.scalars(
+            select(_resumes.c.id).where(dependent_resumes(type(entry), [entry.id]))
+        )
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def bump_content_versions(session, flush_context, instances):
+    changed = defaultdict(set)
+    for instance in session.deleted:
+        if type(instance) in DEPENDENCIES:
+            changed[type(instance)].add(instance.id)
+    for instance in session.dirty:
+        if type(instance) in DEPENDENCIES:
+            if session.is_modified(instance, include_collections=False):
+                changed[type(instance)].add(instance.id)
+        elif isinstance(instance, BuiltResume) and session.is_modified(instance):
+            instance.content_version = BuiltResume.content_version + 1
+
+    # Runs before the changes themselves are flushed, while the association
+    # rows of deleted entries still exist.
+    connection = session.connection() if changed else None
+    for model, entry_ids in changed.items():
+        connection.execute(
+            update(_resumes)
+            .where(dependent_resumes(model, entry_ids))
+            .values(content_version=_resumes.c.content_version + 1)
+        )
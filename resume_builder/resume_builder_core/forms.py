@@ -111,3 +111,7 @@ class BuildResumeForm(FlaskForm):
     languages = MutiCheckboxField("Languages", validators=[DataRequired()])
 
     submit = SubmitField("Generate Resume")
+
+
+class RenderJobForm(FlaskForm):
+    """Carries only the CSRF token for queueing a background PDF render."""
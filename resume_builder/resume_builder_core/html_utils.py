@@ -1,5 +1,11 @@
+from functools import lru_cache
+import threading
+
 import markdown
 import bleach
+from bleach.linkifier import LinkifyFilter
+
+from .. import metrics
 
 
 EXTRA_TAGS = {"p", "pre", "span", "h1", "h2", "h3", "h4", "h5", "h6", "code"}
@@ -11,12 +17,50 @@ ALLOWED_ATTRIBUTES = {
     "code": ["class"],
     "pre": ["class"],
 }
+MARKDOWN_EXTENSIONS = ["fenced_code", "codehilite"]  # Highlighting enabled
+RENDER_CACHE_SIZE = 512
+
+
+class MarkdownRenderer:
+    """
+    Markdown -> sanitized, linkified HTML.
+
+    Building a `markdown.Markdown` loads its extensions (and Pygments for
+    codehilite), so each thread keeps its own Markdown and Cleaner and
+    reuses them; neither is safe to share between threads. Linkifying runs
+    as a filter of the Cleaner, so the HTML is only parsed once.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _pipeline(self):
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None:
+            pipeline = (
+                markdown.Markdown(extensions=MARKDOWN_EXTENSIONS),
+                bleach.Cleaner(
+                    tags=ALLOWED_TAGS,
+                    attributes=ALLOWED_ATTRIBUTES,
+                    filters=[LinkifyFilter],
+                ),
+            )
+            self._local.pipeline = pipeline
+        return pipeline
+
+    def render(self, raw_text):
+        md, cleaner = self._pipeline()
+        with metrics.timed(metrics.MARKDOWN_RENDER_DURATION):
+            try:
+                html = md.convert(raw_text)
+            finally:
+                md.reset()
+            return cleaner.clean(html)
+
+
+renderer = MarkdownRenderer()
 
 
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
 def render_markdown(raw_text):
-    html = markdown.markdown(
-        raw_text,
-        extensions=["fenced_code", "codehilite"],  # Highlighting enabled
-    )
-    clean_html = bleach.clean(html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES)
-    return bleach.linkify(clean_html)
+    return renderer.render(raw_text)
@@ -0,0 +1,50 @@
+"""
+Keeps the rendered HTML of markdown columns in sync with their source.
+
+Every insert and update of a model listed in MARKDOWN_FIELDS passes through
+`sync_rendered_markdown`, which renders `<field>` into `<field>_html` and
+records the source hash in `<field>_hash`. Rendering only happens when the
+hash changes, so read paths (preview, PDF) just output the stored HTML.
+"""
+
+from sqlalchemy import event
+
+from ..caching import content_key
+from ..models import Experience, Skills, Summary
+from .html_utils import render_markdown
+
+
+# model -> {source field: render inline (without the wrapping <p>)}
+MARKDOWN_FIELDS = {
+    Experience: {"description": False},
+    Summary: {"content": False},
+    Skills: {"description": True},
+}
+
+
+def render_source(source: str | None, inline: bool = False) -> tuple[str, str]:
+    """Returns the sanitized HTML and the hash for a markdown source."""
+    source = source or ""
+    html = render_markdown(source)
+    if inline and html.startswith("<p>") and html.endswith("</p>") and html.count("<p>") == 1:
+        html = html[3:-4]
+    return html, content_key(source)
+
+
+def sync_rendered_markdown(entry):
+    for field, inline in MARKDOWN_FIELDS[type(entry)].items():
+        source_hash = content_key(getattr(entry, field) or "")
+        if getattr(entry, f"{field}_hash") == source_hash:
+            continue
+        html, source_hash = render_source(getattr(entry, field), inline)
+        setattr(entry, f"{field}_html", html)
+        setattr(entry, f"{field}_hash", source_hash)
+
+
+def _sync_before_write(mapper, connection, target):
+    sync_rendered_markdown(target)
+
+
+for _model in MARKDOWN_FIELDS:
+    event.listen(_model, "before_insert", _sync_before_write)
+    event.listen(_model, "before_update", _sync_before_write)
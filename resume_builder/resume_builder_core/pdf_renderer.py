@@ -0,0 +1,119 @@
+"""
+PDF rendering entry point.
+
+WeasyPrint pulls in Pango, Cairo and fontTools bindings, which takes
+longer to import than the rest of the app combined. It is imported on the
+first render instead of at module import, so workers, CLI commands and
+tests that never produce a PDF don't pay for it.
+"""
+
+from collections import OrderedDict
+import threading
+
+from .. import metrics
+
+STYLESHEET_CACHE_SIZE = 32
+
+
+def theme_stamp(theme) -> str:
+    """Identifies one version of a theme's styles."""
+    return f"{theme.id}:{theme.updated_at.isoformat()}"
+
+
+class StylesheetCache:
+    """
+    Compiled theme stylesheets, keyed by theme id and `updated_at`.
+
+    Each entry holds a parsed `weasyprint.CSS` and the `FontConfiguration`
+    its @font-face rules were registered with, so every PDF using the same
+    theme version skips tokenising and parsing the CSS. Neither is safe to
+    share between threads, so each thread keeps its own entries, like the
+    markdown renderer does; pool workers fill their own copy too.
+    Invalidations are recorded with a shared generation number, and each
+    thread drops the affected entries the next time it uses the cache.
+    """
+
+    def __init__(self, max_entries=STYLESHEET_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._generation = 0
+        self._cleared_at = 0
+        self._invalidated_at = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def get(self, theme):
+        """Returns `(css, font_config)` for `theme`, compiling it on first use."""
+        entries = self._entries()
+        key = (theme.id, theme.updated_at)
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+            return entry
+
+        from weasyprint import CSS
+        from weasyprint.text.fonts import FontConfiguration
+
+        font_config = FontConfiguration()
+        entry = (CSS(string=theme.styles or "", font_config=font_config), font_config)
+        for stale in [stale for stale in entries if stale[0] == theme.id]:
+            del entries[stale]
+        entries[key] = entry
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, theme_id):
+        """Drops every compiled version of a theme, in every thread."""
+        with self._lock:
+            self._generation += 1
+            self._invalidated_at[theme_id] = self._generation
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = self._generation
+
+    def __len__(self):
+        return len(self._entries())
+
+    def _entries(self) -> OrderedDict:
+        """This thread's entries, minus those invalidated since its last use."""
+        local = self._local
+        seen = getattr(local, "generation", None)
+        if seen == self._generation:
+            return local.entries
+        with self._lock:
+            if seen is None or seen < self._cleared_at:
+                local.entries = OrderedDict()
+            else:
+                for key in [
+                    key
+                    for key in local.entries
+                    if self._invalidated_at.get(key[0], 0) > seen
+                ]:
+                    del local.entries[key]
+            local.generation = self._generation
+        return local.entries
+
+
+stylesheets = StylesheetCache()
+
+
+def render_pdf(html: str, theme=None, target=None) -> bytes | None:
+    """
+    Renders a complete HTML document to PDF. When `theme` is given its
+    styles are applied from the stylesheet cache, so `html` should not embed
+    them again. With a binary file `target` the PDF is written there and
+    None is returned, otherwise the PDF bytes are.
+    """
+    from weasyprint import HTML
+
+    start = target.tell() if target is not None else 0
+    with metrics.timed(metrics.PDF_RENDER_DURATION):
+        options = {}
+        if theme is not None:
+            css, font_config = stylesheets.get(theme)
+            options = {"stylesheets": [css], "font_config": font_config}
+        pdf = HTML(string=html).write_pdf(target, **options)
+    metrics.PDF_SIZE.observe(len(pdf) if target is None else target.tell() - start)
+    return pdf
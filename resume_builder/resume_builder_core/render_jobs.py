@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta, timezone
+import os
+import time
+import uuid
+
+from flask import current_app
+from sqlalchemy import delete
+
+from ..extensions import db, pdf_cache, render_pool
+from ..models import PdfRenderJob
+from .exceptions import EntryNotFoundError
+from .pdf_renderer import render_pdf, theme_stamp
+
+
+class RenderJobService:
+    """
+    Queues resume PDFs for rendering in the background process pool.
+
+    Job state lives in the `pdf_render_job` table and rendered PDFs are
+    written to `PDF_RENDER_JOB_DIR`, so any worker can answer status polls
+    and serve the result, whichever worker rendered it. PDFs already in the
+    PdfCache are served from there instead.
+
+    A job still queued after `PDF_RENDER_JOB_TIMEOUT` seconds is failed,
+    since the worker rendering it has most likely died. Jobs and their
+    files are deleted `PDF_RENDER_JOB_TTL` seconds after they were queued.
+    """
+
+    TIMED_OUT = "PDF generation took too long, please try again."
+    RENDER_FAILED = "PDF generation failed, please try again."
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    @staticmethod
+    def output_dir() -> str:
+        return current_app.config.get("PDF_RENDER_JOB_DIR") or os.path.join(
+            current_app.instance_path, "render_jobs"
+        )
+
+    @classmethod
+    def output_path(cls, job: PdfRenderJob) -> str:
+        return os.path.join(cls.output_dir(), f"{job.id.hex}.pdf")
+
+    def enqueue(self, resume_id, user_id, html: str, theme=None) -> PdfRenderJob:
+        """
+        Creates a job for rendering `html` with `theme` and submits it to the
+        pool. When the PDF is already cached the job is completed straight away.
+        """
+        self.expire_jobs()
+        versions = (theme_stamp(theme),) if theme is not None else ()
+        cache_key = pdf_cache.key_for(html, *versions)
+        job = PdfRenderJob(
+            built_resume_id=resume_id, user_id=user_id, cache_key=cache_key
+        )
+        self.db_session.add(job)
+        self.db_session.flush()
+
+        if pdf_cache.get(cache_key) is not None:
+            job.status = PdfRenderJob.DONE
+            self.db_session.commit()
+            return job
+
+        job_id = job.id
+        self.db_session.commit()
+        app = current_app._get_current_object()
+        render_pool.submit(
+            render_pdf,
+            html,
+            theme,
+            callback=lambda done: self._complete(app, job_id, cache_key, done),
+        )
+        return job
+
+    def get_job(self, job_id: str, user_id) -> PdfRenderJob:
+        try:
+            job_id = uuid.UUID(job_id)
+        except ValueError:
+            raise EntryNotFoundError("No render job found for provided id.")
+        job = PdfRenderJob.query.filter_by(id=job_id, user_id=user_id).first()
+        if not job:
+            raise EntryNotFoundError("No render job found for provided id.")
+        if job.status == PdfRenderJob.QUEUED and self._queued_before(
+            job, self._cutoff("PDF_RENDER_JOB_TIMEOUT")
+        ):
+            job.status = PdfRenderJob.FAILED
+            job.error = self.TIMED_OUT
+            self.db_session.commit()
+        return job
+
+    def open_output(self, job: PdfRenderJob):
+        """
+        The finished PDF of `job` as a readable binary file, from the job's
+        output file or else the PdfCache, or None when it is gone from both.
+        """
+        try:
+            return open(self.output_path(job), "rb")
+        except FileNotFoundError:
+            return pdf_cache.open(job.cache_key)
+
+    def expire_jobs(self):
+        """
+        Deletes jobs queued more than `PDF_RENDER_JOB_TTL` seconds ago, and
+        output files as old, including those of jobs deleted along with
+        their resume. The caller commits.
+        """
+        cutoff = self._cutoff("PDF_RENDER_JOB_TTL")
+        self.db_session.execute(
+            delete(PdfRenderJob).where(PdfRenderJob.created_at < cutoff)
+        )
+        try:
+            entries = list(os.scandir(self.output_dir()))
+        except FileNotFoundError:
+            return
+        oldest = time.time() - current_app.config["PDF_RENDER_JOB_TTL"]
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < oldest:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _cutoff(setting: str) -> datetime:
+        # created_at is stored as naive UTC.
+        return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            seconds=current_app.config[setting]
+        )
+
+    @staticmethod
+    def _queued_before(job: PdfRenderJob, cutoff: datetime) -> bool:
+        created_at = job.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return created_at < cutoff
+
+    def _store_output(self, job: PdfRenderJob, pdf: bytes):
+        os.makedirs(self.output_dir(), exist_ok=True)
+        with open(self.output_path(job), "wb") as output_file:
+            output_file.write(pdf)
+        job.status = PdfRenderJob.DONE
+        job.error = None
+
+    @classmethod
+    def _complete(cls, app, job_id, cache_key, future):
+        # Runs on the render pool's completion thread, outside of any request.
+        with app.app_context():
+            try:
+                job = db.session.get(PdfRenderJob, job_id)
+                if job is None:
+                    return
+                try:
+                    pdf = future.result()
+                except Exception:
+                    app.logger.exception("Render job %s failed", job_id)
+                    job.status = PdfRenderJob.FAILED
+                    job.error = cls.RENDER_FAILED
+                else:
+                    pdf_cache.set(cache_key, pdf)
+                    cls(db.session)._store_output(job, pdf)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                app.logger.exception("Failed to record result of render job %s", job_id)
+            finally:
+                db.session.remove()
@@ -0,0 +1,152 @@
+"""
+Immutable snapshots of a BuiltResume and everything it links to.
+
+Templates render these instead of ORM objects, so rendering can never
+trigger a lazy load and a snapshot can be handed to other threads or
+processes safely.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+import uuid
+
+
+@dataclass(frozen=True, slots=True)
+class RenderBasicInfo:
+    full_name: str
+    job_title: str
+    address: str
+    contact_email: str
+    contact_phone: str
+    linkedin_url: str | None
+    github_url: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderSummary:
+    content: str | None
+    content_html: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderTheme:
+    id: uuid.UUID
+    name: str
+    styles: str
+    updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class RenderExperience:
+    entry_title: str
+    job_title: str
+    company_name: str
+    date_started: date
+    date_finished: date | None
+    description: str | None
+    description_html: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderEducation:
+    entry_title: str
+    degree_name: str
+    school_name: str
+    date_started: date
+    date_finished: date | None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderSkill:
+    entry_title: str
+    skill_group_title: str | None
+    description: str
+    description_html: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderLanguage:
+    entry_title: str
+    name: str
+    proficiency: str
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeRenderModel:
+    id: uuid.UUID
+    entry_title: str
+    basic_info: RenderBasicInfo
+    summary: RenderSummary
+    theme: RenderTheme
+    experience: tuple[RenderExperience, ...]
+    education: tuple[RenderEducation, ...]
+    skills: tuple[RenderSkill, ...]
+    languages: tuple[RenderLanguage, ...]
+
+    @classmethod
+    def from_resume(cls, resume) -> "ResumeRenderModel":
+        """Copies a fully loaded BuiltResume into an immutable snapshot."""
+        basic_info = resume.basic_info
+        theme = resume.theme
+        return cls(
+            id=resume.id,
+            entry_title=resume.entry_title,
+            basic_info=RenderBasicInfo(
+                full_name=basic_info.full_name,
+                job_title=basic_info.job_title,
+                address=basic_info.address,
+                contact_email=basic_info.contact_email,
+                contact_phone=basic_info.contact_phone,
+                linkedin_url=basic_info.linkedin_url,
+                github_url=basic_info.github_url,
+            ),
+            summary=RenderSummary(
+                content=resume.summary.content,
+                content_html=resume.summary.content_html,
+            ),
+            theme=RenderTheme(
+                id=theme.id,
+                name=theme.name,
+                styles=theme.styles,
+                updated_at=theme.updated_at,
+            ),
+            experience=tuple(
+                RenderExperience(
+                    entry_title=exp.entry_title,
+                    job_title=exp.job_title,
+                    company_name=exp.company_name,
+                    date_started=exp.date_started,
+                    date_finished=exp.date_finished,
+                    description=exp.description,
+                    description_html=exp.description_html,
+                )
+                for exp in resume.experience
+            ),
+            education=tuple(
+                RenderEducation(
+                    entry_title=edu.entry_title,
+                    degree_name=edu.degree_name,
+                    school_name=edu.school_name,
+                    date_started=edu.date_started,
+                    date_finished=edu.date_finished,
+                )
+                for edu in resume.education
+            ),
+            skills=tuple(
+                RenderSkill(
+                    entry_title=skill.entry_title,
+                    skill_group_title=skill.skill_group_title,
+                    description=skill.description,
+                    description_html=skill.description_html,
+                )
+                for skill in resume.skills
+            ),
+            languages=tuple(
+                RenderLanguage(
+                    entry_title=lang.entry_title,
+                    name=lang.name,
+                    proficiency=lang.proficiency,
+                )
+                for lang in resume.languages
+            ),
+        )
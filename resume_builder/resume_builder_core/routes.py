@@ -1,6 +1,7 @@
+import os
+import tempfile
 import uuid
 
-from weasyprint import HTML
 from .forms import (
     BasicInfoForm,
     EducationForm,
@@ -9,42 +10,67 @@ from .forms import (
     SummaryForm,
     LanguageForm,
     BuildResumeForm,
+    RenderJobForm,
+)
+from .bulk_export import ExportDocument, export_filename, stream_pdf_zip
+from .pdf_renderer import render_pdf, theme_stamp
+from .render_jobs import RenderJobService
+from .services import (
+    BasicInfoService,
+    ResumeAssemblyService,
+    UserStatsService,
+    entry_choices,
 )
-from .services import BasicInfoService
 from .exceptions import AuthorizationError, EntryNotFoundError
 from . import resume_bp
-from flask import flash, redirect, render_template, url_for, Response, request, abort
+from flask import (
+    abort,
+    current_app,
+    flash,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    Response,
+    send_file,
+    stream_with_context,
+    url_for,
+)
 from flask_login import login_required, current_user
+from sqlalchemy import func
 from ..models import (
+    BasicInfo,
     BuiltResume,
     Education,
     Language,
+    PdfRenderJob,
     ResumeTheme,
     Summary,
     Experience,
     Skills,
 )
 from .. import db
+from ..analytics import pending_counts
+from ..decorators import conditional_list, feature_flag_required
+from ..extensions import fragment_cache, pdf_cache
 from werkzeug.exceptions import NotFound
 
 
 @login_required
 @resume_bp.route("/", methods=["GET", "POST"])
 def home():
-    basic_info_count = len(current_user.basic_infos)
-    summary_count = len(current_user.summaries)
-    experience_count = len(current_user.experiences)
-    education_count = len(current_user.education)
-    skill_count = len(current_user.skills)
-    language_count = len(current_user.languages)
+    counts = UserStatsService(
+        db.session, current_app.extensions.get("user_stats_cache")
+    ).get_counts(current_user.id)
     return render_template(
         "resume_core/home.html",
-        basic_info_count=basic_info_count,
-        summary_count=summary_count,
-        experience_count=experience_count,
-        education_count=education_count,
-        skill_count=skill_count,
-        language_count=language_count,
+        basic_info_count=counts["basic_info"],
+        summary_count=counts["summary"],
+        experience_count=counts["experience"],
+        education_count=counts["education"],
+        skill_count=counts["skills"],
+        language_count=counts["language"],
+        resume_count=counts["resume"],
     )
 
 
@@ -59,6 +85,7 @@ def home():
 
 @login_required
 @resume_bp.route("/basic_info_list", methods=["GET", "POST"])
+@conditional_list(BasicInfo)
 def list_basic_info():
     users_basic_info = BasicInfoService(db.session).get_basic_infos_by_user_id(
         current_user.id
@@ -163,6 +190,7 @@ def delete_basic_info(info_id):
 
 @login_required
 @resume_bp.route("/summary_list", methods=["GET", "POST"])
+@conditional_list(Summary)
 def list_summary():
     summaries = Summary.query.filter_by(user_id=current_user.id).all()
     return render_template("resume_core/summary/list_summary.html", summaries=summaries)
@@ -267,6 +295,7 @@ def delete_summary(summary_id):
 
 @login_required
 @resume_bp.route("/experience_list", methods=["GET", "POST"])
+@conditional_list(Experience)
 def list_experience():
     experiences = Experience.query.filter_by(user_id=current_user.id).all()
     return render_template(
@@ -286,11 +315,8 @@ def create_experience():
     if form.validate_on_submit():
         print("Form submitted for validation")
         try:
-            from .html_utils import render_markdown
-
             new_experience = Experience()
             form.populate_obj(new_experience)
-            new_experience.description = render_markdown(form.description.data)
             new_experience.user_id = current_user.id
             db.session.add(new_experience)
             db.session.commit()
@@ -381,6 +407,7 @@ def delete_experience(experience_id):
 
 @login_required
 @resume_bp.route("/education_list", methods=["GET", "POST"])
+@conditional_list(Education)
 def list_education():
     educations = Education.query.filter_by(user_id=current_user.id).all()
     return render_template(
@@ -471,6 +498,7 @@ def delete_education(education_id):
 
 @login_required
 @resume_bp.route("/skills_list", methods=["GET", "POST"])
+@conditional_list(Skills)
 def list_skills():
     skills = Skills.query.filter_by(user_id=current_user.id).all()
     return render_template("resume_core/skills/list_skills.html", skills=skills)
@@ -548,6 +576,7 @@ def delete_skills(skills_id):
 
 @login_required
 @resume_bp.route("/languages_list", methods=["GET"])
+@conditional_list(Language)
 def list_languages():
     languages = Language.query.filter_by(user_id=current_user.id)
     return render_template(
@@ -636,6 +665,8 @@ def delete_language(language_id):
 
 @login_required
 @resume_bp.route("/list_resume", methods=["GET", "POST"])
+# Theme names shown on the list change content_version, not updated_at.
+@conditional_list(BuiltResume, func.sum(BuiltResume.content_version))
 def list_resume():
     resumes = BuiltResume.query.filter_by(user_id=current_user.id).all()
     return render_template("resume_core/build_resume/list_resume.html", resumes=resumes)
@@ -652,24 +683,12 @@ def build_resume():
     form = BuildResumeForm()
     themes = ResumeTheme.query.all()
 
-    form.basic_info.choices = [
-        (info.id, info.entry_title) for info in current_user.basic_infos
-    ]
-    form.summary.choices = [
-        (summary.id, summary.entry_title) for summary in current_user.summaries
-    ]
-    form.experience.choices = [
-        (exp.id, exp.entry_title) for exp in current_user.experiences
-    ]
-    form.education.choices = [
-        (edu.id, edu.entry_title) for edu in current_user.education
-    ]
-    form.skills.choices = [
-        (skill.id, skill.entry_title) for skill in current_user.skills
-    ]
-    form.languages.choices = [
-        (lang.id, lang.entry_title) for lang in current_user.languages
-    ]
+    form.basic_info.choices = entry_choices(BasicInfo, current_user.id)
+    form.summary.choices = entry_choices(Summary, current_user.id)
+    form.experience.choices = entry_choices(Experience, current_user.id)
+    form.education.choices = entry_choices(Education, current_user.id)
+    form.skills.choices = entry_choices(Skills, current_user.id)
+    form.languages.choices = entry_choices(Language, current_user.id)
     form.theme.choices = [(theme.id, theme.name) for theme in themes]
 
     if form.validate_on_submit():
@@ -717,24 +736,12 @@ def edit_resume(resume_id):
     themes = ResumeTheme.query.all()
 
     # --- Populate choices using STRINGS for the IDs ---
-    form.basic_info.choices = [
-        (str(info.id), info.entry_title) for info in current_user.basic_infos
-    ]
-    form.summary.choices = [
-        (str(summary.id), summary.entry_title) for summary in current_user.summaries
-    ]
-    form.experience.choices = [
-        (str(exp.id), exp.entry_title) for exp in current_user.experiences
-    ]
-    form.education.choices = [
-        (str(edu.id), edu.entry_title) for edu in current_user.education
-    ]
-    form.skills.choices = [
-        (str(skill.id), skill.entry_title) for skill in current_user.skills
-    ]
-    form.languages.choices = [
-        (str(lang.id), lang.entry_title) for lang in current_user.languages
-    ]
+    form.basic_info.choices = entry_choices(BasicInfo, current_user.id, str)
+    form.summary.choices = entry_choices(Summary, current_user.id, str)
+    form.experience.choices = entry_choices(Experience, current_user.id, str)
+    form.education.choices = entry_choices(Education, current_user.id, str)
+    form.skills.choices = entry_choices(Skills, current_user.id, str)
+    form.languages.choices = entry_choices(Language, current_user.id, str)
     form.theme.choices = [(str(theme.id), theme.name) for theme in themes]
 
     if form.validate_on_submit():
@@ -805,6 +812,18 @@ def delete_resume(resume_id):
         return redirect(url_for("resume.list_resume"))
 
 
+def render_resume_html(resume, embed_styles=True) -> str:
+    """
+    Renders the standalone resume document used for previews and PDFs.
+    PDFs pass `embed_styles=False` and get the theme from the stylesheet cache.
+    """
+    return render_template(
+        "resume_core/build_resume/resume_pdf.html",
+        resume=resume,
+        theme=resume.theme if embed_styles else None,
+    )
+
+
 #####################
 ## RESUME: PREVIEW ##
 #####################
@@ -813,18 +832,25 @@ def delete_resume(resume_id):
 @login_required
 @resume_bp.route("resumes/<string:resume_id>/preview", methods=["GET"])
 def preview_resume(resume_id):
-    resume_to_preview = BuiltResume.query.filter_by(
-        id=resume_id, user_id=current_user.id
-    ).first_or_404()
-    preview_html = render_template(
-        "resume_core/build_resume/resume_pdf.html",
-        resume=resume_to_preview,
-        theme=resume_to_preview.theme,
-    )
+    service = ResumeAssemblyService(db.session)
+    try:
+        # A single query tells whether the cached HTML is still current;
+        # the resume is only loaded and rendered when it isn't.
+        version = service.get_version(resume_id, current_user.id)
+        fragment_name = f"resume_html:{version.id.hex}"
+        resume_html = fragment_cache.get(fragment_name, version.stamp)
+        if resume_html is None:
+            resume_html = render_resume_html(
+                service.load_for_render(resume_id, current_user.id)
+            )
+            fragment_cache.set(fragment_name, version.stamp, resume_html)
+    except EntryNotFoundError:
+        abort(404)
     return render_template(
         "resume_core/build_resume/preview_resume.html",
-        resume=resume_to_preview,
-        resume_html=preview_html,
+        resume=version,
+        resume_html=resume_html,
+        render_job_form=RenderJobForm(),
     )
 
 
@@ -836,19 +862,169 @@ def preview_resume(resume_id):
 @login_required
 @resume_bp.route("/resume/<string:resume_id>/download", methods=["GET"])
 def download_resume(resume_id):
-    resume_to_generate = BuiltResume.query.filter_by(
-        id=resume_id, user_id=current_user.id
-    ).first_or_404()
-    html = render_template(
-        "resume_core/build_resume/resume_pdf.html",
-        resume=resume_to_generate,
-        theme=resume_to_generate.theme,
+    try:
+        resume_to_generate = ResumeAssemblyService(db.session).load_for_render(
+            resume_id, current_user.id
+        )
+    except EntryNotFoundError:
+        abort(404)
+    theme = resume_to_generate.theme
+    html = render_resume_html(resume_to_generate, embed_styles=False)
+    # The rendered HTML covers every entry and the stamp covers the theme
+    # styles, so together they identify the PDF exactly and double as a
+    # strong ETag.
+    cache_key = pdf_cache.key_for(html, theme_stamp(theme))
+    if request.if_none_match.contains(cache_key):
+        response = Response(status=304)
+        response.set_etag(cache_key)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+
+    pdf_file = pdf_cache.open(cache_key)
+    if pdf_file is None:
+        pdf_file = tempfile.SpooledTemporaryFile(
+            max_size=current_app.config["PDF_SPOOL_MAX_MEMORY"]
+        )
+        render_pdf(html, theme, target=pdf_file)
+        size = pdf_file.tell()
+        pdf_file.seek(0)
+        pdf_cache.set_file(cache_key, pdf_file, size)
+        pdf_file.seek(0)
+    response = send_pdf(
+        pdf_file,
+        f"{resume_to_generate.entry_title.replace(' ', '_')}.pdf",
+        cache_key,
+    )
+    # Range requests resuming a download don't count as another one.
+    if response.status_code == 200:
+        if pending_counts.add(db.session, pdfs_downloaded=1):
+            db.session.commit()
+    return response
+
+
+def send_pdf(pdf_file, download_name: str, etag: str) -> Response:
+    """
+    Streams a PDF from an open, seekable file with a Content-Length,
+    conditional GET and byte range support.
+    """
+    size = pdf_file.seek(0, os.SEEK_END)
+    pdf_file.seek(0)
+    response = send_file(
+        pdf_file,
+        mimetype="application/pdf",
+        as_attachment=True,
+        download_name=download_name,
+        etag=etag,
+        conditional=False,
     )
-    pdf = HTML(string=html).write_pdf()
+    response.content_length = size
+    response.accept_ranges = "bytes"
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request, accept_ranges=True, complete_length=size)
+
+
+@resume_bp.route("/resumes/export", methods=["GET"])
+@login_required
+def export_resumes():
+    """Downloads every resume of the current user as a ZIP of PDFs."""
+    resumes = ResumeAssemblyService(db.session).load_all_for_render(current_user.id)
+    if not resumes:
+        abort(404)
+    taken = set()
+    documents = [
+        ExportDocument(
+            filename=export_filename(resume.entry_title, taken),
+            html=render_resume_html(resume, embed_styles=False),
+            theme=resume.theme,
+        )
+        for resume in resumes
+    ]
+    if pending_counts.add(db.session, pdfs_downloaded=len(documents)):
+        db.session.commit()
     return Response(
-        pdf,
+        stream_with_context(stream_pdf_zip(documents)),
+        mimetype="application/zip",
+        headers={"Content-Disposition": "attachment;filename=resumes.zip"},
+    )
+
+
+######################################
+## RESUME: BACKGROUND PDF RENDERING ##
+######################################
+
+
+def render_job_payload(job: PdfRenderJob) -> dict:
+    payload = {
+        "id": str(job.id),
+        "status": job.status,
+        "resume_id": str(job.built_resume_id),
+        "status_url": url_for("resume.render_job_status", job_id=job.id),
+        "error": job.error,
+    }
+    if job.status == PdfRenderJob.DONE:
+        payload["pdf_url"] = url_for("resume.download_render_job", job_id=job.id)
+    return payload
+
+
+@resume_bp.route("/resumes/<string:resume_id>/render_jobs", methods=["POST"])
+@login_required
+@feature_flag_required("async_pdf_rendering")
+def enqueue_render_job(resume_id):
+    """
+    Queues a PDF render and returns immediately with the job's status URL.
+    """
+    form = RenderJobForm()
+    if not form.validate_on_submit():
+        abort(400)
+    try:
+        resume_to_render = ResumeAssemblyService(db.session).load_for_render(
+            resume_id, current_user.id
+        )
+    except EntryNotFoundError:
+        abort(404)
+    job = RenderJobService(db.session).enqueue(
+        resume_to_render.id,
+        current_user.id,
+        render_resume_html(resume_to_render, embed_styles=False),
+        resume_to_render.theme,
+    )
+    return jsonify(render_job_payload(job)), 202
+
+
+@resume_bp.route("/render_jobs/<string:job_id>", methods=["GET"])
+@login_required
+@feature_flag_required("async_pdf_rendering")
+def render_job_status(job_id):
+    try:
+        job = RenderJobService(db.session).get_job(job_id, current_user.id)
+    except EntryNotFoundError:
+        abort(404)
+    return jsonify(render_job_payload(job))
+
+
+@resume_bp.route("/render_jobs/<string:job_id>/pdf", methods=["GET"])
+@login_required
+@feature_flag_required("async_pdf_rendering")
+def download_render_job(job_id):
+    service = RenderJobService(db.session)
+    try:
+        job = service.get_job(job_id, current_user.id)
+    except EntryNotFoundError:
+        abort(404)
+    if job.status != PdfRenderJob.DONE:
+        abort(409)
+    pdf_file = service.open_output(job)
+    if pdf_file is None:
+        # Cached PDFs can be evicted, or live in another worker's memory.
+        return redirect(
+            url_for("resume.download_resume", resume_id=job.built_resume_id)
+        )
+    if pending_counts.add(db.session, pdfs_downloaded=1):
+        db.session.commit()
+    return send_file(
+        pdf_file,
         mimetype="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment;filename={resume_to_generate.entry_title.replace(' ', '_')}"
-        },
+        as_attachment=True,
+        download_name=f"{job.built_resume.entry_title.replace(' ', '_')}.pdf",
+        etag=job.cache_key,
     )
@@ -1,5 +1,22 @@
-from ..models import BasicInfo
+from dataclasses import dataclass
+import uuid
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, func, literal, select, union_all
+from sqlalchemy.orm import Session, joinedload, selectinload
+from ..extensions import db
+from ..models import (
+    BasicInfo,
+    BuiltResume,
+    Education,
+    Experience,
+    JobApplication,
+    Language,
+    Skills,
+    Summary,
+)
 from .exceptions import AuthorizationError, EntryNotFoundError
+from .render_models import ResumeRenderModel
 
 
 class BasicInfoService:
@@ -59,3 +76,167 @@ class BasicInfoService:
             raise AuthorizationError("You are not authorized to delete this entry.")
         self.db_session.delete(basic_info_to_delete)
         self.db_session.commit()
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeVersion:
+    id: uuid.UUID
+    entry_title: str
+    stamp: str
+
+
+class ResumeAssemblyService:
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    def get_version(self, resume_id: str, user_id) -> ResumeVersion:
+        """
+        Returns a stamp that changes whenever anything the resume renders
+        changes, read from its `content_version` by primary key.
+        """
+        try:
+            resume_id = uuid.UUID(str(resume_id))
+        except ValueError:
+            raise EntryNotFoundError("No resume found for provided id.")
+        row = self.db_session.execute(
+            select(
+                BuiltResume.id, BuiltResume.entry_title, BuiltResume.content_version
+            ).where(BuiltResume.id == resume_id, BuiltResume.user_id == user_id)
+        ).first()
+        if row is None:
+            raise EntryNotFoundError("No resume found for provided id.")
+        return ResumeVersion(
+            id=row.id, entry_title=row.entry_title, stamp=str(row.content_version)
+        )
+
+    def load_for_render(self, resume_id: str, user_id) -> ResumeRenderModel:
+        """
+        Loads a resume and everything it renders in a fixed number of
+        queries: one for the resume joined with its basic info, summary and
+        theme, and one per linked collection.
+        """
+        try:
+            resume_id = uuid.UUID(str(resume_id))
+        except ValueError:
+            raise EntryNotFoundError("No resume found for provided id.")
+        resume_stmt = self._render_statement().where(
+            BuiltResume.id == resume_id, BuiltResume.user_id == user_id
+        )
+        resume = self.db_session.scalars(resume_stmt).unique().first()
+        if not resume:
+            raise EntryNotFoundError("No resume found for provided id.")
+        return ResumeRenderModel.from_resume(resume)
+
+    def load_all_for_render(self, user_id) -> list[ResumeRenderModel]:
+        """
+        Loads every resume of a user for rendering, in the same number of
+        queries as a single one.
+        """
+        resume_stmt = (
+            self._render_statement()
+            .where(BuiltResume.user_id == user_id)
+            .order_by(BuiltResume.entry_title)
+        )
+        return [
+            ResumeRenderModel.from_resume(resume)
+            for resume in self.db_session.scalars(resume_stmt).unique()
+        ]
+
+    @staticmethod
+    def _render_statement():
+        return select(BuiltResume).options(
+            joinedload(BuiltResume.basic_info, innerjoin=True),
+            joinedload(BuiltResume.summary, innerjoin=True),
+            joinedload(BuiltResume.theme, innerjoin=True),
+            selectinload(BuiltResume.experience),
+            selectinload(BuiltResume.education),
+            selectinload(BuiltResume.skills),
+            selectinload(BuiltResume.languages),
+        )
+
+
+def entry_choices(model, user_id, id_type=None) -> list[tuple]:
+    """
+    Returns `(id, entry_title)` pairs of the user's entries of `model`,
+    selecting only those two columns. Pass `id_type=str` for form fields
+    that compare choices as strings.
+    """
+    rows = db.session.execute(
+        select(model.id, model.entry_title).where(model.user_id == user_id)
+    )
+    if id_type is None:
+        return [(row.id, row.entry_title) for row in rows]
+    return [(id_type(row.id), row.entry_title) for row in rows]
+
+
+class UserStatsService:
+    """
+    Counts a user's entries per section with a single UNION ALL query.
+
+    When a `stats_cache` is given, counts are cached per user and dropped
+    whenever a transaction that creates or deletes one of the user's
+    entries commits.
+    """
+
+    SECTIONS = {
+        "basic_info": BasicInfo,
+        "summary": Summary,
+        "experience": Experience,
+        "education": Education,
+        "skills": Skills,
+        "language": Language,
+        "resume": BuiltResume,
+        "job_application": JobApplication,
+    }
+
+    def __init__(self, db_session, stats_cache=None):
+        self.db_session = db_session
+        self.stats_cache = stats_cache
+
+    def get_counts(self, user_id) -> dict[str, int]:
+        if self.stats_cache is not None:
+            counts = self.stats_cache.get(str(user_id))
+            if counts is not None:
+                return counts
+        count_stmt = self.count_statement(user_id)
+        counts = {row.section: row.total for row in self.db_session.execute(count_stmt)}
+        if self.stats_cache is not None:
+            self.stats_cache.set(str(user_id), counts)
+        return counts
+
+    def count_statement(self, user_id):
+        return union_all(
+            *(
+                select(literal(section).label("section"), func.count().label("total"))
+                .select_from(model)
+                .where(model.user_id == user_id)
+                for section, model in self.SECTIONS.items()
+            )
+        )
+
+
+_COUNTED_MODELS = tuple(UserStatsService.SECTIONS.values())
+
+
+@event.listens_for(Session, "after_flush")
+def collect_user_stats_changes(session, flush_context):
+    changed = session.info.setdefault("user_stats_changed", set())
+    for instance in (*session.new, *session.deleted):
+        if isinstance(instance, _COUNTED_MODELS) and instance.user_id is not None:
+            changed.add(str(instance.user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_user_stats(session):
+    changed = session.info.pop("user_stats_changed", None)
+    if not changed or not has_app_context():
+        return
+    stats_cache = current_app.extensions.get("user_stats_cache")
+    if stats_cache is not None:
+        for user_id in changed:
+            stats_cache.delete(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_user_stats_changes(session):
+    session.info.pop("user_stats_changed", None)
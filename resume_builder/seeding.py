@@ -0,0 +1,324 @@
+"""
+Synthetic datasets for load and scaling tests, behind `flask seed`.
+
+Rows are generated from a seeded `random.Random`, ids included, so the same
+options produce the same dataset (with dates relative to the day it runs).
+They are written with executemany
+INSERTs, one statement per table per batch of users, which skips the ORM
+unit of work. Whatever the mapper events would have filled in is computed
+here instead: rendered markdown columns, `content_version`, and the
+`daily_stats` counters, which are rolled up from the seeded rows at the end.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import random
+import uuid
+
+from sqlalchemy import func, insert, select
+
+from .analytics import DailyStatsService, today
+from .extensions import password_hasher
+from .models import (
+    ApplicationStage,
+    BasicInfo,
+    BuiltResume,
+    Education,
+    Experience,
+    JobApplication,
+    Language,
+    ResumeTheme,
+    Skills,
+    Summary,
+    User,
+    built_resume_education,
+    built_resume_experience,
+    built_resume_language,
+    built_resume_skills,
+)
+from .resume_builder_core.markdown_fields import render_source
+
+STAGES = ("Applied", "Interviewing", "Offer", "Rejected")
+JOB_TITLES = ("Backend Developer", "Data Engineer", "Frontend Developer", "SRE")
+COMPANIES = ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries")
+SCHOOLS = ("State University", "Technical College", "Open University")
+LANGUAGES = ("English", "German", "Spanish", "Serbian", "French")
+PROFICIENCIES = ("A2", "B1", "B2", "C1", "C2", "Native")
+EXPERIENCE_DESCRIPTIONS = (
+    "Built and ran **payment** services handling 2k requests/s.\n\n"
+    "- Cut p95 latency by 40%\n- Mentored two engineers",
+    "Migrated batch jobs to *event-driven* workers. See https://example.com",
+    "Maintained the public API and its `OpenAPI` documentation.",
+)
+SUMMARIES = (
+    "Engineer with a focus on **reliable** backend systems.",
+    "Developer who enjoys turning slow pages into fast ones.",
+)
+SKILL_DESCRIPTIONS = ("Python, Flask, SQLAlchemy", "PostgreSQL, **Redis**", "Docker, CI")
+THEME_STYLES = "body { font-family: sans-serif; } h1 { color: #%06x; }"
+
+# BuiltResume collection -> (association table, entry column)
+LINKS = {
+    "experience": (built_resume_experience, "experience_id"),
+    "education": (built_resume_education, "education_id"),
+    "skills": (built_resume_skills, "skills_id"),
+    "languages": (built_resume_language, "language_id"),
+}
+
+
+@dataclass
+class SeedOptions:
+    users: int = 100
+    basic_infos: int = 1
+    summaries: int = 1
+    experiences: int = 3
+    educations: int = 2
+    skills: int = 3
+    languages: int = 2
+    resumes: int = 2
+    job_applications: int = 5
+    themes: int = 3
+    # Accounts and resumes are spread over this many days up to today.
+    days: int = 365
+    seed: int = 0
+    batch_size: int = 500
+    password: str = "password"
+
+
+class DatasetSeeder:
+    def __init__(self, db_session, options: SeedOptions):
+        self.db_session = db_session
+        self.options = options
+        self.random = random.Random(options.seed)
+        # Markdown is rendered once per distinct source, not once per row.
+        self._rendered = {}
+
+    def run(self, progress=None) -> dict:
+        """Writes the dataset and returns the number of rows per table."""
+        options = self.options
+        if self.db_session.scalar(
+            select(func.count()).where(User.username == self.username(0))
+        ):
+            raise ValueError(
+                f"Seed {options.seed} has already been loaded; pick another --seed."
+            )
+        counts = {}
+        # Hashing is deliberately slow, so all seeded users share one hash.
+        password_hash = password_hasher.hash(options.password)
+        theme_ids = self.create_themes(counts)
+        stage_ids = self.ensure_stages()
+
+        for first in range(0, options.users, options.batch_size):
+            last = min(first + options.batch_size, options.users)
+            rows = self.generate_users(
+                range(first, last), password_hash, theme_ids, stage_ids
+            )
+            for table, table_rows in rows.items():
+                if table_rows:
+                    self.db_session.execute(insert(table), table_rows)
+                    counts[table.name] = counts.get(table.name, 0) + len(table_rows)
+            self.db_session.commit()
+            if progress is not None:
+                progress(last)
+
+        DailyStatsService(self.db_session).rollup(
+            since=today() - timedelta(days=options.days)
+        )
+        return counts
+
+    def username(self, index: int) -> str:
+        return f"seed{self.options.seed}_user{index:07d}"
+
+    def new_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def timestamp(self) -> datetime:
+        offset = timedelta(seconds=self.random.random() * self.options.days * 86400)
+        return datetime.now(timezone.utc).replace(tzinfo=None) - offset
+
+    def markdown(self, source: str, inline=False) -> tuple[str, str]:
+        if (source, inline) not in self._rendered:
+            self._rendered[source, inline] = render_source(source, inline)
+        return self._rendered[source, inline]
+
+    def create_themes(self, counts) -> list:
+        rows = [
+            {
+                "id": self.new_id(),
+                "name": f"Seed {self.options.seed} theme {index}",
+                "description": "Generated by flask seed",
+                "styles": THEME_STYLES % self.random.getrandbits(24),
+            }
+            for index in range(self.options.themes)
+        ]
+        if rows:
+            self.db_session.execute(insert(ResumeTheme.__table__), rows)
+            counts["resume_theme"] = len(rows)
+        theme_ids = [row["id"] for row in rows]
+        # Resumes can only be built when some theme exists.
+        return theme_ids or list(self.db_session.scalars(select(ResumeTheme.id)))
+
+    def ensure_stages(self) -> list:
+        stage_ids = list(self.db_session.scalars(select(ApplicationStage.id)))
+        if not stage_ids:
+            self.db_session.execute(
+                insert(ApplicationStage.__table__),
+                [{"name": name} for name in STAGES],
+            )
+            stage_ids = list(self.db_session.scalars(select(ApplicationStage.id)))
+        return stage_ids
+
+    def generate_users(self, indexes, password_hash, theme_ids, stage_ids) -> dict:
+        """Rows for a batch of users, keyed by table in foreign key order."""
+        options = self.options
+        rng = self.random
+        models = (
+            User, BasicInfo, Summary, Experience, Education, Skills, Language,
+            BuiltResume,
+        )
+        rows = {model.__table__: [] for model in models}
+        rows |= {table: [] for table, _ in LINKS.values()}
+        rows[JobApplication.__table__] = []
+
+        def add(model, user_id, count, make):
+            entries = []
+            for index in range(count):
+                created_at = self.timestamp()
+                entry = {
+                    "id": self.new_id(),
+                    "user_id": user_id,
+                    "entry_title": f"{model.__tablename__} {index}",
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                } | make(index)
+                entries.append(entry)
+            rows[model.__table__].extend(entries)
+            return [entry["id"] for entry in entries]
+
+        for user_index in indexes:
+            username = self.username(user_index)
+            user_id = self.new_id()
+            joined_at = self.timestamp()
+            rows[User.__table__].append(
+                {
+                    "id": user_id,
+                    "username": username,
+                    "password_hash": password_hash,
+                    "is_admin": False,
+                    "is_active": True,
+                    "created_at": joined_at,
+                    "updated_at": joined_at,
+                }
+            )
+
+            def started():
+                return today() - timedelta(days=rng.randrange(30, 5000))
+
+            def experience(_):
+                description = rng.choice(EXPERIENCE_DESCRIPTIONS)
+                html, source_hash = self.markdown(description)
+                return {
+                    "job_title": rng.choice(JOB_TITLES),
+                    "company_name": rng.choice(COMPANIES),
+                    "date_started": started(),
+                    "description": description,
+                    "description_html": html,
+                    "description_hash": source_hash,
+                }
+
+            def summary(_):
+                content = rng.choice(SUMMARIES)
+                html, source_hash = self.markdown(content)
+                return {
+                    "content": content,
+                    "content_html": html,
+                    "content_hash": source_hash,
+                }
+
+            def skill(index):
+                description = rng.choice(SKILL_DESCRIPTIONS)
+                html, source_hash = self.markdown(description, inline=True)
+                return {
+                    "skill_group_title": f"Group {index}",
+                    "description": description,
+                    "description_html": html,
+                    "description_hash": source_hash,
+                }
+
+            basic_info_ids = add(
+                BasicInfo,
+                user_id,
+                options.basic_infos,
+                lambda _: {
+                    "full_name": f"Seed User {user_index}",
+                    "job_title": rng.choice(JOB_TITLES),
+                    "address": f"{rng.randrange(1, 200)} Main St",
+                    "contact_email": f"{username}@example.com",
+                    "contact_phone": f"+1555{rng.randrange(10**6, 10**7)}",
+                },
+            )
+            summary_ids = add(Summary, user_id, options.summaries, summary)
+            linked = {
+                "experience": add(
+                    Experience, user_id, options.experiences, experience
+                ),
+                "education": add(
+                    Education,
+                    user_id,
+                    options.educations,
+                    lambda _: {
+                        "degree_name": "BSc Computer Science",
+                        "school_name": rng.choice(SCHOOLS),
+                        "date_started": started(),
+                    },
+                ),
+                "skills": add(Skills, user_id, options.skills, skill),
+                "languages": add(
+                    Language,
+                    user_id,
+                    options.languages,
+                    lambda _: {
+                        "name": rng.choice(LANGUAGES),
+                        "proficiency": rng.choice(PROFICIENCIES),
+                    },
+                ),
+            }
+
+            if basic_info_ids and summary_ids and theme_ids:
+                resume_ids = add(
+                    BuiltResume,
+                    user_id,
+                    options.resumes,
+                    lambda _: {
+                        "basic_info_id": rng.choice(basic_info_ids),
+                        "summary_id": rng.choice(summary_ids),
+                        "theme_id": rng.choice(theme_ids),
+                        "content_version": 1,
+                    },
+                )
+                for resume_id in resume_ids:
+                    for name, (table, entry_column) in LINKS.items():
+                        entry_ids = linked[name]
+                        picked = rng.randint(min(1, len(entry_ids)), len(entry_ids))
+                        for entry_id in rng.sample(entry_ids, picked):
+                            rows[table].append(
+                                {"built_resume_id": resume_id, entry_column: entry_id}
+                            )
+
+            for _ in range(options.job_applications):
+                created_at = self.timestamp()
+                rows[JobApplication.__table__].append(
+                    {
+                        "id": self.new_id(),
+                        "user_id": user_id,
+                        "job_title": rng.choice(JOB_TITLES),
+                        "company_name": rng.choice(COMPANIES),
+                        "location": "Remote",
+                        "application_date": created_at.date(),
+                        "application_source": "LinkedIn",
+                        "application_stage_id": rng.choice(stage_ids),
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+        return rows
@@ -1,6 +1,24 @@
+import os
+import uuid
+from datetime import date
+
 import pytest
+
+os.environ.setdefault("FLASK_ENV", "testing")
+os.environ.setdefault("SECRET_KEY", "test")
+
 from resume_builder import create_app, db
-from resume_builder.models import User
+from resume_builder.models import (
+    BasicInfo,
+    BuiltResume,
+    Education,
+    Experience,
+    Language,
+    ResumeTheme,
+    Skills,
+    Summary,
+    User,
+)
 
 
 @pytest.fixture(scope="module")
@@ -39,3 +57,63 @@ def new_user(test_app):
         yield user
         db.session.delete(user)
         db.session.commit()
+
+
+@pytest.fixture(scope="function")
+def resume_factory(test_app):
+    """
+    Fixture returning a function that builds a resume for a user, linking
+    `entries_per_section` entries in every section, and returns its id.
+    """
+
+    def build_resume(user, entries_per_section=1):
+        theme = ResumeTheme(name=f"theme-{uuid.uuid4().hex}", styles="body {}")
+        basic_info = BasicInfo(
+            entry_title="main",
+            full_name="Test User",
+            job_title="Tester",
+            address="123 Test St",
+            contact_email="test@example.com",
+            contact_phone="1234567890",
+            user_id=user.id,
+        )
+        summary = Summary(entry_title="main", content="Summary", user_id=user.id)
+        resume = BuiltResume(
+            entry_title="resume",
+            basic_info=basic_info,
+            summary=summary,
+            theme=theme,
+            user_id=user.id,
+        )
+        for i in range(entries_per_section):
+            resume.experience.append(
+                Experience(
+                    entry_title=f"exp {i}",
+                    job_title="Developer",
+                    company_name="Company",
+                    date_started=date(2020, 1, 1),
+                    user_id=user.id,
+                )
+            )
+            resume.education.append(
+                Education(
+                    entry_title=f"edu {i}",
+                    degree_name="BSc",
+                    school_name="School",
+                    date_started=date(2010, 1, 1),
+                    user_id=user.id,
+                )
+            )
+            resume.skills.append(
+                Skills(entry_title=f"skill {i}", description="Python", user_id=user.id)
+            )
+            resume.languages.append(
+                Language(
+                    entry_title=f"lang {i}", name="English", proficiency="C2", user_id=user.id
+                )
+            )
+        db.session.add(resume)
+        db.session.commit()
+        return resume.id
+
+    return build_resume
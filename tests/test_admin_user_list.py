@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from resume_builder import db
+from resume_builder.admin.services import InvalidCursorError, UserListService
+from resume_builder.models import User
+
+
+@pytest.fixture
+def paged_users(test_app):
+    with test_app.app_context():
+        start = datetime(2025, 1, 1)
+        users = [
+            User(
+                username=f"pager-{i}",
+                password_hash="x",
+                created_at=start + timedelta(days=i),
+            )
+            for i in range(5)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        yield [user.username for user in users]
+        for user in users:
+            db.session.delete(user)
+        db.session.commit()
+
+
+def test_pages_follow_cursor_newest_first(test_app, paged_users, resume_factory):
+    """
+    GIVEN five users sharing a username prefix, one of them with a resume
+    WHEN the admin list is walked two users at a time
+    THEN every user should appear once, newest first, with resume counts
+    """
+    with test_app.app_context():
+        newest = User.query.filter_by(username="pager-4").one()
+        resume_factory(newest)
+        service = UserListService(db.session)
+
+        seen, cursor = [], None
+        while True:
+            page = service.get_page(cursor, username_prefix="pager-", per_page=2)
+            seen.extend(page.users)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert [row.username for row in seen] == paged_users[::-1]
+        assert [row.resume_count for row in seen] == [1, 0, 0, 0, 0]
+
+
+def test_search_and_invalid_cursor(test_app, paged_users):
+    with test_app.app_context():
+        service = UserListService(db.session)
+        page = service.get_page(username_prefix="pager-3")
+        assert [row.username for row in page.users] == ["pager-3"]
+        assert page.next_cursor is None
+
+        with pytest.raises(InvalidCursorError):
+            service.get_page(cursor="garbage")
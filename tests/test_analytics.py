@@ -0,0 +1,117 @@
+from datetime import timedelta
+
+from resume_builder import db
+from resume_builder.analytics import (
+    DailyStatsService,
+    pending_counts,
+    record_login,
+    today,
+)
+from resume_builder.models import BuiltResume, DailyStats, User
+
+
+def todays_stats():
+    db.session.expire_all()
+    return db.session.get(DailyStats, today())
+
+
+def test_counters_follow_signups_resumes_and_deletions(test_app, resume_factory):
+    """
+    GIVEN the daily stats counters
+    WHEN a user signs up, builds a resume and is then deleted
+    THEN today's row and the dashboard totals should track each step
+    """
+    with test_app.app_context():
+        service = DailyStatsService(db.session)
+        before = service.totals()
+
+        user = User(username="stats-user", password_hash="x")
+        db.session.add(user)
+        db.session.commit()
+        resume_factory(user)
+        assert service.totals() == {
+            "registered_users": before["registered_users"] + 1,
+            "total_resumes": before["total_resumes"] + 1,
+        }
+
+        db.session.delete(user)
+        db.session.commit()
+        assert service.totals() == before
+        assert todays_stats().resumes_deleted >= 1
+
+
+def test_login_counts_each_user_once_per_day(test_app, new_user):
+    with test_app.app_context():
+        user = db.session.get(User, new_user.id)
+        active_before = todays_stats().active_users if todays_stats() else 0
+        for _ in range(2):
+            record_login(db.session, user)
+            db.session.commit()
+        pending_counts.flush(db.session)
+        db.session.commit()
+
+        assert todays_stats().active_users == active_before + 1
+        assert user.last_login_at is not None
+
+
+def test_series_fills_missing_days_and_rollup_recomputes(test_app, new_user):
+    with test_app.app_context():
+        service = DailyStatsService(db.session)
+        yesterday = today() - timedelta(days=1)
+        db.session.add(DailyStats(day=yesterday, signups=99))
+        db.session.commit()
+
+        series = service.series(days=3)
+        assert [day["day"] for day in series] == [
+            today() - timedelta(days=2),
+            yesterday,
+            today(),
+        ]
+        assert series[1]["signups"] == 99
+
+        assert service.rollup(since=yesterday) == 2
+        assert service.series(days=2)[0]["signups"] == 0
+        assert todays_stats().signups == User.query.filter(
+            User.created_at >= today()
+        ).count()
+
+
+def test_rollup_after_a_deletion_matches_existing_rows(test_app):
+    """
+    GIVEN a user who signed up and was deleted today
+    WHEN the stats are rolled up
+    THEN the totals should still equal the users and resumes that exist
+    """
+    with test_app.app_context():
+        user = User(username="short-lived-user", password_hash="x")
+        db.session.add(user)
+        db.session.commit()
+        db.session.delete(user)
+        db.session.commit()
+
+        service = DailyStatsService(db.session)
+        service.rollup(since=today() - timedelta(days=1))
+
+        assert service.totals() == {
+            "registered_users": User.query.count(),
+            "total_resumes": BuiltResume.query.count(),
+        }
+        assert todays_stats().users_deleted == 0
+
+
+def test_pending_counts_are_written_once_due(test_app):
+    with test_app.app_context():
+        before = todays_stats().pdfs_downloaded if todays_stats() else 0
+        pending_counts.flush_interval = 3600
+        try:
+            assert not pending_counts.add(db.session, pdfs_downloaded=2)
+            assert not pending_counts.add(db.session, pdfs_downloaded=1)
+            db.session.commit()
+            assert (todays_stats().pdfs_downloaded if todays_stats() else 0) == before
+
+            pending_counts.flush_interval = 0
+            assert pending_counts.add(db.session, pdfs_downloaded=1)
+            db.session.commit()
+            assert todays_stats().pdfs_downloaded == before + 4
+        finally:
+            pending_counts.flush_interval = 0
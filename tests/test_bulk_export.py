@@ -0,0 +1,85 @@
+from concurrent.futures import Future
+from datetime import datetime
+import io
+from types import SimpleNamespace
+import zipfile
+
+from resume_builder.extensions import pdf_cache, render_pool
+from resume_builder.resume_builder_core.bulk_export import (
+    ExportDocument,
+    export_filename,
+    stream_pdf_zip,
+)
+
+
+def test_export_filename_is_safe_and_unique():
+    taken = set()
+    assert export_filename("Backend CV", taken) == "Backend_CV.pdf"
+    assert export_filename("Backend/CV", taken) == "Backend_CV_2.pdf"
+    assert export_filename("../..", taken) == "resume.pdf"
+
+
+def test_export_streams_a_zip_of_all_resumes(
+    test_app, test_client, new_user, resume_factory
+):
+    """
+    GIVEN a user with a resume and an empty PDF cache
+    WHEN they export their resumes twice
+    THEN both downloads should be a ZIP holding the PDF, rendered once and
+    cached for the second one
+    """
+    with test_app.app_context():
+        pdf_cache.clear()
+        resume_factory(new_user)
+    test_client.post(
+        "/auth/login", data={"username": new_user.username, "password": "password"}
+    )
+
+    archives = []
+    for _ in range(2):
+        response = test_client.get("/resume/resumes/export")
+        assert response.status_code == 200
+        assert response.mimetype == "application/zip"
+        archives.append(zipfile.ZipFile(io.BytesIO(response.data)))
+        assert len(pdf_cache.backend) == 1
+    test_client.get("/auth/logout")
+    render_pool.shutdown()
+
+    for archive in archives:
+        assert archive.namelist() == ["resume.pdf"]
+        assert archive.read("resume.pdf").startswith(b"%PDF")
+    assert archives[0].read("resume.pdf") == archives[1].read("resume.pdf")
+
+
+def test_export_keeps_a_window_of_renders_in_flight(test_app, monkeypatch):
+    """
+    GIVEN five uncached documents and a window of two
+    WHEN the export is streamed
+    THEN no more than two renders should be submitted ahead of the entries
+    written so far, and every document should end up in the archive
+    """
+    submitted = []
+
+    def submit(fn, *args, callback=None):
+        future = Future()
+        future.set_result(b"%PDF-" + args[0].encode())
+        submitted.append(future)
+        return future
+
+    monkeypatch.setattr(render_pool, "submit", submit)
+    theme = SimpleNamespace(id=1, updated_at=datetime(2024, 1, 1))
+    documents = [
+        ExportDocument(f"{i}.pdf", f"<p>{i}</p>", theme) for i in range(5)
+    ]
+
+    with test_app.app_context():
+        pdf_cache.clear()
+        chunks = []
+        for written, chunk in enumerate(stream_pdf_zip(documents, window=2), 1):
+            assert len(submitted) <= written + 2
+            chunks.append(chunk)
+        pdf_cache.clear()
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert sorted(archive.namelist()) == [f"{i}.pdf" for i in range(5)]
+    assert len(submitted) == 5
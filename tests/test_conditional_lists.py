@@ -0,0 +1,46 @@
+from datetime import date
+
+from resume_builder import db
+from resume_builder.models import Experience
+
+
+def test_list_view_answers_304_until_entries_change(
+    test_app, test_client, new_user, resume_factory
+):
+    """
+    GIVEN a logged in user with an experience
+    WHEN the experience list is revalidated before and after adding another
+    THEN it should get a 304 first and a fresh page with a new ETag after
+    """
+    with test_app.app_context():
+        resume_factory(new_user)
+    test_client.post(
+        "/auth/login", data={"username": new_user.username, "password": "password"}
+    )
+    url = "/resume/experience_list"
+    # The login flash message is shown (and consumed) uncached.
+    assert test_client.get(url).get_etag() == (None, None)
+
+    first = test_client.get(url)
+    etag, weak = first.get_etag()
+    assert first.status_code == 200 and weak
+    revalidated = test_client.get(url, headers={"If-None-Match": f'W/"{etag}"'})
+    assert revalidated.status_code == 304
+    assert revalidated.get_etag() == (etag, True)
+
+    with test_app.app_context():
+        db.session.add(
+            Experience(
+                entry_title="new",
+                job_title="Developer",
+                company_name="Company",
+                date_started=date(2021, 1, 1),
+                user_id=new_user.id,
+            )
+        )
+        db.session.commit()
+    changed = test_client.get(url, headers={"If-None-Match": f'W/"{etag}"'})
+    test_client.get("/auth/logout")
+
+    assert changed.status_code == 200
+    assert changed.get_etag()[0] != etag
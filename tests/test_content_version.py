@@ -0,0 +1,65 @@
+from datetime import date
+
+from resume_builder import db
+from resume_builder.models import BuiltResume, Experience
+from resume_builder.resume_builder_core.content_version import resumes_using
+
+
+def content_version(resume_id):
+    db.session.expire_all()
+    return db.session.get(BuiltResume, resume_id).content_version
+
+
+def test_linked_changes_bump_content_version(test_app, new_user, resume_factory):
+    """
+    GIVEN a resume linking two experiences
+    WHEN its theme, a linked experience, its links and its title change
+    THEN every change should bump its content_version
+    """
+    with test_app.app_context():
+        resume_id = resume_factory(new_user, entries_per_section=2)
+        resume = db.session.get(BuiltResume, resume_id)
+        assert resume.content_version == 1
+        experience_id = resume.experience[0].id
+
+        resume.theme.styles = "body { color: red; }"
+        db.session.commit()
+        assert content_version(resume_id) == 2
+
+        db.session.get(Experience, experience_id).job_title = "Lead Developer"
+        db.session.commit()
+        assert content_version(resume_id) == 3
+
+        db.session.get(BuiltResume, resume_id).experience.pop()
+        db.session.commit()
+        assert content_version(resume_id) == 4
+
+        db.session.delete(db.session.get(Experience, experience_id))
+        db.session.commit()
+        assert content_version(resume_id) == 5
+
+        db.session.get(BuiltResume, resume_id).entry_title = "renamed"
+        db.session.commit()
+        assert content_version(resume_id) == 6
+
+
+def test_unrelated_changes_keep_content_version(test_app, new_user, resume_factory):
+    with test_app.app_context():
+        resume_id = resume_factory(new_user)
+        unlinked = Experience(
+            entry_title="unlinked",
+            job_title="Developer",
+            company_name="Company",
+            date_started=date(2020, 1, 1),
+            user_id=new_user.id,
+        )
+        db.session.add(unlinked)
+        db.session.commit()
+
+        unlinked.job_title = "Lead Developer"
+        db.session.commit()
+        assert content_version(resume_id) == 1
+        assert resumes_using(db.session, unlinked) == []
+        resume = db.session.get(BuiltResume, resume_id)
+        assert resumes_using(db.session, resume.experience[0]) == [resume_id]
+        assert resumes_using(db.session, resume.theme) == [resume_id]
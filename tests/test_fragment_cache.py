@@ -0,0 +1,50 @@
+from resume_builder import db
+from resume_builder.caching import FragmentCache
+from resume_builder.extensions import fragment_cache
+from resume_builder.models import BuiltResume
+
+
+def test_fragment_cache_falls_back_to_shared_tier(test_app, tmp_path):
+    """
+    GIVEN a FragmentCache with a filesystem tier
+    WHEN a fragment is read after the worker's LRU was emptied
+    THEN it should come from the shared tier and refill the LRU
+    """
+    test_app.config["FRAGMENT_CACHE_DIR"] = str(tmp_path)
+    cache = FragmentCache(test_app)
+    cache.set("resume_html:1", "v1", "<p>Résumé</p>")
+    cache.memory.clear()
+
+    assert cache.get("resume_html:1", "v1") == "<p>Résumé</p>"
+    assert len(cache.memory) == 1
+    assert cache.get("resume_html:1", "v2") is None
+    test_app.config["FRAGMENT_CACHE_DIR"] = None
+
+
+def test_preview_reuses_cached_html(test_app, test_client, new_user, resume_factory):
+    """
+    GIVEN a logged in user with a resume
+    WHEN the preview is opened, the resume edited and the preview reopened
+    THEN the first render should be cached and the edit should miss it
+    """
+    fragment_cache.clear()
+    with test_app.app_context():
+        resume_id = resume_factory(new_user)
+    test_client.post(
+        "/auth/login", data={"username": new_user.username, "password": "password"}
+    )
+    url = f"/resume/resumes/{resume_id}/preview"
+
+    assert test_client.get(url).status_code == 200
+    assert len(fragment_cache.memory) == 1
+    assert b"Test User" in test_client.get(url).data
+    assert len(fragment_cache.memory) == 1
+
+    with test_app.app_context():
+        db.session.get(BuiltResume, resume_id).basic_info.full_name = "Renamed User"
+        db.session.commit()
+    edited = test_client.get(url)
+    test_client.get("/auth/logout")
+
+    assert b"Renamed User" in edited.data
+    assert len(fragment_cache.memory) == 2
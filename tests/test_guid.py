@@ -0,0 +1,119 @@
+import os
+import uuid
+
+import flask_migrate
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from resume_builder import create_app, db
+from resume_builder.models import GUID, BasicInfo, ResumeTheme, User
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "migrations")
+BEFORE_BINARY_GUIDS = "9d2f47a1c8e5"
+
+
+def test_guid_is_stored_as_16_bytes(test_app):
+    """
+    GIVEN a saved theme
+    WHEN its row is read back raw and through the model
+    THEN its id should be stored as a 16 byte BLOB and be found by its UUID,
+    hyphenated and hex strings and as a literal
+    """
+    with test_app.app_context():
+        theme = ResumeTheme(name="guid", styles="body {}")
+        db.session.add(theme)
+        db.session.commit()
+        theme_id = theme.id
+
+        stored = db.session.execute(
+            text("SELECT id FROM resume_theme WHERE name = 'guid'")
+        ).scalar_one()
+        assert stored == theme_id.bytes
+
+        for value in (theme_id, str(theme_id), theme_id.hex):
+            query = select(ResumeTheme).where(ResumeTheme.id == value)
+            assert db.session.scalar(query) is theme
+        literal = select(ResumeTheme.id).where(ResumeTheme.id == theme_id).compile(
+            db.engine, compile_kwargs={"literal_binds": True}
+        )
+        assert db.session.execute(text(str(literal))).scalar_one() == theme_id.bytes
+        assert isinstance(db.session.scalar(select(ResumeTheme.id)), uuid.UUID)
+
+        db.session.delete(theme)
+        db.session.commit()
+
+
+
+def test_guid_passes_uuids_to_postgresql():
+    """
+    GIVEN the PostgreSQL dialect
+    WHEN a GUID is bound, loaded and rendered as a literal
+    THEN the driver should get a UUID whatever form it was given in, and
+    UUIDs should come back
+    """
+    dialect = postgresql.psycopg2.dialect()
+    guid, value = GUID(), uuid.uuid4()
+    bind = guid.bind_processor(dialect)
+    for given in (value, str(value), value.hex):
+        assert bind(given) == value
+    assert bind(None) is None
+    assert guid.result_processor(dialect, None)(str(value)) == value
+    assert guid.literal_processor(dialect)(value.hex) == f"'{value}'"
+
+
+def test_guid_migration_converts_hex_rows():
+    """
+    GIVEN a database migrated up to just before binary GUIDs, holding a user
+    with a basic info entry stored as hex
+    WHEN it is upgraded to the latest revision and downgraded again
+    THEN the ids should become 16 byte BLOBs the models can load, and hex
+    text again afterwards
+    """
+    app = create_app()
+    user_id, info_id = uuid.uuid4(), uuid.uuid4()
+    with app.app_context():
+        flask_migrate.upgrade(directory=MIGRATIONS_DIR, revision=BEFORE_BINARY_GUIDS)
+        db.session.execute(
+            text(
+                "INSERT INTO user (id, username, password_hash, is_admin, "
+                "created_at, updated_at) VALUES (:id, 'hex', 'x', 0, "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            {"id": user_id.hex},
+        )
+        db.session.execute(
+            text(
+                "INSERT INTO basic_info (id, entry_title, full_name, job_title, "
+                "address, contact_email, contact_phone, user_id, created_at, "
+                "updated_at) VALUES (:id, 'main', 'Hex', 'Tester', 'Street', "
+                "'hex@example.com', '1', :user_id, CURRENT_TIMESTAMP, "
+                "CURRENT_TIMESTAMP)"
+            ),
+            {"id": info_id.hex, "user_id": user_id.hex},
+        )
+        db.session.commit()
+
+        try:
+            flask_migrate.upgrade(directory=MIGRATIONS_DIR)
+            stored = db.session.execute(
+                text("SELECT id, user_id FROM basic_info")
+            ).one()
+            assert stored == (info_id.bytes, user_id.bytes)
+            info = db.session.get(BasicInfo, info_id)
+            assert info.user_id == user_id
+            assert db.session.get(User, user_id).basic_infos == [info]
+            db.session.rollback()
+            # alembic.ini's logging setup mustn't silence the app's loggers.
+            assert not app.logger.disabled
+
+            flask_migrate.downgrade(
+                directory=MIGRATIONS_DIR, revision=BEFORE_BINARY_GUIDS
+            )
+            stored = db.session.execute(
+                text("SELECT id, user_id FROM basic_info")
+            ).one()
+            assert stored == (info_id.hex, user_id.hex)
+        finally:
+            db.session.rollback()
+            flask_migrate.downgrade(directory=MIGRATIONS_DIR, revision="base")
+            db.session.execute(text("DROP TABLE IF EXISTS alembic_version"))
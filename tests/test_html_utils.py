@@ -0,0 +1,40 @@
+import threading
+
+from resume_builder.resume_builder_core.html_utils import render_markdown, renderer
+
+
+def test_render_markdown_sanitizes_and_linkifies():
+    """
+    GIVEN markdown containing a script tag, a bare URL and a code span
+    WHEN render_markdown is called
+    THEN the script should be escaped and the URL turned into a link
+    """
+    html = render_markdown("Docs at https://example.com\n\n<script>x</script> `code`")
+
+    assert '<a href="https://example.com" rel="nofollow">https://example.com</a>' in html
+    assert "<script>" not in html
+    assert "<code>code</code>" in html
+
+
+def test_renderer_is_reused_per_thread():
+    """
+    GIVEN the module renderer
+    WHEN it renders on two threads
+    THEN each thread should reuse its own pipeline and get the same output
+    """
+    results = []
+
+    def render():
+        first = renderer._pipeline()
+        results.append((renderer.render("# Title"), first))
+        assert renderer._pipeline() is first
+
+    threads = [threading.Thread(target=render) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    (html_a, pipeline_a), (html_b, pipeline_b) = results
+    assert html_a == html_b == "<h1>Title</h1>"
+    assert pipeline_a is not pipeline_b
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+# Wall-clock budget for importing the package and calling create_app(), in
+# milliseconds. Override on slow CI machines with CREATE_APP_BUDGET_MS.
+CREATE_APP_BUDGET_MS = float(os.getenv("CREATE_APP_BUDGET_MS", "2000"))
+
+# Modules that must only be imported when a PDF is actually rendered.
+LAZY_MODULES = ("weasyprint", "pydyf", "tinycss2", "cssselect2", "fontTools")
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+from resume_builder import create_app
+create_app()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def run_importtime():
+    env = dict(os.environ, FLASK_ENV="testing", SECRET_KEY="test")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        check=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+    return float(result.stdout.strip().splitlines()[-1]), imported
+
+
+def test_create_app_stays_within_import_budget():
+    """
+    GIVEN a fresh interpreter
+    WHEN resume_builder is imported and create_app() is called
+    THEN no PDF rendering modules should be imported and it should finish
+         within CREATE_APP_BUDGET_MS
+    """
+    elapsed_ms, imported = run_importtime()
+
+    eager = sorted(
+        name for name in imported if name.split(".")[0] in LAZY_MODULES
+    )
+    assert not eager, f"imported at startup: {', '.join(eager)}"
+    assert elapsed_ms <= CREATE_APP_BUDGET_MS, (
+        f"create_app() took {elapsed_ms:.0f} ms, budget is {CREATE_APP_BUDGET_MS:.0f} ms"
+    )
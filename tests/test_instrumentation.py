@@ -0,0 +1,57 @@
+import logging
+import re
+
+from resume_builder.extensions import instrumentation
+from resume_builder.instrumentation import percentile
+
+
+def login(client, user):
+    return client.post(
+        "/auth/login", data={"username": user.username, "password": "password"}
+    )
+
+
+def test_response_reports_queries_in_server_timing(test_app, test_client, new_user):
+    """
+    GIVEN a logged in user
+    WHEN they load the resume dashboard
+    THEN the response should carry the query count and DB time and the
+         request should be sampled for its endpoint
+    """
+    instrumentation.reset()
+    login(test_client, new_user)
+
+    response = test_client.get("/resume/")
+
+    timing = response.headers["Server-Timing"]
+    match = re.search(r'db;dur=([\d.]+);desc="(\d+) queries", app;dur=([\d.]+)', timing)
+    assert match, timing
+    assert int(match.group(2)) >= 1
+    assert float(match.group(1)) <= float(match.group(3))
+    endpoints = {row["endpoint"]: row for row in instrumentation.summary()}
+    assert endpoints["resume.home"]["requests"] == 1
+    test_client.get("/auth/logout")
+
+
+def test_slow_requests_are_logged(test_app, test_client, new_user, caplog):
+    threshold = instrumentation.slow_request_ms
+    instrumentation.slow_request_ms = 0.001
+    try:
+        with caplog.at_level(logging.WARNING):
+            login(test_client, new_user)
+    finally:
+        instrumentation.slow_request_ms = threshold
+
+    assert any(
+        "Slow request POST /auth/login" in record.getMessage()
+        and "SELECT" in record.getMessage()
+        for record in caplog.records
+    )
+    test_client.get("/auth/logout")
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile([7], 0.95) == 7
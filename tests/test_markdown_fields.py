@@ -0,0 +1,113 @@
+import datetime
+import os
+import uuid
+
+import flask_migrate
+from sqlalchemy import text
+
+from resume_builder import create_app, db
+from resume_builder.models import Experience, Skills
+from resume_builder.resume_builder_core import markdown_fields
+
+
+def test_experience_description_is_rendered_on_insert_and_update(test_app, new_user):
+    """
+    GIVEN an Experience with a markdown description
+    WHEN it is inserted and later edited
+    THEN the stored HTML should follow the source
+    """
+    with test_app.app_context():
+        experience = Experience(
+            entry_title="markdown-exp",
+            job_title="Engineer",
+            company_name="ACME",
+            date_started=datetime.date(2020, 1, 1),
+            description="**bold**",
+            user_id=new_user.id,
+        )
+        db.session.add(experience)
+        db.session.commit()
+        assert experience.description_html == "<p><strong>bold</strong></p>"
+
+        experience.description = "*italic*"
+        db.session.commit()
+        assert experience.description_html == "<p><em>italic</em></p>"
+
+
+def test_unchanged_source_is_not_rendered_again(test_app, new_user, monkeypatch):
+    """
+    GIVEN a stored Skills entry
+    WHEN a field other than the description changes
+    THEN the markdown should not be rendered again
+    """
+    with test_app.app_context():
+        skill = Skills(
+            entry_title="markdown-skill",
+            description="Python, `SQL`",
+            user_id=new_user.id,
+        )
+        db.session.add(skill)
+        db.session.commit()
+        assert skill.description_html == "Python, <code>SQL</code>"
+
+        calls = []
+        monkeypatch.setattr(
+            markdown_fields, "render_markdown", lambda text: calls.append(text) or text
+        )
+        skill.skill_group_title = "Backend"
+        db.session.commit()
+        assert calls == []
+
+
+def test_migration_backfills_rendered_markdown():
+    """
+    GIVEN skills stored before the rendered markdown columns existed
+    WHEN the migration adding them runs
+    THEN every row should get the HTML and hash the app renders for it
+    """
+    migrations_dir = os.path.join(os.path.dirname(__file__), "..", "migrations")
+    app = create_app()
+    user_id = uuid.uuid4()
+    sources = ["**bold**", "- one\n- two", ""]
+    with app.app_context():
+        flask_migrate.upgrade(directory=migrations_dir, revision="a81f0c3e6b27")
+        db.session.execute(
+            text(
+                "INSERT INTO user (id, username, password_hash, is_admin, "
+                "created_at, updated_at) VALUES (:id, 'md', 'x', 0, "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            {"id": user_id.hex},
+        )
+        for index, source in enumerate(sources):
+            db.session.execute(
+                text(
+                    "INSERT INTO skills (id, description, user_id, entry_title, "
+                    "created_at, updated_at) VALUES (:id, :description, "
+                    ":user_id, :title, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ),
+                {
+                    "id": uuid.uuid4().hex,
+                    "description": source,
+                    "user_id": user_id.hex,
+                    "title": f"skills {index}",
+                },
+            )
+        db.session.commit()
+
+        try:
+            flask_migrate.upgrade(directory=migrations_dir, revision="c4d19e7b2a60")
+            rows = db.session.execute(
+                text(
+                    "SELECT description, description_html, description_hash "
+                    "FROM skills ORDER BY entry_title"
+                )
+            ).all()
+            assert [tuple(row[1:]) for row in rows] == [
+                markdown_fields.render_source(row[0], inline=True) for row in rows
+            ]
+            assert rows[0][1] == "<strong>bold</strong>"
+        finally:
+            db.session.rollback()
+            flask_migrate.downgrade(directory=migrations_dir, revision="base")
+            db.session.execute(text("DROP TABLE IF EXISTS alembic_version"))
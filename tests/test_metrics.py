@@ -0,0 +1,62 @@
+from prometheus_client import REGISTRY
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics_requires_token_or_admin(test_app, test_client):
+    """
+    GIVEN a configured METRICS_TOKEN
+    WHEN /metrics is requested with and without it
+    THEN only the request carrying the token should get the metrics
+    """
+    test_app.config["METRICS_TOKEN"] = "scrape-me"
+    try:
+        assert test_client.get("/metrics").status_code == 403
+        assert (
+            test_client.get(
+                "/metrics", headers={"Authorization": "Bearer wrong"}
+            ).status_code
+            == 403
+        )
+        response = test_client.get(
+            "/metrics", headers={"Authorization": "Bearer scrape-me"}
+        )
+    finally:
+        test_app.config["METRICS_TOKEN"] = None
+
+    assert response.status_code == 200
+    assert b"resume_builder_request_duration_seconds" in response.data
+    assert b"resume_builder_pdf_render_duration_seconds" in response.data
+
+
+def test_login_observes_password_and_request_metrics(test_app, test_client, new_user):
+    verified = sample(
+        "resume_builder_password_hash_duration_seconds_count", operation="verify"
+    )
+    requests = sample(
+        "resume_builder_request_duration_seconds_count",
+        endpoint="auth.login",
+        method="POST",
+        status="302",
+    )
+
+    test_client.post(
+        "/auth/login", data={"username": new_user.username, "password": "password"}
+    )
+    test_client.get("/auth/logout")
+
+    assert (
+        sample("resume_builder_password_hash_duration_seconds_count", operation="verify")
+        == verified + 1
+    )
+    assert (
+        sample(
+            "resume_builder_request_duration_seconds_count",
+            endpoint="auth.login",
+            method="POST",
+            status="302",
+        )
+        == requests + 1
+    )
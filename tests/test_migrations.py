@@ -0,0 +1,67 @@
+import os
+
+import flask_migrate
+import pytest
+from sqlalchemy import inspect, text
+
+from resume_builder import create_app, db
+from resume_builder.models import BuiltResume, PdfRenderJob
+from resume_builder.seeding import DatasetSeeder, SeedOptions
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "migrations")
+
+
+def row_counts() -> dict:
+    return {
+        table: db.session.execute(text(f'SELECT count(*) FROM "{table}"')).scalar()
+        for table in inspect(db.engine).get_table_names()
+        if table != "alembic_version"
+    }
+
+
+@pytest.mark.parametrize(
+    "revision",
+    [
+        # Rebuilds every table holding a GUID.
+        "9d2f47a1c8e5",
+        # Rebuilds built_resume, referenced by its associations and render jobs.
+        "3b8f61d0c7e4",
+        # Rebuilds user, which all content references.
+        "e7a3b5c90d12",
+        # Rebuilds experience, summary and skills.
+        "a81f0c3e6b27",
+    ],
+)
+def test_downgrade_keeps_rows_of_rebuilt_tables(revision):
+    """
+    GIVEN a migrated database holding seeded users with all their content
+    WHEN it is downgraded to `revision` and upgraded again
+    THEN no rows should be lost to foreign key cascades while tables are
+    rebuilt, and foreign keys should be enforced again afterwards
+    """
+    app = create_app()
+    with app.app_context():
+        flask_migrate.upgrade(directory=MIGRATIONS_DIR)
+        DatasetSeeder(db.session, SeedOptions(users=3)).run()
+        resume = db.session.scalars(db.select(BuiltResume)).first()
+        db.session.add(
+            PdfRenderJob(
+                built_resume_id=resume.id, user_id=resume.user_id, cache_key="k"
+            )
+        )
+        db.session.commit()
+        before = row_counts()
+
+        try:
+            flask_migrate.downgrade(directory=MIGRATIONS_DIR, revision=revision)
+            downgraded = row_counts()
+            assert {table: before[table] for table in downgraded} == downgraded
+
+            flask_migrate.upgrade(directory=MIGRATIONS_DIR)
+            upgraded = row_counts()
+            assert {table: upgraded[table] for table in downgraded} == downgraded
+            assert db.session.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        finally:
+            db.session.rollback()
+            flask_migrate.downgrade(directory=MIGRATIONS_DIR, revision="base")
+            db.session.execute(text("DROP TABLE IF EXISTS alembic_version"))
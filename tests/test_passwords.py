@@ -0,0 +1,97 @@
+import time
+
+import pytest
+from flask import Flask
+from flask_bcrypt import Bcrypt
+from werkzeug.security import generate_password_hash
+
+from resume_builder import db
+from resume_builder.extensions import password_hasher
+from resume_builder.models import User
+from resume_builder.passwords import PasswordHasher, PasswordHashingBusyError
+
+
+def make_hasher(**config):
+    app = Flask(__name__)
+    app.config.update(config)
+    hasher = PasswordHasher()
+    hasher.init_app(app, Bcrypt(app))
+    return hasher
+
+
+def test_bcrypt_hashes_and_verifies_legacy_hashes():
+    """
+    GIVEN a hasher configured for bcrypt
+    WHEN it hashes a password and verifies an older scrypt hash
+    THEN both should verify and only the scrypt hash should need a rehash
+    """
+    hasher = make_hasher(PASSWORD_HASH_METHOD="bcrypt", BCRYPT_LOG_ROUNDS=4)
+    bcrypt_hash = hasher.hash("secret")
+    scrypt_hash = generate_password_hash("secret", "scrypt:1024:8:1")
+
+    assert bcrypt_hash.startswith("$2b$04$")
+    assert hasher.verify(bcrypt_hash, "secret")
+    assert not hasher.verify(bcrypt_hash, "wrong")
+    assert hasher.verify(scrypt_hash, "secret")
+    assert not hasher.needs_rehash(bcrypt_hash)
+    assert hasher.needs_rehash(scrypt_hash)
+    hasher.shutdown()
+
+
+def test_hashing_beyond_the_timeout_is_refused():
+    hasher = make_hasher(
+        PASSWORD_HASH_METHOD="pbkdf2:sha256:1000",
+        PASSWORD_HASH_CONCURRENCY=1,
+        PASSWORD_HASH_TIMEOUT=0.01,
+    )
+    hasher._get_executor().submit(time.sleep, 0.2)
+    with pytest.raises(PasswordHashingBusyError):
+        hasher.hash("secret")
+    hasher.shutdown()
+
+
+def test_login_rehashes_outdated_password_hash(test_app, test_client, new_user):
+    """
+    GIVEN a user whose password was hashed with other settings
+    WHEN they log in
+    THEN the hash should be replaced with one using the current settings
+    """
+    # Requests reuse the test_app context, and with it the session new_user
+    # lives in, so the hash is changed through that session.
+    new_user.password_hash = generate_password_hash("password", "pbkdf2:sha256:2000")
+    db.session.commit()
+
+    response = test_client.post(
+        "/auth/login", data={"username": new_user.username, "password": "password"}
+    )
+    test_client.get("/auth/logout")
+
+    assert response.status_code == 302
+    assert new_user.password_hash.startswith("pbkdf2:sha256:1000$")
+
+
+def test_registration_while_hashing_is_busy_returns_503(
+    test_app, test_client, monkeypatch
+):
+    """
+    GIVEN a password hasher with no capacity left
+    WHEN someone registers
+    THEN they should get the form back with a 503 and no account be created
+    """
+
+    def busy(password):
+        raise PasswordHashingBusyError
+
+    monkeypatch.setattr(password_hasher, "hash", busy)
+    response = test_client.post(
+        "/auth/register",
+        data={
+            "username": "busy-signup",
+            "password": "password",
+            "confirm_password": "password",
+        },
+    )
+
+    assert response.status_code == 503
+    assert b"Too many sign-ups right now" in response.data
+    assert User.query.filter_by(username="busy-signup").first() is None
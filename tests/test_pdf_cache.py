@@ -0,0 +1,96 @@
+import io
+
+from resume_builder.caching import FileSystemCache, MemoryCache, PdfCache
+
+
+def test_memory_cache_evicts_least_recently_used_by_size():
+    """
+    GIVEN a MemoryCache limited to 10 bytes
+    WHEN entries exceeding the limit are stored
+    THEN the least recently used entries are evicted first
+    """
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")
+    cache.set("c", b"1234")
+
+    assert cache.get("a") == b"1234"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"1234"
+    assert cache.current_bytes == 8
+
+
+def test_memory_cache_skips_values_larger_than_limit():
+    cache = MemoryCache(max_bytes=4)
+    cache.set("big", b"12345")
+    assert cache.get("big") is None
+    assert cache.current_bytes == 0
+
+
+def test_filesystem_cache_round_trip_and_prune(tmp_path):
+    """
+    GIVEN a FileSystemCache limited to 8 bytes
+    WHEN three 4 byte entries are written
+    THEN the oldest entry is pruned and the others remain readable
+    """
+    cache = FileSystemCache(str(tmp_path), max_bytes=8, suffix=".pdf")
+    cache.set("aa01", b"1234")
+    cache.set("bb02", b"5678")
+    assert cache.get("aa01") == b"1234"
+
+    cache.set("cc03", b"9012")
+    remaining = [key for key in ("aa01", "bb02", "cc03") if cache.get(key)]
+    assert len(remaining) == 2
+    assert cache.get("cc03") == b"9012"
+    assert cache.path_for("cc03").endswith("cc03.pdf")
+
+
+def test_pdf_cache_key_changes_with_content():
+    assert PdfCache.key_for("<p>a</p>") == PdfCache.key_for("<p>a</p>")
+    assert PdfCache.key_for("<p>a</p>") != PdfCache.key_for("<p>b</p>")
+
+
+def test_pdf_cache_streams_filesystem_entries(tmp_path):
+    """
+    GIVEN a PdfCache on the filesystem backend
+    WHEN a PDF is stored from a file and opened again
+    THEN the cache file itself should be handed out
+    """
+    cache = PdfCache()
+    cache.backend = FileSystemCache(str(tmp_path), suffix=".pdf")
+    cache.set_file("dd04", io.BytesIO(b"%PDF-1.7"), 8)
+
+    with cache.open("dd04") as pdf_file:
+        assert pdf_file.name == cache.backend.path_for("dd04")
+        assert pdf_file.read() == b"%PDF-1.7"
+    assert cache.open("ee05") is None
+
+
+def test_download_supports_ranges_and_conditional_get(
+    test_app, test_client, new_user, resume_factory
+):
+    """
+    GIVEN a logged in user with a resume
+    WHEN the PDF is downloaded whole, by range and conditionally
+    THEN each request should get a 200, a 206 and a 304 respectively
+    """
+    with test_app.app_context():
+        resume_id = resume_factory(new_user)
+    test_client.post(
+        "/auth/login", data={"username": new_user.username, "password": "password"}
+    )
+    url = f"/resume/resume/{resume_id}/download"
+
+    full = test_client.get(url)
+    partial = test_client.get(url, headers={"Range": "bytes=0-3"})
+    not_modified = test_client.get(url, headers={"If-None-Match": full.get_etag()[0]})
+    test_client.get("/auth/logout")
+
+    assert full.status_code == 200
+    assert full.content_length == len(full.data)
+    assert full.headers["Accept-Ranges"] == "bytes"
+    assert partial.status_code == 206
+    assert partial.data == full.data[:4] == b"%PDF"
+    assert partial.headers["Content-Range"] == f"bytes 0-3/{len(full.data)}"
+    assert not_modified.status_code == 304
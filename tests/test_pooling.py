@@ -0,0 +1,62 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, exc
+
+from resume_builder.pooling import InstrumentedQueuePool, engine_options
+
+
+def sample(name):
+    return REGISTRY.get_sample_value(name) or 0
+
+
+def test_engine_options_follow_worker_threads():
+    config = {
+        "SQLALCHEMY_DATABASE_URI": "postgresql://app@db/resume_builder",
+        "WORKER_THREADS": 8,
+        "DB_POOL_SIZE": 0,
+        "DB_MAX_OVERFLOW": 2,
+        "DB_POOL_TIMEOUT": 10.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_PRE_PING": True,
+    }
+    options = engine_options(config)
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 9
+    assert options["pool_pre_ping"] is True
+
+    assert engine_options(config | {"DB_POOL_SIZE": 3})["pool_size"] == 3
+    sqlite_config = config | {"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}
+    assert engine_options(sqlite_config) == {}
+
+
+def test_exhausted_pool_is_measured(tmp_path):
+    """
+    GIVEN a pool of one connection without overflow
+    WHEN a second connection is requested while the first is in use
+    THEN both waits, the checkout, the connection in use and the timeout
+    should be recorded
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    waits = sample("resume_builder_db_pool_wait_seconds_count")
+    checkouts = sample("resume_builder_db_pool_checkouts_total")
+    opened = sample("resume_builder_db_pool_connections_opened_total")
+    timeouts = sample("resume_builder_db_pool_timeouts_total")
+    in_use = sample("resume_builder_db_pool_checked_out_connections")
+
+    with engine.connect():
+        assert sample("resume_builder_db_pool_checked_out_connections") == in_use + 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    assert sample("resume_builder_db_pool_wait_seconds_count") == waits + 2
+    assert sample("resume_builder_db_pool_checkouts_total") == checkouts + 1
+    assert sample("resume_builder_db_pool_connections_opened_total") == opened + 1
+    assert sample("resume_builder_db_pool_timeouts_total") == timeouts + 1
+    assert sample("resume_builder_db_pool_checked_out_connections") == in_use
+    engine.dispose()
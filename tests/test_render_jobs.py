@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+import os
+import time
+
+from resume_builder import db
+from resume_builder.extensions import pdf_cache
+from resume_builder.models import PdfRenderJob
+from resume_builder.resume_builder_core.render_jobs import RenderJobService
+
+
+def wait_for_job(job_id, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        db.session.expire_all()
+        job = db.session.get(PdfRenderJob, job_id)
+        if job.status != PdfRenderJob.QUEUED:
+            return job
+        time.sleep(0.1)
+    raise TimeoutError(f"Render job {job_id} did not finish in {timeout}s")
+
+
+def test_enqueue_renders_in_background(test_app, new_user, resume_factory, tmp_path):
+    """
+    GIVEN a resume and an empty PDF cache
+    WHEN a render job is enqueued
+    THEN it should return while queued and finish with the PDF on disk
+    """
+    test_app.config["PDF_RENDER_JOB_DIR"] = str(tmp_path)
+    with test_app.app_context():
+        pdf_cache.clear()
+        resume_id = resume_factory(new_user)
+        service = RenderJobService(db.session)
+
+        job = service.enqueue(resume_id, new_user.id, "<html><body>Resume</body></html>")
+        assert job.status == PdfRenderJob.QUEUED
+
+        job = wait_for_job(job.id)
+        assert job.status == PdfRenderJob.DONE, job.error
+        with open(service.output_path(job), "rb") as pdf_file:
+            assert pdf_file.read().startswith(b"%PDF")
+
+        cached_job = service.enqueue(
+            resume_id, new_user.id, "<html><body>Resume</body></html>"
+        )
+        assert cached_job.status == PdfRenderJob.DONE
+        # Served from the PdfCache, no second copy on disk.
+        assert not os.path.exists(service.output_path(cached_job))
+        with service.open_output(cached_job) as pdf_file:
+            assert pdf_file.read().startswith(b"%PDF")
+
+
+def test_stale_jobs_fail_and_old_jobs_expire(
+    test_app, new_user, resume_factory, tmp_path
+):
+    """
+    GIVEN render jobs whose worker never reported back
+    WHEN they are polled after the timeout, and after the TTL
+    THEN they should fail with a generic error, then be deleted with their files
+    """
+    test_app.config["PDF_RENDER_JOB_DIR"] = str(tmp_path)
+    with test_app.app_context():
+        resume_id = resume_factory(new_user)
+        service = RenderJobService(db.session)
+        queued_at = datetime.now(timezone.utc) - timedelta(
+            seconds=test_app.config["PDF_RENDER_JOB_TIMEOUT"] + 1
+        )
+        job = PdfRenderJob(
+            built_resume_id=resume_id,
+            user_id=new_user.id,
+            cache_key="stale",
+            created_at=queued_at,
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        job = service.get_job(str(job.id), new_user.id)
+        assert job.status == PdfRenderJob.FAILED
+        assert job.error == RenderJobService.TIMED_OUT
+
+        output = tmp_path / f"{job.id.hex}.pdf"
+        output.write_bytes(b"%PDF")
+        expired = time.time() - test_app.config["PDF_RENDER_JOB_TTL"] - 1
+        os.utime(output, (expired, expired))
+        job.created_at = queued_at - timedelta(
+            seconds=test_app.config["PDF_RENDER_JOB_TTL"]
+        )
+        db.session.commit()
+
+        job_id = job.id
+        service.expire_jobs()
+        db.session.commit()
+        assert db.session.get(PdfRenderJob, job_id) is None
+        assert not output.exists()
@@ -0,0 +1,77 @@
+import dataclasses
+import uuid
+
+import pytest
+
+from resume_builder import db
+from resume_builder.instrumentation import QueryCounter
+from resume_builder.models import BuiltResume
+from resume_builder.resume_builder_core.exceptions import EntryNotFoundError
+from resume_builder.resume_builder_core.services import ResumeAssemblyService
+
+
+@pytest.mark.parametrize("entries_per_section", [1, 5])
+def test_load_for_render_uses_fixed_query_count(
+    test_app, new_user, resume_factory, entries_per_section
+):
+    """
+    GIVEN a resume linking N entries in every section
+    WHEN ResumeAssemblyService.load_for_render is called
+    THEN the whole graph should load in five queries regardless of N
+    """
+    with test_app.app_context():
+        resume_id = resume_factory(new_user, entries_per_section)
+        db.session.expunge_all()
+
+        with QueryCounter(db.engine) as counter:
+            resume = ResumeAssemblyService(db.session).load_for_render(
+                str(resume_id), new_user.id
+            )
+            assert resume.basic_info.full_name == "Test User"
+            assert resume.theme.styles == "body {}"
+            assert len(resume.experience) == entries_per_section
+            assert len(resume.languages) == entries_per_section
+
+        assert counter.count == 5
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            resume.entry_title = "changed"
+
+
+def test_load_for_render_rejects_other_users_and_bad_ids(test_app, new_user):
+    with test_app.app_context():
+        service = ResumeAssemblyService(db.session)
+        with pytest.raises(EntryNotFoundError):
+            service.load_for_render("not-a-uuid", new_user.id)
+        with pytest.raises(EntryNotFoundError):
+            service.load_for_render("0123456789abcdef0123456789abcdef", new_user.id)
+
+
+def test_version_changes_with_linked_entries(test_app, new_user, resume_factory):
+    """
+    GIVEN a resume linking two experiences
+    WHEN one experience is edited and then unlinked
+    THEN get_version should return a new stamp each time, in one query
+    """
+    with test_app.app_context():
+        resume_id = resume_factory(new_user, entries_per_section=2)
+        service = ResumeAssemblyService(db.session)
+
+        with QueryCounter(db.engine) as counter:
+            original = service.get_version(str(resume_id), new_user.id)
+        assert counter.count == 1
+        assert original.entry_title == "resume"
+        assert service.get_version(str(resume_id), new_user.id) == original
+
+        resume = db.session.get(BuiltResume, resume_id)
+        resume.experience[0].job_title = "Lead Developer"
+        db.session.commit()
+        edited = service.get_version(str(resume_id), new_user.id)
+        assert edited.stamp != original.stamp
+
+        resume.experience.pop()
+        db.session.commit()
+        unlinked = service.get_version(str(resume_id), new_user.id)
+        assert unlinked.stamp not in (original.stamp, edited.stamp)
+
+        with pytest.raises(EntryNotFoundError):
+            service.get_version(str(resume_id), uuid.uuid4())
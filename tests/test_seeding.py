@@ -0,0 +1,69 @@
+import uuid
+
+from sqlalchemy import func, select
+
+from resume_builder import db
+from resume_builder.models import BuiltResume, DailyStats, Experience, User
+from resume_builder.seeding import DatasetSeeder, SeedOptions
+
+
+def test_seed_generates_the_requested_dataset(test_app):
+    """
+    GIVEN seed options for 5 users in batches of 2
+    WHEN the dataset is seeded
+    THEN every table should get the requested number of rows, with rendered
+    markdown, linked resumes and daily stats, and loading the same seed
+    again should be refused
+    """
+    options = SeedOptions(users=5, experiences=2, resumes=2, seed=7, batch_size=2)
+    with test_app.app_context():
+        counts = DatasetSeeder(db.session, options).run()
+
+        assert counts["user"] == 5
+        assert counts["experience"] == 10
+        assert counts["built_resume"] == 10
+        assert counts["job_application"] == 25
+        assert 10 <= counts["built_resume_experience"] <= 20
+        assert all(
+            db.session.scalars(
+                select(Experience.description_html)
+                .join(User)
+                .where(User.username.startswith("seed7_"))
+            )
+        )
+        resume = db.session.scalars(select(BuiltResume)).first()
+        assert resume.experience and resume.basic_info.user_id == resume.user_id
+        assert db.session.scalar(select(func.sum(DailyStats.signups))) >= 5
+
+        try:
+            DatasetSeeder(db.session, options).run()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("seeding the same dataset twice succeeded")
+
+
+def test_seed_is_deterministic():
+    """
+    GIVEN two seeders with the same options
+    WHEN both generate the rows of a batch of users
+    THEN they should generate the same ids and contents
+    """
+    options = SeedOptions(users=3, seed=8)
+    theme_id = uuid.uuid4()
+
+    def generate():
+        rows = DatasetSeeder(None, options).generate_users(
+            range(3), "hash", [theme_id], [1]
+        )
+        return {
+            table.name: [
+                {key: value for key, value in row.items() if not key.endswith("_at")}
+                for row in table_rows
+            ]
+            for table, table_rows in rows.items()
+        }
+
+    first, second = generate(), generate()
+    assert first == second
+    assert len(first["built_resume"]) == 6
@@ -0,0 +1,71 @@
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from resume_builder.resume_builder_core.pdf_renderer import StylesheetCache
+from resume_builder.resume_builder_core.render_models import RenderTheme
+
+
+def make_theme(theme_id=None, updated_at=datetime(2025, 1, 1)):
+    return RenderTheme(
+        id=theme_id or uuid.uuid4(),
+        name="Plain",
+        styles="body { font-family: serif; }",
+        updated_at=updated_at,
+    )
+
+
+def test_stylesheet_is_compiled_once_per_theme_version():
+    """
+    GIVEN a stylesheet cache
+    WHEN the same theme version is requested twice and then a newer version
+    THEN the first two calls should share one compiled stylesheet and the
+         newer version should replace it
+    """
+    cache = StylesheetCache()
+    theme = make_theme()
+
+    css, font_config = cache.get(theme)
+    assert cache.get(theme) == (css, font_config)
+
+    edited = make_theme(theme.id, theme.updated_at + timedelta(minutes=1))
+    assert cache.get(edited)[0] is not css
+    assert len(cache) == 1
+
+
+def test_invalidate_drops_theme_and_size_is_bounded():
+    cache = StylesheetCache(max_entries=2)
+    themes = [make_theme() for _ in range(3)]
+    for theme in themes:
+        cache.get(theme)
+    assert len(cache) == 2
+
+    cache.invalidate(themes[-1].id)
+    assert len(cache) == 1
+
+
+def test_threads_compile_their_own_stylesheets():
+    """
+    GIVEN a stylesheet cache used from two threads
+    WHEN both request the same theme and one invalidates it
+    THEN each thread should get its own compiled stylesheet and both should
+         recompile after the invalidation
+    """
+    cache = StylesheetCache()
+    theme = make_theme()
+    css, _ = cache.get(theme)
+    compiled = {}
+
+    def compile_in_thread(name):
+        thread = threading.Thread(
+            target=lambda: compiled.setdefault(name, cache.get(theme)[0])
+        )
+        thread.start()
+        thread.join()
+
+    compile_in_thread("other")
+    assert compiled["other"] is not css
+    assert cache.get(theme)[0] is css
+
+    cache.invalidate(theme.id)
+    assert cache.get(theme)[0] is not css
@@ -0,0 +1,48 @@
+from resume_builder import db
+from resume_builder.caching import TTLCache
+from resume_builder.models import Language
+from resume_builder.resume_builder_core.services import UserStatsService
+
+
+def test_get_counts_returns_every_section(test_app, new_user):
+    """
+    GIVEN a user with one Language entry
+    WHEN UserStatsService.get_counts is called
+    THEN it should return a count for every section
+    """
+    with test_app.app_context():
+        db.session.add(
+            Language(entry_title="en", name="English", proficiency="C2", user_id=new_user.id)
+        )
+        db.session.commit()
+
+        counts = UserStatsService(db.session).get_counts(new_user.id)
+
+        assert set(counts) == set(UserStatsService.SECTIONS)
+        assert counts["language"] == 1
+        assert counts["experience"] == 0
+
+
+def test_cached_counts_are_invalidated_on_create(test_app, new_user):
+    """
+    GIVEN cached counts for a user
+    WHEN a new entry is committed for that user
+    THEN the next call should return fresh counts
+    """
+    with test_app.app_context():
+        stats_cache = TTLCache(ttl=60)
+        test_app.extensions["user_stats_cache"] = stats_cache
+        try:
+            service = UserStatsService(db.session, stats_cache)
+            assert service.get_counts(new_user.id)["language"] == 0
+            assert stats_cache.get(str(new_user.id)) is not None
+
+            db.session.add(
+                Language(entry_title="de", name="German", proficiency="B1", user_id=new_user.id)
+            )
+            db.session.commit()
+
+            assert stats_cache.get(str(new_user.id)) is None
+            assert service.get_counts(new_user.id)["language"] == 1
+        finally:
+            test_app.extensions["user_stats_cache"] = None